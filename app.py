@@ -5,9 +5,22 @@ from __future__ import annotations
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from tortoise import Tortoise, connections
-from core.database import DatabaseClient
+from core.database import DatabaseClient, create_read_client, get_tortoise_config
+from core.sharding import ShardManager
+from core.schema import prepare_schema
+from core.middleware import CompressionMiddleware
+from core.datastructures import SizedLRUCache
+from core.caching import CachedResponse, ResponseCacheMiddleware, handle_cached_response
+from core.reports import ReportExecutor
+from core.tasks import PeriodicTask
+from core.events import EventHub
+from core.autocomplete import Autocompleter
+from core.writer import WriteCoordinator
+from core.rates import ExchangeRates
+from core import config
 
 import contextlib
+import datetime
 import routers
 
 __all__ = (
@@ -17,20 +30,76 @@ __all__ = (
 @contextlib.asynccontextmanager
 async def lifespan(app: FastAPI):
     # pytest_running is injected in state by pytest_sessionstart hook in conftest
-    db = "db-test.sqlite3" if getattr(app.state, "pytest_running", False) else "db.sqlite3"
+    testing = getattr(app.state, "pytest_running", False)
+    db_url = config.TEST_DATABASE_URL if testing else config.DATABASE_URL
 
-    await Tortoise.init(db_url=f'sqlite://{db}', modules={'models': ['core.models']})  # type: ignore
-    await Tortoise.generate_schemas()
+    # Non-SQLite test databases are created and deleted by the
+    # pytest_sessionstart and pytest_sessionfinish hooks in conftest.
+    await Tortoise.init(config=get_tortoise_config(db_url))
+    await prepare_schema(connections.get("default"))
 
-    app.state.db = DatabaseClient()
+    # Tests always read from the test database.
+    read_url = "" if testing else config.DATABASE_READ_URL
+    shards = ShardManager.from_url(
+        db_url,
+        config.DATABASE_SHARDS,
+        config.DATABASE_SHARD_MAX_OPEN,
+        create_read_client(db_url, read_url),
+    )
+    app.state.db = DatabaseClient(shards, config.DATABASE_READ_AFTER_WRITE if read_url else 0)
+    app.state.events = EventHub(config.EVENTS_QUEUE_SIZE)
+    app.state.autocomplete = Autocompleter(config.AUTOCOMPLETE_CACHE_SIZE)
+    app.state.rates = ExchangeRates(config.BASE_CURRENCY)
+    await app.state.rates.load(shards.primary)
+    app.state.response_cache = SizedLRUCache[tuple, tuple[bytes, str | None]](config.RESPONSE_CACHE_MAX_SIZE)
+    app.state.reports = ReportExecutor(
+        max_workers=config.REPORTS_MAX_WORKERS,
+        timeout=config.REPORTS_TIMEOUT,
+        cache_size=config.REPORTS_CACHE_SIZE,
+    )
+
+    app.state.backup = None
+    app.state.backup_task = None
+
+    app.state.writer = WriteCoordinator(config.WRITE_BATCH_MAX_SIZE, config.WRITE_BATCH_DELAY / 1000)
+    if config.WRITE_BATCH_DELAY > 0:
+        app.state.writer.start()
+
+    prune_changes = PeriodicTask(
+        "prune-changes",
+        config.CHANGELOG_PRUNE_INTERVAL,
+        lambda: app.state.db.prune_changes(datetime.timedelta(days=config.CHANGELOG_RETENTION_DAYS)),
+    )
+    prune_changes.start()
+
+    async def materialize_recurring() -> None:
+        users = await app.state.db.materialize_recurring(batch_size=config.RECURRING_BATCH_SIZE)
+        for user_id in users:
+            app.state.autocomplete.discard(user_id)
+
+    recurring = PeriodicTask("materialize-recurring", config.RECURRING_INTERVAL, materialize_recurring)
+    recurring.start()
 
     yield
+    await recurring.stop()
+    await prune_changes.stop()
+
+    if app.state.backup_task is not None:
+        app.state.backup_task.cancel()
+
+    await app.state.writer.stop()
+    app.state.reports.close()
+    await shards.close()
     await connections.close_all()
 
 
 app = FastAPI(version="0.1.0", lifespan=lifespan)
+app.add_exception_handler(CachedResponse, handle_cached_response)
 origins = ["*"]
 
+# Middlewares added later wrap the previously added ones. The response
+# cache must be innermost so that uncompressed responses are cached.
+app.add_middleware(ResponseCacheMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -38,6 +107,13 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=config.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=config.COMPRESSION_GZIP_LEVEL,
+    zstd_level=config.COMPRESSION_ZSTD_LEVEL,
+    cache_size=config.COMPRESSION_CACHE_SIZE,
+)
 
 for router in routers.__include_routers__:
     app.include_router(router)
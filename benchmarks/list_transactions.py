@@ -0,0 +1,87 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+"""Benchmarks the per-row cost of the list transactions endpoint.
+
+Compares the validated path (hydrating Tortoise models, from_db_model and
+FastAPI validating and serializing the return annotation) against the
+trusted path used by list endpoints (DatabaseClient.fetch_transactions
+rendered with ORJSONResponse).
+
+Run using: python -m benchmarks.list_transactions [rows]
+"""
+
+from __future__ import annotations
+
+from pydantic import TypeAdapter
+from tortoise import Tortoise
+from core.database import DatabaseClient
+from core.responses import ORJSONResponse
+from core import schemas, models
+
+import asyncio
+import datetime
+import sys
+import time
+import uuid
+
+
+async def _populate(n: int) -> models.FinancialAccount:
+    user = models.User(id=uuid.uuid4(), username="benchmark", password=b"")
+    await user.save()
+
+    account = models.FinancialAccount(id=uuid.uuid4(), user=user, name="Bank", type=models.AccountType.CHECKING)
+    await account.save()
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    await models.Transaction.bulk_create([
+        models.Transaction(
+            id=uuid.uuid4(),
+            account_id=account.id,
+            user_id=user.id,
+            amount=(i % 500) - 250 or 1,
+            description=f"transaction {i}",
+            date=now - datetime.timedelta(hours=i),
+        )
+        for i in range(n)
+    ])
+
+    return account
+
+async def _measure(name: str, n: int, func) -> None:
+    timings = []
+
+    for _ in range(5):
+        start = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - start)
+
+    print(f"{name:>10}: {min(timings) / n * 1e6:8.2f} us/row ({n} rows)")
+
+async def _main(n: int) -> None:
+    await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["core.models"]})
+    await Tortoise.generate_schemas()
+
+    try:
+        account = await _populate(n)
+        db = DatabaseClient()
+        adapter = TypeAdapter(list[schemas.Transaction])
+
+        async def validated() -> bytes:
+            # Mirrors FastAPI's handling of a list[schemas.Transaction] return annotation.
+            rows = await models.Transaction.filter(account=account).limit(n).order_by("-date")
+            data = [schemas.Transaction.from_db_model(t, account) for t in rows]
+            return adapter.dump_json(adapter.validate_python(data))
+
+        async def trusted() -> bytes:
+            rows = await db.fetch_transactions(account.id, limit=n)
+            return ORJSONResponse(rows).body
+
+        assert adapter.validate_json(await validated()) == adapter.validate_json(await trusted())
+
+        await _measure("validated", n, validated)
+        await _measure("trusted", n, trusted)
+    finally:
+        await Tortoise.close_connections()
+
+if __name__ == "__main__":
+    asyncio.run(_main(int(sys.argv[1]) if len(sys.argv) > 1 else 40))
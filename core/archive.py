@@ -0,0 +1,117 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.transactions import in_transaction
+from core import models
+
+import datetime
+import os
+
+__all__ = (
+    "archive_path",
+    "archive_transactions",
+    "update_archive",
+)
+
+
+def archive_path(db_path: str) -> str:
+    """Returns the path of the archive database of the given SQLite database.
+
+    The archive is stored alongside the database e.g. ``db-archive.sqlite3``
+    for ``db.sqlite3``.
+    """
+    stem, ext = os.path.splitext(db_path)
+    return f"{stem}-archive{ext}"
+
+async def _prepare_archive(client: BaseDBAsyncClient) -> None:
+    # The archived transactions are stored in a table with the same name
+    # and columns as the transactions table so that the same queries can
+    # be run on the archive. It has no constraints as the accounts and
+    # users it would refer to are not in the archive database.
+    table = models.Transaction._meta.db_table
+    _, rows = await client.execute_query(f'PRAGMA archive.table_info("{table}")')
+
+    if not rows:
+        await client.execute_script(f"""
+        CREATE TABLE archive."{table}" AS SELECT * FROM main."{table}" WHERE 0;
+        CREATE INDEX archive."{table}_account_date" ON "{table}" ("account_id", "date", "id");
+        CREATE INDEX archive."{table}_user_date" ON "{table}" ("user_id", "date", "id");
+        """)
+        return
+
+    # Add the columns added to transactions since the archive was created.
+    archived = {row["name"] for row in rows}
+    _, rows = await client.execute_query(f'PRAGMA main.table_info("{table}")')
+
+    for row in rows:
+        if row["name"] not in archived:
+            await client.execute_script(f'ALTER TABLE archive."{table}" ADD COLUMN "{row["name"]}" {row["type"]}')
+
+async def update_archive(client: BaseDBAsyncClient) -> None:
+    """Adds the columns added to transactions since the archive of the given database was created.
+
+    Nothing is done if the database has no archive or is not SQLite.
+    """
+    if client.capabilities.dialect != "sqlite" or not os.path.exists(archive_path(client.filename)):  # type: ignore
+        return
+
+    await client.execute_query("ATTACH DATABASE ? AS archive", [archive_path(client.filename)])  # type: ignore
+
+    try:
+        await _prepare_archive(client)
+    finally:
+        await client.execute_query("DETACH DATABASE archive")
+
+async def archive_transactions(client: BaseDBAsyncClient, before: datetime.datetime) -> int:
+    """Moves the transactions dated before the given time to the archive database.
+
+    The archive is a separate SQLite database (see :func:`archive_path`)
+    that is attached while the transactions are moved. The balance
+    checkpoints of accounts (see core.models.BalanceCheckpoint) are
+    updated in the same transaction so that the balances and the reads
+    spanning the archive remain correct.
+
+    The archived transactions of accounts without a checkpoint e.g. the
+    deleted accounts are also removed from the archive. The given client must be the default connection in
+    current context.
+
+    Returns the number of archived transactions.
+    """
+    if client.capabilities.dialect != "sqlite":
+        raise ValueError("Archival is only supported with SQLite")
+
+    table = models.Transaction._meta.db_table
+    checkpoints = models.BalanceCheckpoint._meta.db_table
+    columns = ", ".join(f'"{c}"' for c in models.Transaction._meta.fields_db_projection.values())
+
+    # Databases cannot be attached inside a transaction.
+    await client.execute_query("ATTACH DATABASE ? AS archive", [archive_path(client.filename)])  # type: ignore
+
+    try:
+        await client.execute_script("PRAGMA archive.journal_mode = WAL")
+
+        async with in_transaction() as conn:
+            await _prepare_archive(conn)
+            # The checkpoints are deleted along with the accounts and when
+            # users are moved to other shards (see DatabaseClient.move_user).
+            await conn.execute_query(
+                f'DELETE FROM archive."{table}" WHERE "account_id" NOT IN (SELECT "account_id" FROM main."{checkpoints}")'
+            )
+            await conn.execute_query(
+                f'INSERT INTO "{checkpoints}" ("account_id", "date", "balance", "count") '
+                f'SELECT "account_id", ?, SUM("amount"), COUNT(*) FROM main."{table}" WHERE "date" < ? GROUP BY "account_id" '
+                f'ON CONFLICT ("account_id") DO UPDATE SET "date" = MAX("date", excluded."date"), '
+                f'"balance" = "balance" + excluded."balance", "count" = "count" + excluded."count"',
+                [before, before],
+            )
+            count, _ = await conn.execute_query(
+                f'INSERT INTO archive."{table}" ({columns}) SELECT {columns} FROM main."{table}" WHERE "date" < ?',
+                [before],
+            )
+            await conn.execute_query(f'DELETE FROM main."{table}" WHERE "date" < ?', [before])
+    finally:
+        await client.execute_query("DETACH DATABASE archive")
+
+    return count
@@ -0,0 +1,169 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Awaitable, Callable, Iterable
+from core.datastructures import SizedLRUCache
+
+import bisect
+import heapq
+import uuid
+
+__all__ = (
+    "PrefixIndex",
+    "Autocompleter",
+)
+
+# The approximate memory used by each entry of prefix index besides
+# the description itself, in bytes. Used for sizing the cache.
+_ENTRY_OVERHEAD = 160
+
+
+class PrefixIndex:
+    """Index of distinct descriptions for looking them up by prefix.
+
+    The descriptions are matched case insensitively. Each description
+    has a count (e.g. the number of transactions having it) and the
+    suggestions for a prefix are the matching descriptions with the
+    highest counts.
+
+    The keys of descriptions are kept in a sorted array so that the
+    descriptions with a prefix are found using binary search.
+    """
+
+    __slots__ = (
+        "_keys",
+        "_descriptions",
+        "_counts",
+        "_size",
+    )
+
+    def __init__(self) -> None:
+        self._keys: list[str] = []
+        self._descriptions: dict[str, str] = {}
+        self._counts: dict[str, int] = {}
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """The approximate memory used by the index, in bytes."""
+        return self._size
+
+    def add(self, description: str, count: int = 1) -> None:
+        """Adds the given number of occurrences of a description."""
+        key = description.casefold()
+
+        if key not in self._counts:
+            bisect.insort(self._keys, key)
+            self._descriptions[key] = description
+            self._counts[key] = 0
+            self._size += len(key) + len(description) + _ENTRY_OVERHEAD
+
+        self._counts[key] += count
+
+    def remove(self, description: str) -> None:
+        """Removes an occurrence of a description."""
+        key = description.casefold()
+        count = self._counts.get(key)
+
+        if count is None:
+            return
+        if count > 1:
+            self._counts[key] = count - 1
+            return
+
+        del self._counts[key]
+        del self._keys[bisect.bisect_left(self._keys, key)]
+        self._size -= len(key) + len(self._descriptions.pop(key)) + _ENTRY_OVERHEAD
+
+    def suggest(self, prefix: str, limit: int) -> list[tuple[str, int]]:
+        """Returns the most frequent descriptions starting with the given prefix.
+
+        The suggestions are returned as (description, count) tuples.
+        """
+        prefix = prefix.casefold()
+        start = bisect.bisect_left(self._keys, prefix)
+        end = bisect.bisect_left(self._keys, prefix + "\U0010ffff", start)
+        keys = heapq.nsmallest(limit, self._keys[start:end], key=lambda k: (-self._counts[k], k))
+
+        return [(self._descriptions[key], self._counts[key]) for key in keys]
+
+
+class Autocompleter:
+    """Suggests transaction descriptions to users as they type.
+
+    A :class:`PrefixIndex` of the user's transaction descriptions is built
+    on the first request and kept up to date by the write routes. Indexes
+    are kept in a LRU cache bounded by their total approximate size.
+
+    Parameters
+    ----------
+    max_size: :class:`int`
+        The maximum total size, in bytes, of indexes kept in memory.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._cache = SizedLRUCache[uuid.UUID, PrefixIndex](max_size)
+
+        # The users whose index is being built. The index is not cached
+        # if it was changed while being built as it may be missing that
+        # change.
+        self._building: dict[uuid.UUID, bool] = {}
+
+    async def suggest(
+        self,
+        user_id: uuid.UUID,
+        prefix: str,
+        limit: int,
+        load: Callable[[], Awaitable[Iterable[tuple[str, int]]]],
+    ) -> list[tuple[str, int]]:
+        """Returns the suggestions for the given prefix.
+
+        If the user's index is not cached, ``load`` is called to build it.
+        It must return the user's distinct descriptions along with the
+        number of their transactions.
+        """
+        index = self._cache.get(user_id)
+
+        if index is None:
+            self._building.setdefault(user_id, False)
+
+            try:
+                index = PrefixIndex()
+                for description, count in await load():
+                    index.add(description, count)
+            except BaseException:
+                self._building.pop(user_id, None)
+                raise
+
+            if not self._building.pop(user_id, True):
+                self._cache.insert(user_id, index, index.size)
+
+        return index.suggest(prefix, limit)
+
+    def _update(self, user_id: uuid.UUID) -> PrefixIndex | None:
+        if user_id in self._building:
+            self._building[user_id] = True
+
+        return self._cache.get(user_id)
+
+    def add(self, user_id: uuid.UUID, description: str | None) -> None:
+        """Adds a description of a transaction logged by the user."""
+        index = self._update(user_id)
+
+        if index is not None and description:
+            index.add(description)
+            self._cache.insert(user_id, index, index.size)
+
+    def remove(self, user_id: uuid.UUID, description: str | None) -> None:
+        """Removes a description of a transaction deleted by the user."""
+        index = self._update(user_id)
+
+        if index is not None and description:
+            index.remove(description)
+            self._cache.insert(user_id, index, index.size)
+
+    def discard(self, user_id: uuid.UUID) -> None:
+        """Discards the index of the given user e.g. after many descriptions are removed at once."""
+        self._update(user_id)
+        self._cache.delete(user_id)
@@ -0,0 +1,249 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Any
+from core.sharding import shard_path
+from core.archive import archive_path
+
+import asyncio
+import contextlib
+import datetime
+import gzip
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+
+__all__ = (
+    "BackupProgress",
+    "database_paths",
+    "run_backup",
+    "verify_backup",
+)
+
+# The number of times a file's backup may restart because of the writes
+# to it before it is copied in a single step instead.
+_MAX_RESTARTS = 3
+
+# The size of chunks in which the backups are compressed, in bytes.
+_CHUNK_SIZE = 1024 * 1024
+
+
+class _Restarted(Exception):
+    pass
+
+
+class BackupProgress:
+    """The progress of a backup started by :func:`run_backup`.
+
+    The attributes are updated while the backup runs and can be read
+    at any time e.g. to report the progress.
+    """
+
+    __slots__ = (
+        "files",
+        "files_done",
+        "pages_total",
+        "pages_copied",
+        "restarts",
+        "bytes_written",
+        "verified",
+        "started_at",
+        "finished_at",
+        "error",
+    )
+
+    def __init__(self, files: list[str]) -> None:
+        self.files = files
+        """The paths of databases being backed up."""
+
+        self.files_done = 0
+        """The number of databases that are completely backed up."""
+
+        self.pages_total = 0
+        """The number of pages in the database currently being backed up."""
+
+        self.pages_copied = 0
+        """The number of pages of the current database copied so far."""
+
+        self.restarts = 0
+        """The number of times the backups restarted because of concurrent writes."""
+
+        self.bytes_written = 0
+        """The total size of backup files written so far, in bytes."""
+
+        self.verified: bool | None = None
+        """Whether the backups passed the verification. None if not verified."""
+
+        self.started_at = datetime.datetime.now(datetime.timezone.utc)
+        """The time when the backup was started."""
+
+        self.finished_at: datetime.datetime | None = None
+        """The time when the backup finished or failed."""
+
+        self.error: str | None = None
+        """The error that the backup failed with, if any."""
+
+    @property
+    def running(self) -> bool:
+        """Whether the backup is still running."""
+        return self.finished_at is None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the progress as dictionary in the format of core.schemas.BackupStatus."""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["running"] = self.running
+        return data
+
+
+def database_paths(primary_path: str, shards: int) -> list[str]:
+    """Returns the paths of all existing SQLite databases of the given primary database.
+
+    These are the shards (see core.sharding) and their archives (see
+    core.archive).
+    """
+    paths = []
+
+    for shard in range(shards):
+        path = shard_path(primary_path, shard)
+        paths.extend(p for p in (path, archive_path(path)) if os.path.exists(p))
+
+    return paths
+
+def _copy(source: str, target: str, progress: BackupProgress, pages: int, delay: float) -> None:
+    # Copies the database using SQLite's online backup API. The pages are
+    # copied in small steps, each holding a read lock on the database only
+    # while it runs, so that the writers are not held up.
+    last = restarts = 0
+
+    def step(status: int, remaining: int, total: int) -> None:
+        nonlocal last, restarts
+        copied = total - remaining
+        progress.pages_total = total
+        progress.pages_copied = copied
+
+        # The backup restarts from the first page if the database is
+        # written by another connection between the steps. Nothing is
+        # copied by the steps that found the database locked.
+        if status == sqlite3.SQLITE_OK and copied <= last:
+            restarts += 1
+            progress.restarts += 1
+            if restarts > _MAX_RESTARTS:
+                raise _Restarted
+
+        last = copied
+
+        if remaining:
+            time.sleep(delay)
+
+    with contextlib.closing(sqlite3.connect(source)) as src, contextlib.closing(sqlite3.connect(target)) as dst:
+        try:
+            src.backup(dst, pages=pages, progress=step)
+        except _Restarted:
+            # For a frequently written database, the database is copied
+            # in one step. In WAL mode, this only holds a snapshot of the
+            # database and the writers continue.
+            src.backup(dst, pages=-1)
+            progress.pages_copied = progress.pages_total = dst.execute("PRAGMA page_count").fetchone()[0]
+
+def _compress(source: str, target: str) -> None:
+    with open(source, "rb") as src, gzip.open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst, _CHUNK_SIZE)
+
+def _backup_file(source: str, target: str, progress: BackupProgress, compress: bool, pages: int, delay: float) -> None:
+    # The backup is written to a temporary file first so that a failed
+    # backup does not leave behind an incomplete file at the target.
+    temp = f"{target}.tmp"
+
+    try:
+        _copy(source, temp, progress, pages, delay)
+
+        if compress:
+            _compress(temp, temp + ".gz")
+            os.remove(temp)
+            temp += ".gz"
+
+        progress.bytes_written += os.path.getsize(temp)
+        os.replace(temp, target)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+def verify_backup(path: str) -> str | None:
+    """Verifies that the given backup can be restored.
+
+    The backup (decompressed, if its name ends with ``.gz``) is restored
+    to a temporary file and checked for integrity. Returns the problems
+    found or None if the backup is intact.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        if path.endswith(".gz"):
+            restored = os.path.join(directory, "restored.sqlite3")
+            try:
+                with gzip.open(path, "rb") as src, open(restored, "wb") as dst:
+                    shutil.copyfileobj(src, dst, _CHUNK_SIZE)
+            except (OSError, EOFError) as e:
+                return f"decompression failed: {e}"
+        else:
+            restored = path
+
+        try:
+            with contextlib.closing(sqlite3.connect(f"file:{restored}?mode=ro", uri=True)) as conn:
+                rows = conn.execute("PRAGMA integrity_check").fetchall()
+        except sqlite3.DatabaseError as e:
+            return str(e)
+
+    result = ", ".join(str(row[0]) for row in rows)
+    return None if result == "ok" else result
+
+async def run_backup(
+    progress: BackupProgress,
+    directory: str,
+    *,
+    compress: bool = False,
+    verify: bool = False,
+    pages: int = 256,
+    delay: float = 0.01,
+) -> BackupProgress:
+    """Backs up the databases of the given progress to the given directory.
+
+    The databases are backed up one by one using SQLite's online backup
+    API, while the server keeps running. Each database is copied in steps
+    of ``pages`` pages with a pause of ``delay`` seconds between steps
+    so that the writes are not delayed. The copying is done in a worker
+    thread and does not block the event loop.
+
+    The backups have the same names as the databases, with ``.gz`` suffix
+    if ``compress`` is True. If ``verify`` is True, each backup is then
+    restored to a temporary file and checked for integrity.
+
+    The given progress is updated as the backup runs and returned once
+    it finishes. Errors are recorded in the progress and raised.
+    """
+    try:
+        os.makedirs(directory, exist_ok=True)
+
+        for source in progress.files:
+            target = os.path.join(directory, os.path.basename(source) + (".gz" if compress else ""))
+            await asyncio.to_thread(_backup_file, source, target, progress, compress, pages, delay)
+
+            if verify:
+                error = await asyncio.to_thread(verify_backup, target)
+                if error is not None:
+                    raise ValueError(f"Backup of {source} failed verification: {error}")
+
+            progress.files_done += 1
+
+        if verify:
+            progress.verified = True
+    except BaseException as e:
+        progress.error = str(e) or type(e).__name__
+        if verify:
+            progress.verified = False
+        raise
+    finally:
+        progress.finished_at = datetime.datetime.now(datetime.timezone.utc)
+
+    return progress
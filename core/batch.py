@@ -0,0 +1,180 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+from core.responses import dumps
+
+import asyncio
+import uuid
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Scope
+    from core import models
+
+__all__ = (
+    "BatchContext",
+    "SubResponse",
+    "dispatch",
+)
+
+
+class BatchContext:
+    """State shared by the sub-requests of a batch request.
+
+    The context is attached to the state of each sub-request in the
+    ``batch`` attribute. The user is authorized once for the batch
+    request and the sub-requests skip the authorization (see
+    core.deps.require_auth()).
+
+    The accounts fetched by a sub-request are also kept in the context
+    so that the later sub-requests do not fetch them again.
+    """
+
+    __slots__ = (
+        "user",
+        "token",
+        "accounts",
+    )
+
+    def __init__(self, user: models.User, token: str) -> None:
+        self.user = user
+        self.token = token
+        self.accounts: dict[uuid.UUID, models.FinancialAccount] = {}
+
+
+class SubResponse:
+    """The response of a sub-request."""
+
+    __slots__ = (
+        "status",
+        "body",
+    )
+
+    def __init__(self, status: int, body: bytes) -> None:
+        self.status = status
+        self.body = body
+        """The response body as JSON."""
+
+
+async def _call(app: ASGIApp, scope: Scope, body: bytes) -> tuple[SubResponse, str | None]:
+    status = 500
+    chunks: list[bytes] = []
+    content_type = ""
+    location = None
+    received = False
+
+    async def receive() -> Message:
+        nonlocal received
+
+        if received:
+            return {"type": "http.disconnect"}
+
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status, content_type, location
+
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            for name, value in message["headers"]:
+                if name == b"content-type":
+                    content_type = value.decode("latin-1")
+                elif name == b"location":
+                    location = value.decode("latin-1")
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        # The error is already logged and (if possible) a 500 response
+        # is sent by the application's error handling middleware.
+        status = 500
+
+    data = b"".join(chunks)
+
+    if not data:
+        data = b"null"
+    elif not content_type.startswith("application/json"):
+        data = dumps(data.decode("utf-8", "replace"))
+
+    return SubResponse(status, data), location
+
+async def _execute(app: ASGIApp, scope: Scope, body: bytes) -> SubResponse:
+    response, location = await _call(app, scope, body)
+
+    # Paths without (or with) trailing slash are redirected by the
+    # router. The redirect is followed as a client would.
+    if response.status in (307, 308) and location is not None:
+        url = urlsplit(location)
+        scope = {**scope, "path": url.path, "raw_path": url.path.encode(), "query_string": url.query.encode()}
+        response, _ = await _call(app, scope, body)
+
+    return response
+
+def _make_scope(parent: Scope, context: BatchContext, method: str, path: str, has_body: bool) -> Scope:
+    path, _, query = path.partition("?")
+    headers = [
+        (b"x-user-id", str(context.user.id).encode()),
+        (b"x-user-token", context.token.encode()),
+    ]
+
+    if has_body:
+        headers.append((b"content-type", b"application/json"))
+
+    return {
+        "type": "http",
+        "asgi": parent.get("asgi", {"version": "3.0"}),
+        "http_version": parent.get("http_version", "1.1"),
+        "method": method,
+        "scheme": parent["scheme"],
+        "server": parent.get("server"),
+        "client": parent.get("client"),
+        "root_path": parent.get("root_path", ""),
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": headers,
+        "state": {"batch": context},
+    }
+
+async def dispatch(
+    app: ASGIApp,
+    parent: Scope,
+    context: BatchContext,
+    requests: list[tuple[str, str, Any]],
+) -> list[SubResponse]:
+    """Dispatches the sub-requests of a batch request to the given application.
+
+    ``requests`` is a list of (method, path, body) tuples. The path
+    may include a query string. Body, if not None, is sent as JSON.
+
+    Consecutive GET sub-requests are executed concurrently. Other
+    sub-requests are executed one at a time in the given order, after
+    the sub-requests before them have completed.
+
+    The responses are returned in the order of the sub-requests.
+    """
+    responses: list[SubResponse] = []
+    reads: list[Scope] = []
+
+    async def flush_reads() -> None:
+        if reads:
+            responses.extend(await asyncio.gather(*(_execute(app, scope, b"") for scope in reads)))
+            reads.clear()
+
+    for method, path, body in requests:
+        scope = _make_scope(parent, context, method, path, body is not None)
+
+        if method == "GET":
+            reads.append(scope)
+            continue
+
+        await flush_reads()
+        responses.append(await _execute(app, scope, b"" if body is None else dumps(body)))
+
+    await flush_reads()
+    return responses
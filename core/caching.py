@@ -0,0 +1,176 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+from fastapi import Depends, HTTPException, Request, Response
+from starlette.datastructures import Headers
+from core.deps import require_auth
+from core import config
+
+import hashlib
+import uuid
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+__all__ = (
+    "ConditionalGet",
+    "CachedResponse",
+    "ResponseCacheMiddleware",
+    "handle_cached_response",
+)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # Uses weak comparison as the ETags are weak (compression may
+    # alter the exact representation of response). The wildcard is not
+    # matched as the resource's existence is not checked before the route.
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+class CachedResponse(Exception):
+    """Raised by :class:`ConditionalGet` when the response is found in server-side cache.
+
+    This exception is handled by handle_cached_response() which
+    sends the cached response.
+    """
+
+    def __init__(self, body: bytes, media_type: str | None, etag: str) -> None:
+        self.body = body
+        self.media_type = media_type
+        self.etag = etag
+
+
+async def handle_cached_response(request: Request, exc: Exception) -> Response:
+    """Exception handler for :class:`CachedResponse`."""
+    assert isinstance(exc, CachedResponse)
+    return Response(exc.body, media_type=exc.media_type, headers={"ETag": exc.etag})
+
+
+class ResponseCacheMiddleware:
+    """ASGI middleware that stores the responses in server-side cache.
+
+    Only the responses to requests for which :class:`ConditionalGet` has
+    set the ``response_cache_key`` in request state are cached. The
+    response is cached if it is successful and not streamed.
+
+    The responses are stored in the ``response_cache`` of app's state
+    which must be a :class:`core.datastructures.SizedLRUCache`.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message
+
+            if message["type"] == "http.response.start":
+                start_message = message
+            elif (
+                message["type"] == "http.response.body"
+                and start_message is not None
+                and start_message["status"] == 200
+                and not message.get("more_body", False)
+            ):
+                key = scope.get("state", {}).get("response_cache_key")
+                if key is not None:
+                    body: bytes = message.get("body", b"")
+                    media_type = Headers(raw=start_message["headers"]).get("content-type")
+                    scope["app"].state.response_cache.insert(key, (body, media_type), len(body))
+
+                start_message = None
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class ConditionalGet:
+    """FastAPI dependency for handling conditional GET requests.
+
+    This dependency computes the ETag of requested resource from
+    the data version (see DatabaseClient.get_version()) of either
+    the requesting user or the account in ``account_id`` path
+    parameter.
+
+    If the request's If-None-Match header matches the ETag, 304 Not
+    Modified is returned without executing the route. Otherwise the
+    ETag is added to the response headers and returned.
+
+    The responses are also cached on server side by the requesting user,
+    path, query string and the data version (see :class:`ResponseCacheMiddleware`).
+    If the response is cached, it is sent without executing the route.
+
+    Routes that return a Response directly must include the returned
+    ETag in the response headers themselves.
+
+    Parameters
+    ----------
+    scope: Literal["user", "account"]
+        Whether the resource is versioned by the user or the account.
+    """
+
+    def __init__(self, scope: Literal["user", "account"]) -> None:
+        self.scope = scope
+
+    async def get_version(self, request: Request) -> tuple[uuid.UUID, int] | None:
+        """Gets the versioned key and its data version for the given request.
+
+        None is returned if the request does not point to a valid
+        account for "account" scope.
+        """
+        db = request.app.state.db
+
+        if self.scope == "user":
+            key = request.state.user.id
+        else:
+            try:
+                key = uuid.UUID(request.path_params["account_id"])
+            except (KeyError, ValueError):
+                return None
+
+        return key, await db.get_version(key, using_db=db.reader(request.state.user.id))
+
+    def compute_etag(self, request: Request, key: uuid.UUID, version: int) -> str:
+        """Computes the ETag for the given request from the given key and its version."""
+        # User ID is part of ETag so that ETags of an account are not
+        # valid for users other than its owner. The ETags are keyed so
+        # that they cannot be computed from the (guessable) versions.
+        digest = hashlib.blake2b(
+            f"{request.state.user.id}:{key}:{version}".encode(),
+            digest_size=12,
+            key=hashlib.sha256(config.ENCRYPTION_KEY.encode()).digest(),
+        )
+        return f'W/"{digest.hexdigest()}"'
+
+    async def __call__(self, request: Request, response: Response, _: None = Depends(require_auth)) -> str | None:
+        versioned = await self.get_version(request)
+
+        if versioned is None:
+            return None
+
+        key, version = versioned
+        etag = self.compute_etag(request, key, version)
+        if_none_match = request.headers.get("if-none-match")
+
+        if if_none_match and _etag_matches(if_none_match, etag):
+            raise HTTPException(304, headers={"ETag": etag})
+
+        cache_key = (request.state.user.id, request.url.path, request.url.query, key, version)
+        cached = request.app.state.response_cache.get(cache_key)
+
+        if cached is not None:
+            raise CachedResponse(*cached, etag=etag)
+
+        request.state.response_cache_key = cache_key
+        response.headers["ETag"] = etag
+        return etag
@@ -2,15 +2,197 @@
 
 from __future__ import annotations
 
+from typing import Any, AsyncIterator, Iterable, Sequence
+from tortoise import connections
+from tortoise.queryset import ValuesListQuery, UpdateQuery, DeleteQuery
+from tortoise.backends.base.config_generator import expand_db_url
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.backends.sqlite import SqliteClient
+from tortoise.transactions import in_transaction
+from tortoise.functions import Count, Max, Sum
+from tortoise.expressions import Q
 from core.datastructures import LRUCache
-from core import models, config
+from core.sharding import ShardManager
+from core.search import SEARCH_TABLE, to_match_query
+from core.recurrence import iter_occurrences, next_occurrence
+from core import models, schemas, config
 
+import contextlib
+import datetime
+import heapq
+import importlib
+import itertools
+import time
 import uuid
 
 __all__ = (
     "DatabaseClient",
+    "get_tortoise_config",
+    "create_read_client",
+    "month_of",
 )
 
+# The key of PostgreSQL advisory lock taken by the change log insertions.
+_CHANGE_LOG_LOCK = 0x6275_6A65
+
+# The columns of transactions read by the queries returning transactions
+# in the format of core.schemas.Transaction (see _transaction_row()).
+_TRANSACTION_COLUMNS = ("id", "account_id", "amount", "description", "date", "category_id")
+
+
+def _expand_db_url(db_url: str) -> dict[str, Any]:
+    # Expands the URL and adds the connection pool settings (PostgreSQL only).
+    connection = expand_db_url(db_url)
+
+    if connection["engine"] != "tortoise.backends.sqlite":
+        credentials = connection["credentials"]
+        credentials["minsize"] = config.DATABASE_POOL_MIN_SIZE
+        credentials["maxsize"] = config.DATABASE_POOL_MAX_SIZE
+        if config.DATABASE_STATEMENT_TIMEOUT:
+            credentials.setdefault("server_settings", {})["statement_timeout"] = str(config.DATABASE_STATEMENT_TIMEOUT)
+
+    return connection
+
+def get_tortoise_config(db_url: str) -> dict[str, Any]:
+    """Returns the Tortoise ORM configuration for the given database URL.
+
+    For PostgreSQL, the connection pool size and statement timeout
+    are set from the configuration.
+    """
+    return {
+        "connections": {
+            "default": _expand_db_url(db_url),
+        },
+        "apps": {
+            "models": {
+                "models": ["core.models"],
+                "default_connection": "default",
+            },
+        },
+        "routers": ["core.sharding.ShardRouter"],
+    }
+
+
+def create_read_client(db_url: str, read_url: str = "") -> BaseDBAsyncClient | None:
+    """Creates the client used for read-only queries (see DatabaseClient.reader()).
+
+    If ``read_url`` is provided, the client connects to it (e.g. a PostgreSQL
+    replica). Otherwise, for SQLite, the client is a separate read-only
+    connection to the database at ``db_url``. In WAL mode, it reads the
+    committed data without waiting for the writes on the main connection.
+
+    For other databases without ``read_url``, None is returned i.e. the
+    reads are done on the main connection.
+
+    The client connects lazily on its first query.
+    """
+    if read_url:
+        connection = _expand_db_url(read_url)
+        client_class = importlib.import_module(connection["engine"]).client_class
+        return client_class(connection_name="read", **connection["credentials"])
+
+    if db_url.startswith("sqlite://"):
+        return SqliteClient(db_url.removeprefix("sqlite://"), connection_name="read", query_only="ON")
+
+    return None
+
+
+async def _fetch_rows(query: ValuesListQuery[Any]) -> list[Any]:
+    # Executes the query as values_list() would but returns the raw rows
+    # skipping the conversion of every value to its Python type. This is
+    # only done for SQLite, other backends already return Python types.
+    #
+    # Tortoise has no public API to execute a query with its parameters
+    # and get the raw rows so its internals are used. The supported
+    # versions of Tortoise are pinned in requirements.txt and
+    # tests/test_database.py fails if these internals change.
+    query._choose_db_if_not_chosen()
+
+    if query._db.capabilities.dialect != "sqlite":
+        return await query
+
+    query._make_query()
+    _, rows = await query._db.execute_query(*query.query.get_parameterized_sql())
+    return rows
+
+async def _execute_returning(query: UpdateQuery | DeleteQuery, *columns: str) -> list[dict[str, Any]]:
+    # Executes the UPDATE or DELETE query returning the given columns of
+    # the affected rows. Tortoise does not support RETURNING clause but
+    # both SQLite and PostgreSQL do so it is added to the query here.
+    #
+    # The clause can only be added through the internals of Tortoise. Like
+    # _fetch_rows(), tests/test_database.py fails if these internals change.
+    query._choose_db_if_not_chosen(True)
+    query._make_query()
+    query.query = query.query.returning(*columns)  # type: ignore
+    return await query._db.execute_query_dict(*query.query.get_parameterized_sql())
+
+def month_of(date: datetime.datetime) -> int:
+    """Returns the month of the given time in YYYYMM format (in UTC) as used by category rollups."""
+    date = date.astimezone(datetime.timezone.utc)
+    return date.year * 100 + date.month
+
+async def _lock_change_log(client: BaseDBAsyncClient) -> None:
+    # The sequence numbers of PostgreSQL are allocated on insert and the
+    # transactions may commit out of their order. A client synchronizing
+    # in between would skip the entries committed later. The insertions
+    # are serialized until commit so the entries are committed in order
+    # of their sequence numbers. SQLite serializes all writes anyway.
+    if client.capabilities.dialect == "postgres":
+        await client.execute_query("SELECT pg_advisory_xact_lock($1)", [_CHANGE_LOG_LOCK])
+
+async def _add_to_rollup(
+    client: BaseDBAsyncClient,
+    account_id: uuid.UUID | str,
+    category_id: uuid.UUID | str,
+    month: int,
+    income: int,
+    expenses: int,
+    count: int,
+) -> None:
+    # Adds the given totals to the rollup creating it if it does not exist.
+    values: list[Any] = [account_id, category_id, month, income, expenses, count]
+
+    if client.capabilities.dialect == "sqlite":
+        values[:2] = map(str, values[:2])
+        placeholders = ", ".join("?" * len(values))
+    else:
+        placeholders = ", ".join(f"${i}" for i in range(1, len(values) + 1))
+
+    table = models.CategoryRollup._meta.db_table
+    await client.execute_query(
+        f'INSERT INTO "{table}" ("account_id", "category_id", "month", "income", "expenses", "count") '
+        f'VALUES ({placeholders}) ON CONFLICT ("account_id", "category_id", "month") DO UPDATE SET '
+        f'"income" = "{table}"."income" + excluded."income", '
+        f'"expenses" = "{table}"."expenses" + excluded."expenses", '
+        f'"count" = "{table}"."count" + excluded."count"',
+        values,
+    )
+
+def _merge_transactions(
+    transactions: list[dict[str, Any]],
+    archived: list[dict[str, Any]],
+    ascending: bool,
+    limit: int,
+) -> list[dict[str, Any]]:
+    # Merges the transactions read from the database and its archive, both
+    # in order of date and ID, into a single page.
+    merged = heapq.merge(transactions, archived, key=lambda t: (t["date"], t["id"]), reverse=not ascending)
+    return list(itertools.islice(merged, limit))
+
+def _to_datetime(value: str | datetime.datetime) -> datetime.datetime:
+    # SQLite returns datetimes in ISO format as stored by Tortoise.
+    if isinstance(value, str):
+        return datetime.datetime.fromisoformat(value)
+    return value
+
+def _transaction_row(row: Sequence[Any]) -> dict[str, Any]:
+    # Maps a row starting with the values of _TRANSACTION_COLUMNS to a
+    # dictionary in the format of core.schemas.Transaction.
+    transaction = dict(zip(_TRANSACTION_COLUMNS, row))
+    transaction["date"] = _to_datetime(transaction["date"])
+    return transaction
+
 
 class DatabaseClient:
     """The database client.
@@ -23,8 +205,82 @@ class DatabaseClient:
     for operations that require some form of pre/post processing e.g. caching.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, shards: ShardManager | None = None, read_after_write: float = 0) -> None:
         self._users_cache = LRUCache[uuid.UUID, models.User](config.CACHE_MAX_USERS)
+        self._assignments_cache = LRUCache[uuid.UUID, tuple[int, int]](config.CACHE_MAX_USERS)
+        self._written_at = LRUCache[uuid.UUID, float](config.CACHE_MAX_USERS)
+
+        if shards is None:
+            shards = ShardManager(connections.get("default"), "", 1, 0)
+
+        self.shards = shards
+        """The manager of database shards."""
+
+        self.read_after_write = read_after_write
+        """The number of seconds after a user's write for which their reads are done on the main connection.
+
+        This ensures that users see their own writes when reading from a
+        replica that lags behind the primary database. See reader().
+        """
+
+    async def get_version(self, key: uuid.UUID, *, using_db: BaseDBAsyncClient | None = None) -> int:
+        """Gets the data version of the given user or account.
+
+        The data version is a monotonically increasing number that is
+        incremented whenever the data is changed using bump_version().
+
+        - For users, the data includes the user and their accounts (excluding
+          transactions of the accounts).
+        - For accounts, the data includes the account and its transactions.
+
+        The version should be read using the same connection as the data
+        it versions (see reader()).
+        """
+        version = await models.DataVersion.filter(key=key).using_db(using_db).first().values_list("version", flat=True)
+        return version or 0  # type: ignore
+
+    async def bump_version(self, *keys: uuid.UUID, using_db: BaseDBAsyncClient | None = None) -> None:
+        """Increments the data version of the given users or accounts.
+
+        This must be called in the same database transaction as every
+        write operation on the data of users or accounts. See get_version()
+        for more information.
+        """
+        if not keys:
+            return
+
+        client = using_db or connections.get("default")
+        values = [str(key) if client.capabilities.dialect == "sqlite" else key for key in dict.fromkeys(keys)]
+
+        if client.capabilities.dialect == "sqlite":
+            placeholders = ", ".join("(?, 1)" for _ in values)
+        else:
+            placeholders = ", ".join(f"(${i}, 1)" for i in range(1, len(values) + 1))
+
+        table = models.DataVersion._meta.db_table
+        await client.execute_query(
+            f'INSERT INTO "{table}" ("key", "version") VALUES {placeholders} '
+            f'ON CONFLICT ("key") DO UPDATE SET "version" = "{table}"."version" + 1',
+            values,
+        )
+
+    def reader(self, user_id: uuid.UUID) -> BaseDBAsyncClient:
+        """Returns the connection for read-only queries of the given user's data.
+
+        Heavy reads (e.g. listing and reports) should pass this in using_db
+        so that they are done on a separate read-only connection or replica
+        and do not hold up the writes.
+
+        If the user has written data in the last read_after_write seconds,
+        the main connection (of the routed shard) is returned instead so
+        that the user reads their own writes.
+        """
+        if self.read_after_write:
+            written_at = self._written_at.get(user_id)
+            if written_at is not None and time.monotonic() - written_at < self.read_after_write:
+                return connections.get("default")
+
+        return self.shards.reader()
 
     async def retrieve_user(self, user_id: str | uuid.UUID) -> models.User:
         """Retrieves a user by its ID.
@@ -48,3 +304,941 @@ class DatabaseClient:
                 raise ValueError("Invalid user_id provided.")
 
         return user
+
+    # Sharding. Users' data is stored in the shard assigned to the user while
+    # the users themselves are stored in the primary database (shard 0).
+    # See core.sharding for more information.
+
+    async def get_shard_assignment(self, user_id: uuid.UUID) -> tuple[int, int]:
+        """Gets the shard of the given user and their change log sync floor.
+
+        See core.models.ShardAssignment for details.
+        """
+        if self.shards.count == 1:
+            return 0, 0
+
+        assignment = self._assignments_cache.get(user_id)
+
+        if assignment is None:
+            row = await models.ShardAssignment.filter(user_id=user_id).first().values_list("shard", "sync_floor")
+            assignment = (row[0], row[1]) if row else (0, 0)  # type: ignore
+            self._assignments_cache.insert(user_id, assignment)
+
+        return assignment
+
+    @contextlib.asynccontextmanager
+    async def route(self, user_id: uuid.UUID) -> AsyncIterator[BaseDBAsyncClient]:
+        """Routes the queries in the current context to the given user's shard.
+
+        See :meth:`ShardManager.route` for more information.
+        """
+        shard, _ = await self.get_shard_assignment(user_id)
+
+        async with self.shards.route(shard) as client:
+            yield client
+
+    async def create_user(self, user: models.User) -> None:
+        """Saves the given new user and assigns a shard to it.
+
+        Other shards hold a copy of the user so that the users' data can
+        reference it. Only the ID of the copy is meaningful.
+        """
+        shard = self.shards.shard_for_new_user(user.id)
+
+        async with in_transaction() as conn:
+            await user.save(using_db=conn)
+            if shard:
+                await models.ShardAssignment.create(user=user, shard=shard, using_db=conn)
+
+        if shard:
+            async with self.shards.route(shard) as client:
+                await user.save(using_db=client, force_create=True)
+
+    async def delete_user(self, user: models.User) -> None:
+        """Deletes the given user along with their data."""
+        shard, _ = await self.get_shard_assignment(user.id)
+
+        async with self.shards.route(shard) as client:
+            # The data versions are not related to the user and accounts.
+            accounts = await models.FinancialAccount.filter(user_id=user.id).using_db(client).values_list("id", flat=True)
+            await models.DataVersion.filter(key__in=[user.id, *accounts]).using_db(client).delete()
+
+            if shard:
+                await user.delete(using_db=client)
+
+        await user.delete(using_db=self.shards.primary)
+
+        self._users_cache.delete(user.id)
+        self._assignments_cache.delete(user.id)
+
+    async def move_user(self, user_id: uuid.UUID, shard: int) -> None:
+        """Moves the data of given user to the given shard.
+
+        The user's change log is not moved. Instead, the user's sync
+        floor is raised so that their clients synchronize all data again.
+        Archived transactions of the user are restored in the new shard.
+
+        This must not be used while the server is running, as the server
+        caches the shard assignments of users. Sharding requires SQLite so
+        the shards are always SQLite databases.
+        """
+        source, _ = await self.get_shard_assignment(user_id)
+
+        if source == shard:
+            return
+
+        user = await models.User.get(id=user_id).using_db(self.shards.primary)
+
+        async with self.shards.route(source):
+            accounts = await models.FinancialAccount.filter(user_id=user_id)
+            categories = await models.Category.filter(user_id=user_id)
+            budgets = await models.Budget.filter(category__user_id=user_id)
+            rollups = await models.CategoryRollup.filter(category__user_id=user_id)
+            rules = await models.RecurringRule.filter(user_id=user_id)
+            versions = await models.DataVersion.filter(key__in=[user_id, *(acc.id for acc in accounts)])
+            transactions = await models.Transaction.filter(account__user_id=user_id)
+            source_sequence = await self._latest_sequence()
+
+            # The archived transactions are moved back to the transactions
+            # table of new shard. They are removed from the archive of old
+            # shard by its next archival as their accounts no longer exist.
+            # The archived transactions of deleted accounts are not moved.
+            archive = self.shards.archive_reader()
+            if archive is not None:
+                transactions += await models.Transaction.filter(
+                    user_id=user_id,
+                    account_id__in=[acc.id for acc in accounts],
+                ).using_db(archive)
+
+        async with self.shards.route(shard), in_transaction() as conn:
+            if shard:
+                await user.save(using_db=conn, force_create=True)
+
+            await models.FinancialAccount.bulk_create(accounts, using_db=conn)
+            await models.Category.bulk_create(categories, using_db=conn)
+            await models.Transaction.bulk_create(transactions, using_db=conn)
+            await models.Budget.bulk_create(budgets, using_db=conn)
+            await models.CategoryRollup.bulk_create(rollups, using_db=conn)
+            await models.RecurringRule.bulk_create(rules, using_db=conn)
+            await models.DataVersion.bulk_create(versions, using_db=conn)
+
+            # Future sequence numbers in this shard start after the floor.
+            sync_floor = max(source_sequence, await self._latest_sequence()) + 1
+            table = models.ChangeLogEntry._meta.db_table
+            await conn.execute_query(
+                "INSERT INTO sqlite_sequence (name, seq) SELECT ?, 0 "
+                "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = ?)",
+                [table, table],
+            )
+            await conn.execute_query(
+                "UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = ?",
+                [sync_floor, table],
+            )
+
+        primary = self.shards.primary
+        updated = await models.ShardAssignment.filter(user_id=user_id).using_db(primary).update(shard=shard, sync_floor=sync_floor)
+        if not updated:
+            await models.ShardAssignment.create(user_id=user_id, shard=shard, sync_floor=sync_floor, using_db=primary)
+
+        self._assignments_cache.delete(user_id)
+
+        async with self.shards.route(source) as client:
+            await models.DataVersion.filter(key__in=[v.key for v in versions]).delete()
+
+            if source:
+                await user.delete(using_db=client)
+            else:
+                await models.FinancialAccount.filter(user_id=user_id).delete()
+                await models.Category.filter(user_id=user_id).delete()
+                await models.ChangeLogEntry.filter(user_id=user_id).delete()
+                await models.PrunedChanges.filter(user_id=user_id).delete()
+
+    async def _latest_sequence(self) -> int:
+        latest = await models.ChangeLogEntry.all().order_by("-sequence").first().values_list("sequence", flat=True)
+        return latest or 0  # type: ignore
+
+    async def record_change(
+        self,
+        user_id: uuid.UUID,
+        entity_type: models.EntityType,
+        entity_id: uuid.UUID,
+        change_type: models.ChangeType,
+        data: dict[str, Any] | None = None,
+        *,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> None:
+        """Records a change made to user's data in the change log.
+
+        This should be called in the same database transaction as
+        the change itself by passing the transaction's connection
+        in using_db parameter.
+        """
+        if self.read_after_write:
+            self._written_at.insert(user_id, time.monotonic())
+
+        await _lock_change_log(using_db or connections.get("default"))
+        await models.ChangeLogEntry.create(
+            user_id=user_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            change_type=change_type,
+            data=data,
+            using_db=using_db,
+        )
+
+    async def prune_changes(self, retention: datetime.timedelta) -> int:
+        """Deletes the change log entries older than the given retention period.
+
+        The entries are deleted from all shards. The latest entry of each
+        shard is never deleted so that the sequence numbers are not reused.
+        The latest pruned entry of each user is recorded so that their
+        clients that have not synchronized it are asked to synchronize all
+        data again (see core.models.PrunedChanges).
+
+        Returns the number of deleted entries.
+        """
+        cutoff = datetime.datetime.now(datetime.timezone.utc) - retention
+        deleted = 0
+
+        for shard in range(self.shards.count):
+            async with self.shards.route(shard), in_transaction() as conn:
+                latest = await self._latest_sequence()
+                query = models.ChangeLogEntry.filter(created_at__lt=cutoff, sequence__lt=latest).using_db(conn)
+                pruned = await query.annotate(latest=Max("sequence")).group_by("user_id").values_list("user_id", "latest")
+
+                if not pruned:
+                    continue
+
+                await models.PrunedChanges.bulk_create(
+                    [models.PrunedChanges(user_id=user_id, sequence=sequence) for user_id, sequence in pruned],
+                    on_conflict=["user_id"],
+                    update_fields=["sequence"],
+                    using_db=conn,
+                )
+                deleted += await query.filter(sequence__lte=max(r[1] for r in pruned)).delete()
+
+        return deleted
+
+    async def _materialize_batch(self, now: datetime.datetime, batch_size: int) -> list[models.Transaction]:
+        async with in_transaction() as conn:
+            rules = await (
+                models.RecurringRule.filter(next_date__lte=now)
+                .using_db(conn)
+                .order_by("next_date")
+                .limit(batch_size)
+                .select_for_update()
+            )
+            transactions: list[models.Transaction] = []
+            processed: list[models.RecurringRule] = []
+
+            for rule in rules:
+                # A rule whose occurrences do not fit in this batch is
+                # continued from where it was left by the next batch.
+                for index, date in itertools.islice(iter_occurrences(rule, rule.occurrences, now), batch_size - len(transactions)):
+                    transactions.append(models.Transaction(
+                        id=uuid.uuid4(),
+                        account_id=rule.account_id,  # type: ignore
+                        user_id=rule.user_id,  # type: ignore
+                        category_id=rule.category_id,  # type: ignore
+                        amount=rule.amount,
+                        description=rule.description,
+                        date=date,
+                    ))
+                    rule.occurrences = index + 1
+
+                rule.next_date = next_occurrence(rule, rule.occurrences)
+                processed.append(rule)
+
+                if len(transactions) >= batch_size:
+                    break
+
+            if not processed:
+                return transactions
+
+            await models.RecurringRule.bulk_update(processed, fields=["occurrences", "next_date"], using_db=conn)
+            await self.insert_transactions(transactions, using_db=conn)
+            await self.bump_version(*{t.account_id for t in transactions}, using_db=conn)  # type: ignore
+
+        return transactions
+
+    async def insert_transactions(
+        self,
+        transactions: list[models.Transaction],
+        *,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> None:
+        """Inserts the given new transactions using a single query.
+
+        The category rollups are updated once per account, category and
+        month and the change log entries are inserted using a single query.
+        This must be called in a database transaction.
+        """
+        if self.read_after_write:
+            written_at = time.monotonic()
+            for user_id in {t.user_id for t in transactions}:  # type: ignore
+                self._written_at.insert(user_id, written_at)
+
+        client = using_db or connections.get("default")
+        await models.Transaction.bulk_create(transactions, using_db=client)
+
+        rollups: dict[tuple[Any, Any, int], list[int]] = {}
+        for t in transactions:
+            if t.category_id is not None:  # type: ignore
+                totals = rollups.setdefault((t.account_id, t.category_id, month_of(t.date)), [0, 0, 0])  # type: ignore
+                totals[0] += max(t.amount, 0)
+                totals[1] += max(-t.amount, 0)
+                totals[2] += 1
+
+        for (account_id, category_id, month), totals in rollups.items():
+            await _add_to_rollup(client, account_id, category_id, month, *totals)
+
+        await _lock_change_log(client)
+        await models.ChangeLogEntry.bulk_create(
+            [
+                models.ChangeLogEntry(
+                    user_id=t.user_id,  # type: ignore
+                    entity_type=models.EntityType.TRANSACTION,
+                    entity_id=t.id,
+                    change_type=models.ChangeType.CREATE,
+                    data=schemas.Transaction(
+                        **_transaction_row([getattr(t, column) for column in _TRANSACTION_COLUMNS]),
+                    ).model_dump(mode="json"),
+                )
+                for t in transactions
+            ],
+            using_db=client,
+        )
+
+    async def materialize_recurring(self, now: datetime.datetime | None = None, *, batch_size: int = 500) -> set[uuid.UUID]:
+        """Logs the due occurrences of recurring rules as transactions.
+
+        The rules of all shards whose next occurrence is dated at or before
+        the given time (the current time by default) are processed. Only
+        the due occurrences are logged; the future ones are never stored.
+
+        The transactions are inserted in batches of at most batch_size
+        transactions. Each batch is written in a single database transaction
+        along with the progress of its rules, the category rollups and the
+        change log entries.
+
+        Returns the IDs of users whose transactions were logged.
+        """
+        now = now or datetime.datetime.now(datetime.timezone.utc)
+        users: set[uuid.UUID] = set()
+
+        for shard in range(self.shards.count):
+            async with self.shards.route(shard):
+                while transactions := await self._materialize_batch(now, batch_size):
+                    users.update(t.user_id for t in transactions)  # type: ignore
+
+        return users
+
+    # Read-only queries. These return the rows as JSON-ready dictionaries
+    # in the format of corresponding API model instead of hydrating the
+    # Tortoise models. The values are converted only as far as needed for
+    # the dictionaries to be serialized by core.responses.ORJSONResponse.
+
+    async def fetch_accounts(self, user_id: uuid.UUID, *, using_db: BaseDBAsyncClient | None = None) -> list[dict[str, Any]]:
+        """Fetches the accounts of the given user.
+
+        The accounts are returned as dictionaries in the format of
+        core.schemas.FinancialAccount.
+        """
+        query = models.FinancialAccount.filter(user_id=user_id).using_db(using_db).values_list(
+            "id", "user_id", "name", "description", "type", "created_at", "currency", "currency_decimals",
+        )
+
+        return [
+            {
+                "id": r[0],
+                "user_id": r[1],
+                "name": r[2],
+                "description": r[3],
+                "type": r[4],
+                "created_at": _to_datetime(r[5]),
+                "currency": r[6],
+                "currency_decimals": r[7],
+            }
+            for r in await _fetch_rows(query)
+        ]
+
+    def _transactions_query(
+        self,
+        account_id: uuid.UUID,
+        *,
+        after: datetime.datetime | None = None,
+        before: datetime.datetime | None = None,
+        min_amount: int | None = None,
+        max_amount: int | None = None,
+        description: str | None = None,
+        category_id: uuid.UUID | None = None,
+        ascending: bool = False,
+        limit: int = 20,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> ValuesListQuery[Any]:
+        kwargs: dict[str, Any] = {}
+
+        if after:
+            kwargs["date__gt"] = after
+        if before:
+            kwargs["date__lt"] = before
+        if min_amount is not None:
+            kwargs["amount__gte"] = min_amount
+        if max_amount is not None:
+            kwargs["amount__lte"] = max_amount
+        if description:
+            # The prefix is matched as a range so that the description index
+            # is used. Tortoise's startswith lookup casts the column which
+            # prevents using the index.
+            kwargs["description__gte"] = description
+            kwargs["description__lt"] = description + "\U0010ffff"
+        if category_id is not None:
+            kwargs["category_id"] = category_id
+
+        return (
+            models.Transaction.filter(**kwargs, account_id=account_id)
+            .using_db(using_db)
+            .limit(limit)
+            .order_by(*(("date", "id") if ascending else ("-date", "-id")))
+            .values_list(*_TRANSACTION_COLUMNS)
+        )
+
+    async def fetch_transactions(
+        self,
+        account_id: uuid.UUID,
+        *,
+        after: datetime.datetime | None = None,
+        before: datetime.datetime | None = None,
+        min_amount: int | None = None,
+        max_amount: int | None = None,
+        description: str | None = None,
+        category_id: uuid.UUID | None = None,
+        ascending: bool = False,
+        limit: int = 20,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetches the latest transactions of the given account.
+
+        If after or before are provided, only the transactions after or
+        before that time are returned respectively. Similarly, min_amount
+        and max_amount limit the amounts (inclusive, in minor units) and
+        description limits to the transactions whose description starts
+        with it (case sensitive). If category_id is provided, only the
+        transactions in that category are returned.
+
+        If ascending is True, the oldest transactions are returned first.
+
+        The transactions are returned as dictionaries in the format of
+        core.schemas.Transaction.
+        """
+        kwargs: dict[str, Any] = {
+            "after": after,
+            "before": before,
+            "min_amount": min_amount,
+            "max_amount": max_amount,
+            "description": description,
+            "category_id": category_id,
+            "ascending": ascending,
+            "limit": limit,
+        }
+
+        query = self._transactions_query(account_id, **kwargs, using_db=using_db)
+        transactions = [_transaction_row(r) for r in await _fetch_rows(query)]
+
+        checkpoint = await self.fetch_checkpoint(account_id, using_db=using_db)
+
+        # The archive is only read if the requested transactions may be
+        # dated before the checkpoint.
+        if checkpoint is None or (after is not None and after >= checkpoint[0]):
+            return transactions
+        if not ascending and len(transactions) == limit and transactions[-1]["date"] >= checkpoint[0]:
+            return transactions
+
+        archive = self.shards.archive_reader()
+
+        if archive is None:
+            return transactions
+
+        query = self._transactions_query(account_id, **kwargs, using_db=archive)
+        archived = [_transaction_row(r) for r in await _fetch_rows(query)]
+
+        return _merge_transactions(transactions, archived, ascending, limit)
+
+    def _feed_query(
+        self,
+        user_id: uuid.UUID,
+        *,
+        before: tuple[datetime.datetime, uuid.UUID] | None = None,
+        limit: int = 20,
+        account_ids: list[uuid.UUID] | None = None,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> ValuesListQuery[Any]:
+        filters = Q(user_id=user_id)
+
+        if account_ids is not None:
+            filters &= Q(account_id__in=account_ids)
+
+        if before:
+            # The date bound allows reading the index as a range while the
+            # ID breaks the ties between transactions at the same date.
+            date, transaction_id = before
+            filters &= Q(date__lte=date) & (Q(date__lt=date) | Q(id__lt=transaction_id))
+
+        return (
+            models.Transaction.filter(filters)
+            .using_db(using_db)
+            .limit(limit)
+            .order_by("-date", "-id")
+            .values_list(*_TRANSACTION_COLUMNS)
+        )
+
+    async def fetch_feed(
+        self,
+        user_id: uuid.UUID,
+        *,
+        before: tuple[datetime.datetime, uuid.UUID] | None = None,
+        limit: int = 20,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetches the latest transactions of the given user across all accounts.
+
+        To fetch the next transactions, the date and ID of the last
+        transaction should be passed in before parameter.
+
+        The transactions are returned as dictionaries in the format of
+        core.schemas.Transaction.
+        """
+        query = self._feed_query(user_id, before=before, limit=limit, using_db=using_db)
+        transactions = [_transaction_row(r) for r in await _fetch_rows(query)]
+
+        # The archive is only read if the page may include transactions
+        # dated before the latest checkpoint of the user's accounts.
+        account_ids, latest = await self._fetch_checkpointed_accounts(user_id, using_db=using_db)
+
+        if latest is None or (len(transactions) == limit and transactions[-1]["date"] >= latest):
+            return transactions
+
+        archive = self.shards.archive_reader()
+
+        if archive is None:
+            return transactions
+
+        query = self._feed_query(user_id, before=before, limit=limit, account_ids=account_ids, using_db=archive)
+        archived = [_transaction_row(r) for r in await _fetch_rows(query)]
+
+        return _merge_transactions(transactions, archived, False, limit)
+
+    async def fetch_transaction(
+        self,
+        user_id: uuid.UUID,
+        account_id: uuid.UUID,
+        transaction_id: uuid.UUID,
+        *,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> dict[str, Any] | None:
+        """Fetches a transaction of the given user's account.
+
+        The transaction's existence and its ownership are checked in a
+        single query. None is returned if the transaction does not exist
+        or does not belong to the given account and user.
+
+        The transaction is returned as dictionary in the format of
+        core.schemas.Transaction.
+        """
+        query = (
+            models.Transaction.filter(id=transaction_id, account_id=account_id, user_id=user_id)
+            .using_db(using_db)
+            .limit(1)
+            .values_list(*_TRANSACTION_COLUMNS)
+        )
+
+        for r in await _fetch_rows(query):
+            return _transaction_row(r)
+
+        return None
+
+    async def update_transaction(
+        self,
+        user_id: uuid.UUID,
+        account_id: uuid.UUID,
+        transaction_id: uuid.UUID,
+        changes: dict[str, Any],
+        *,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> dict[str, Any] | None:
+        """Updates a transaction of the given user's account.
+
+        The update is a single conditional UPDATE statement that only
+        affects the transaction if it belongs to the given account and
+        user. None is returned if no transaction was updated.
+
+        The updated transaction is returned as dictionary in the format
+        of core.schemas.Transaction.
+        """
+        if not changes:
+            return await self.fetch_transaction(user_id, account_id, transaction_id, using_db=using_db)
+
+        query = (
+            models.Transaction.filter(id=transaction_id, account_id=account_id, user_id=user_id)
+            .using_db(using_db)
+            .update(**changes)
+        )
+        rows = await _execute_returning(query, *_TRANSACTION_COLUMNS)
+
+        if not rows:
+            return None
+
+        return _transaction_row([rows[0][column] for column in _TRANSACTION_COLUMNS])
+
+    async def delete_transaction(
+        self,
+        user_id: uuid.UUID,
+        account_id: uuid.UUID,
+        transaction_id: uuid.UUID,
+        *,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> dict[str, Any] | None:
+        """Deletes a transaction of the given user's account.
+
+        The deletion is a single conditional DELETE statement that only
+        affects the transaction if it belongs to the given account and
+        user. None is returned if no transaction was deleted.
+
+        The deleted transaction is returned as dictionary in the format
+        of core.schemas.Transaction.
+        """
+        query = (
+            models.Transaction.filter(id=transaction_id, account_id=account_id, user_id=user_id)
+            .using_db(using_db)
+            .delete()
+        )
+        rows = await _execute_returning(query, *_TRANSACTION_COLUMNS)
+
+        if not rows:
+            return None
+
+        return _transaction_row([rows[0][column] for column in _TRANSACTION_COLUMNS])
+
+    async def fetch_checkpoint(
+        self,
+        account_id: uuid.UUID,
+        *,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> tuple[datetime.datetime, int, int] | None:
+        """Fetches the balance checkpoint of the given account.
+
+        Returns the (date, balance, count) tuple of the account's archived
+        transactions (see core.models.BalanceCheckpoint) or None if none of
+        the account's transactions were archived.
+        """
+        row = await (
+            models.BalanceCheckpoint.filter(account_id=account_id)
+            .using_db(using_db)
+            .first()
+            .values_list("date", "balance", "count")
+        )
+        return tuple(row) if row else None  # type: ignore
+
+    async def _fetch_checkpointed_accounts(
+        self,
+        user_id: uuid.UUID,
+        *,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> tuple[list[uuid.UUID], datetime.datetime | None]:
+        # Returns the IDs of the user's accounts with archived transactions
+        # and the latest of their checkpoints. The archived transactions of
+        # deleted accounts remain in the archive until the next archival
+        # (see core.archive) so reads spanning the accounts of a user must
+        # be limited to these accounts.
+        rows = await models.BalanceCheckpoint.filter(account__user_id=user_id).using_db(using_db).values_list("account_id", "date")
+        return [r[0] for r in rows], max((r[1] for r in rows), default=None)
+
+    async def fetch_balance(self, account_id: uuid.UUID, *, using_db: BaseDBAsyncClient | None = None) -> int:
+        """Calculates the balance of the given account in minor units.
+
+        The archived transactions are included using the account's
+        balance checkpoint.
+        """
+        # Only the aggregate is selected so that the query is valid
+        # on backends that require grouping of selected columns.
+        balance = await (
+            models.Transaction.filter(account_id=account_id)
+            .using_db(using_db)
+            .annotate(balance=Sum("amount"))
+            .first()
+            .values_list("balance", flat=True)
+        )
+        checkpoint = await self.fetch_checkpoint(account_id, using_db=using_db)
+        return (balance or 0) + (checkpoint[1] if checkpoint else 0)  # type: ignore
+
+    async def fetch_balances(self, user_id: uuid.UUID, *, using_db: BaseDBAsyncClient | None = None) -> dict[uuid.UUID, int]:
+        """Calculates the balances of all accounts of the given user in minor units.
+
+        The balances are calculated using a single grouped query and
+        returned as a mapping of account IDs to balances. The accounts
+        without transactions are not included.
+        """
+        rows = await (
+            models.Transaction.filter(user_id=user_id)
+            .using_db(using_db)
+            .group_by("account_id")
+            .annotate(balance=Sum("amount"))
+            .values_list("account_id", "balance")
+        )
+        checkpoints = await (
+            models.BalanceCheckpoint.filter(account__user_id=user_id)
+            .using_db(using_db)
+            .values_list("account_id", "balance")
+        )
+        balances: dict[uuid.UUID, int] = {}
+
+        for account_id, balance in itertools.chain(rows, checkpoints):  # type: ignore
+            account_id = uuid.UUID(str(account_id))
+            balances[account_id] = balances.get(account_id, 0) + balance
+
+        return balances
+
+    async def fetch_amounts(
+        self,
+        user_id: uuid.UUID,
+        after: datetime.datetime,
+        *,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> list[tuple[uuid.UUID, datetime.datetime, int]]:
+        """Fetches the amounts of the given user's transactions dated at or after the given time.
+
+        The amounts are returned as (account_id, date, amount) tuples in no
+        particular order. The archived transactions are included if needed.
+        """
+        query = models.Transaction.filter(user_id=user_id, date__gte=after).using_db(using_db).values_list("account_id", "date", "amount")
+        amounts = [(uuid.UUID(str(r[0])), _to_datetime(r[1]), r[2]) for r in await _fetch_rows(query)]
+
+        account_ids, latest = await self._fetch_checkpointed_accounts(user_id, using_db=using_db)
+        archive = self.shards.archive_reader()
+
+        if latest is not None and latest > after and archive is not None:
+            query = (
+                models.Transaction.filter(user_id=user_id, account_id__in=account_ids, date__gte=after)
+                .using_db(archive)
+                .values_list("account_id", "date", "amount")
+            )
+            amounts += [(uuid.UUID(str(r[0])), _to_datetime(r[1]), r[2]) for r in await _fetch_rows(query)]
+
+        return amounts
+
+    async def fetch_external_ids(
+        self,
+        account_id: uuid.UUID,
+        external_ids: Iterable[str],
+        *,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> set[str]:
+        """Returns the given external IDs that are already used by the account's transactions.
+
+        The archived transactions are included if the account has any.
+        """
+        external_ids = list(external_ids)
+        query = models.Transaction.filter(account_id=account_id, external_id__in=external_ids).using_db(using_db)
+        found = set(await query.values_list("external_id", flat=True))
+        archive = self.shards.archive_reader()
+
+        if archive is not None and await self.fetch_checkpoint(account_id, using_db=using_db) is not None:
+            query = models.Transaction.filter(account_id=account_id, external_id__in=external_ids).using_db(archive)
+            found.update(await query.values_list("external_id", flat=True))
+
+        return found  # type: ignore
+
+    async def update_rollup(
+        self,
+        account_id: uuid.UUID | str,
+        category_id: uuid.UUID | str,
+        date: datetime.datetime,
+        amount: int,
+        *,
+        removed: bool = False,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> None:
+        """Adds a categorized transaction to the rollup of its account, category and month.
+
+        If removed is True, the transaction is removed from the rollup
+        instead. This must be called in the same database transaction
+        as the write to the transaction (see core.models.CategoryRollup).
+        """
+        sign = -1 if removed else 1
+        await _add_to_rollup(
+            using_db or connections.get("default"),
+            account_id,
+            category_id,
+            month_of(date),
+            sign * max(amount, 0),
+            sign * max(-amount, 0),
+            sign,
+        )
+
+    async def uncategorize_transactions(
+        self,
+        user_id: uuid.UUID,
+        category_id: uuid.UUID,
+        *,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> set[uuid.UUID]:
+        """Removes the given category from the user's transactions.
+
+        Returns the IDs of accounts whose transactions were changed.
+        """
+        query = (
+            models.Transaction.filter(user_id=user_id, category_id=category_id)
+            .using_db(using_db)
+            .update(category_id=None)
+        )
+        return {uuid.UUID(str(row["account_id"])) for row in await _execute_returning(query, "account_id")}
+
+    async def fetch_category_totals(
+        self,
+        account_id: uuid.UUID,
+        month: int,
+        *,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetches the totals of the given account's transactions in each category in the given month.
+
+        The month is in YYYYMM format (see month_of()). The totals are
+        read from the rollups and returned as dictionaries in the format
+        of core.schemas.CategoryTotal.
+        """
+        return await (
+            models.CategoryRollup.filter(account_id=account_id, month=month, count__gt=0)
+            .using_db(using_db)
+            .order_by("-expenses")
+            .values("category_id", "income", "expenses", "count")
+        )
+
+    async def fetch_budgets(
+        self,
+        account_id: uuid.UUID,
+        month: int,
+        *,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetches the budgets of the given account along with their spending in the given month.
+
+        The spending of each budget is read from a single rollup. The
+        budgets are returned as dictionaries in the format of
+        core.schemas.BudgetStatus.
+        """
+        budgets = await (
+            models.Budget.filter(account_id=account_id)
+            .using_db(using_db)
+            .values("id", "account_id", "category_id", "monthly_limit")
+        )
+
+        if not budgets:
+            return []
+
+        spent: dict[Any, int] = dict(await (  # type: ignore
+            models.CategoryRollup.filter(account_id=account_id, month=month, category_id__in=[b["category_id"] for b in budgets])
+            .using_db(using_db)
+            .values_list("category_id", "expenses")
+        ))
+
+        for budget in budgets:
+            budget["spent"] = spent.get(budget["category_id"], 0)
+            budget["remaining"] = budget["monthly_limit"] - budget["spent"]
+
+        return budgets
+
+    async def fetch_description_counts(
+        self,
+        user_id: uuid.UUID,
+        *,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> list[tuple[str, int]]:
+        """Fetches the distinct transaction descriptions of the given user.
+
+        Returns the (description, count) tuples where count is the number
+        of user's transactions having that description.
+        """
+        rows = await (
+            models.Transaction.filter(user_id=user_id, description__isnull=False)
+            .using_db(using_db)
+            .annotate(count=Count("id"))
+            .group_by("description")
+            .values_list("description", "count")
+        )
+        return rows  # type: ignore
+
+    async def search_transactions(
+        self,
+        user_id: uuid.UUID,
+        query: str,
+        *,
+        account_id: uuid.UUID | None = None,
+        after: tuple[float, uuid.UUID] | None = None,
+        limit: int = 20,
+        using_db: BaseDBAsyncClient | None = None,
+    ) -> list[tuple[float, dict[str, Any]]]:
+        """Searches the transactions of the given user by their description.
+
+        If account_id is provided, only the transactions of that account
+        are searched. The transactions are ordered by their relevance and
+        returned as (rank, transaction) tuples where lower rank is more
+        relevant. To fetch the next transactions, the rank and ID of the
+        last transaction should be passed in after parameter.
+
+        The transactions are returned as dictionaries in the format of
+        core.schemas.Transaction.
+        """
+        client = using_db or connections.get("default")
+        account_id = str(account_id) if account_id else None
+
+        if client.capabilities.dialect != "sqlite":
+            return await self._search_transactions_fallback(user_id, query, account_id, after, limit, client)
+
+        transactions = models.Transaction._meta.db_table
+        sql = (
+            f'SELECT {", ".join(f"t.{column}" for column in _TRANSACTION_COLUMNS)}, bm25({SEARCH_TABLE}) AS rank '
+            f'FROM {SEARCH_TABLE} JOIN "{transactions}" t ON t.rowid = {SEARCH_TABLE}.rowid '
+            f'WHERE {SEARCH_TABLE} MATCH ? AND t.user_id = ?'
+        )
+        values: list[Any] = [to_match_query(query), str(user_id)]
+
+        if account_id:
+            sql += " AND t.account_id = ?"
+            values.append(account_id)
+        if after:
+            sql += f" AND (bm25({SEARCH_TABLE}), t.id) > (?, ?)"
+            values.extend((after[0], str(after[1])))
+
+        sql += " ORDER BY rank, t.id LIMIT ?"
+        values.append(limit)
+
+        _, rows = await client.execute_query(sql, values)
+        return [(r[len(_TRANSACTION_COLUMNS)], _transaction_row(r)) for r in rows]
+
+    async def _search_transactions_fallback(
+        self,
+        user_id: uuid.UUID,
+        query: str,
+        account_id: str | None,
+        after: tuple[float, uuid.UUID] | None,
+        limit: int,
+        client: BaseDBAsyncClient,
+    ) -> list[tuple[float, dict[str, Any]]]:
+        # Databases other than SQLite have no search index. The descriptions
+        # are matched using case insensitive LIKE and all transactions have
+        # the same rank i.e. they are ordered by their IDs.
+        filters = Q(*(Q(description__icontains=word) for word in query.split()), user_id=user_id)
+
+        if account_id:
+            filters &= Q(account_id=account_id)
+        if after:
+            filters &= Q(id__gt=after[1])
+
+        rows = await (
+            models.Transaction.filter(filters)
+            .using_db(client)
+            .order_by("id")
+            .limit(limit)
+            .values_list(*_TRANSACTION_COLUMNS)
+        )
+        return [(0.0, _transaction_row(r)) for r in rows]
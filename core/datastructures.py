@@ -7,6 +7,7 @@ from collections import OrderedDict
 
 __all__ = (
     "LRUCache",
+    "SizedLRUCache",
 )
 
 _KT = TypeVar("_KT")
@@ -27,23 +28,25 @@ class LRUCache(Generic[_KT, _VT]):
         "__maxlen",
         "__data",
     )
-    
+
     def __init__(self, maxlen: int) -> None:
         self.__maxlen = maxlen
         self.__data: OrderedDict[_KT, _VT] = OrderedDict()
 
     def insert(self, key: _KT, value: _VT) -> None:
         """Inserts an entry in the cache."""
-        if len(self.__data) >= self.__maxlen:
+        # The most recently used entries are kept at the end.
+        if key in self.__data:
+            self.__data.move_to_end(key)
+        elif len(self.__data) >= self.__maxlen:
             self.__data.popitem(last=False)
 
         self.__data[key] = value
-        self.__data.move_to_end(key, last=False)
 
     def get(self, key: _KT) -> _VT | None:
         """Gets a value from the cache by its key."""
         try:
-            self.__data.move_to_end(key, last=False)
+            self.__data.move_to_end(key)
             return self.__data[key]
         except KeyError:
             return None
@@ -54,3 +57,64 @@ class LRUCache(Generic[_KT, _VT]):
             return self.__data.pop(key)
         except KeyError:
             return None
+
+
+class SizedLRUCache(Generic[_KT, _VT]):
+    """Represents an LRU cache bounded by the total size of its entries.
+
+    Unlike :class:`LRUCache`, the limit is defined on the sum of sizes
+    of entries (e.g. number of bytes) instead of number of entries. The
+    size of each entry is provided when inserting it.
+
+    This class takes one parameter ``maxsize`` that defines the total size
+    of entries in the cache before the least used entries are evicted. Entries
+    larger than ``maxsize`` are not cached.
+    """
+
+    __slots__ = (
+        "__maxsize",
+        "__size",
+        "__data",
+    )
+
+    def __init__(self, maxsize: int) -> None:
+        self.__maxsize = maxsize
+        self.__size = 0
+        self.__data: OrderedDict[_KT, tuple[_VT, int]] = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        """The total size of entries in the cache."""
+        return self.__size
+
+    def insert(self, key: _KT, value: _VT, size: int) -> None:
+        """Inserts an entry of the given size in the cache."""
+        self.delete(key)
+
+        if size > self.__maxsize:
+            return
+
+        while self.__size + size > self.__maxsize:
+            _, (_, evicted_size) = self.__data.popitem(last=False)
+            self.__size -= evicted_size
+
+        self.__data[key] = (value, size)
+        self.__size += size
+
+    def get(self, key: _KT) -> _VT | None:
+        """Gets a value from the cache by its key."""
+        try:
+            self.__data.move_to_end(key)
+            return self.__data[key][0]
+        except KeyError:
+            return None
+
+    def delete(self, key: _KT) -> _VT | None:
+        """Deletes a value from the cache and returns it."""
+        try:
+            value, size = self.__data.pop(key)
+        except KeyError:
+            return None
+
+        self.__size -= size
+        return value
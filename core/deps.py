@@ -2,30 +2,63 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 from fastapi import Header, Request, HTTPException
 from core.utils import fernet_decrypt
+from core import config
+
+import secrets
 
 __all__ = (
     "require_auth",
+    "require_admin",
 )
 
 
-async def require_auth(request: Request, x_user_id: Annotated[str, Header()], x_user_token: Annotated[str, Header()]):
+async def require_auth(request: Request, x_user_id: Annotated[str, Header()], x_user_token: Annotated[str, Header()]) -> AsyncIterator[None]:
     """FastAPI dependency to validate request authorization.
 
     This ensures that the request has X-User-Token and X-User-Id header
     with valid authorizatoin token and user ID respectively.
 
     If validated, the corresponding user object is attached with request
-    state in the "user" attribute.
+    state in the "user" attribute and the decrypted token in "token"
+    attribute. The database queries made by the request are routed to
+    the user's shard (see DatabaseClient.route()).
+
+    Sub-requests of a batch request are authorized once by the batch
+    request so the authorization is not validated again for them.
     """
-    try:
-        user = await request.app.state.db.retrieve_user(x_user_id)
-    except ValueError:
-        raise HTTPException(404, "User not found") from None
+    batch = getattr(request.state, "batch", None)
+
+    if batch is not None:
+        request.state.user = batch.user
+        request.state.token = batch.token
     else:
+        try:
+            user = await request.app.state.db.retrieve_user(x_user_id)
+        except ValueError:
+            raise HTTPException(404, "User not found") from None
+
         if fernet_decrypt(user.token) != x_user_token:
             raise HTTPException(401, "Invalid authorization token")
 
         request.state.user = user
+        request.state.token = x_user_token
+
+    async with request.app.state.db.route(request.state.user.id):
+        yield
+
+
+async def require_admin(x_admin_token: Annotated[str, Header()] = "") -> None:
+    """FastAPI dependency to validate the authorization of admin requests.
+
+    This ensures that the request has X-Admin-Token header matching the
+    configured admin token. If no admin token is configured, the admin
+    endpoints are disabled and 404 is returned.
+    """
+    if not config.ADMIN_TOKEN:
+        raise HTTPException(404, "Not Found")
+
+    if not secrets.compare_digest(x_admin_token.encode(), config.ADMIN_TOKEN.encode()):
+        raise HTTPException(401, "Invalid admin token")
@@ -0,0 +1,119 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Any
+from core.responses import dumps
+
+import asyncio
+import uuid
+
+__all__ = (
+    "Event",
+    "Subscription",
+    "EventHub",
+)
+
+
+class Event:
+    """Represents an event published to the subscribers.
+
+    The event's data is serialized once on creation so that it
+    can be sent to many subscribers without serializing it again.
+    """
+
+    __slots__ = (
+        "type",
+        "payload",
+    )
+
+    def __init__(self, type: str, data: dict[str, Any]) -> None:
+        self.type = type
+        self.payload = f"event: {type}\ndata: ".encode() + dumps(data) + b"\n\n"
+        """The event encoded in Server-Sent Events format."""
+
+
+class Subscription:
+    """Represents a subscription to the events of a user.
+
+    The events are put in a bounded queue. If the subscriber does not
+    consume the events fast enough and the queue is filled, the subscription
+    is dropped by the hub. A dropped subscription receives None.
+    """
+
+    __slots__ = (
+        "user_id",
+        "queue",
+        "dropped",
+    )
+
+    def __init__(self, user_id: uuid.UUID, queue_size: int) -> None:
+        self.user_id = user_id
+        self.queue: asyncio.Queue[Event | None] = asyncio.Queue(queue_size)
+        self.dropped = False
+
+    async def get(self) -> Event | None:
+        """Waits for the next event. None is returned if the subscription was dropped."""
+        return await self.queue.get()
+
+
+class EventHub:
+    """In-process hub that fans out events to the subscribers.
+
+    Parameters
+    ----------
+    queue_size: :class:`int`
+        The maximum number of pending events per subscriber.
+    """
+
+    def __init__(self, queue_size: int) -> None:
+        self._queue_size = queue_size
+        self._subscriptions: dict[uuid.UUID, set[Subscription]] = {}
+
+    def subscribe(self, user_id: uuid.UUID) -> Subscription:
+        """Subscribes to the events of the given user."""
+        subscription = Subscription(user_id, self._queue_size)
+        self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Removes the given subscription."""
+        subscriptions = self._subscriptions.get(subscription.user_id)
+
+        if subscriptions is None:
+            return
+
+        subscriptions.discard(subscription)
+
+        if not subscriptions:
+            del self._subscriptions[subscription.user_id]
+
+    def has_subscribers(self, user_id: uuid.UUID) -> bool:
+        """Checks whether the given user has any subscribers.
+
+        This can be used to avoid preparing the event data when
+        nobody will receive it.
+        """
+        return user_id in self._subscriptions
+
+    def publish(self, user_id: uuid.UUID, event: Event) -> None:
+        """Publishes an event to the subscribers of the given user.
+
+        Subscribers whose queue is full are dropped.
+        """
+        for subscription in list(self._subscriptions.get(user_id, ())):
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._drop(subscription)
+
+    def _drop(self, subscription: Subscription) -> None:
+        self.unsubscribe(subscription)
+        subscription.dropped = True
+
+        # Discard pending events so that the subscriber is notified
+        # about being dropped as soon as possible.
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+
+        subscription.queue.put_nowait(None)
@@ -0,0 +1,205 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from starlette.datastructures import Headers, MutableHeaders
+from core.datastructures import LRUCache
+
+import gzip
+import hashlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+__all__ = (
+    "CompressionMiddleware",
+)
+
+# Content types that are already compressed or are streamed to the client.
+_UNCOMPRESSIBLE_TYPES = (
+    "application/octet-stream",
+    "application/gzip",
+    "application/zip",
+    "application/zstd",
+    "text/event-stream",
+    "image/",
+    "audio/",
+    "video/",
+)
+
+
+class CompressionMiddleware:
+    """ASGI middleware that compresses the responses.
+
+    Responses are compressed using zstd (if zstandard package is installed
+    and accepted by the client) or gzip. The responses are only compressed if:
+
+    - client accepts one of the supported encodings
+    - response body is not smaller than ``minimum_size``
+    - response is not already encoded or of an already compressed type
+    - response is not streamed (i.e. sent in a single body message)
+
+    The compressed bodies of successful GET responses are cached (by the
+    digest of uncompressed body) so repeated responses are not compressed
+    again.
+
+    Parameters
+    ----------
+    app:
+        The ASGI application.
+    minimum_size: :class:`int`
+        The minimum size of response body, in bytes, to compress.
+    gzip_level: :class:`int`
+        The gzip compression level (1-9).
+    zstd_level: :class:`int`
+        The zstd compression level (1-22).
+    cache_size: :class:`int`
+        The maximum number of compressed bodies to cache.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        zstd_level: int = 3,
+        cache_size: int = 256,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.zstd_level = zstd_level
+        self._cache = LRUCache[tuple[str, bytes], bytes](cache_size)
+
+    def _choose_encoding(self, accept_encoding: str) -> str | None:
+        accepted: set[str] = set()
+
+        for part in accept_encoding.split(","):
+            name, _, params = part.strip().partition(";")
+            params = params.replace(" ", "")
+
+            if params.startswith("q="):
+                try:
+                    if float(params[2:]) == 0:
+                        continue
+                except ValueError:
+                    continue
+
+            accepted.add(name.lower())
+
+        if zstandard is not None and "zstd" in accepted:
+            return "zstd"
+        if "gzip" in accepted:
+            return "gzip"
+
+        return None
+
+    def _compress(self, encoding: str, body: bytes) -> bytes:
+        if encoding == "zstd":
+            return zstandard.ZstdCompressor(level=self.zstd_level).compress(body)  # type: ignore
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    def compress(self, encoding: str, body: bytes, cacheable: bool) -> bytes:
+        """Compresses the body using the given encoding.
+
+        If cacheable=True, the compressed body is looked up in and
+        stored to the cache.
+        """
+        if not cacheable:
+            return self._compress(encoding, body)
+
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+        compressed = self._cache.get(key)
+
+        if compressed is None:
+            compressed = self._compress(encoding, body)
+            self._cache.insert(key, compressed)
+
+        return compressed
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self._choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, scope["method"] == "GET", send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    __slots__ = (
+        "middleware",
+        "encoding",
+        "get_request",
+        "_send",
+        "_start_message",
+        "_passthrough",
+    )
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, get_request: bool, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.get_request = get_request
+        self._send = send
+        self._start_message: Message | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self._passthrough:
+            await self._send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+
+            if "content-encoding" in headers or content_type.startswith(_UNCOMPRESSIBLE_TYPES):
+                self._passthrough = True
+                await self._send(message)
+            else:
+                # Hold the start message until the body is known.
+                self._start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self._start_message is None:
+            await self._send(message)
+            return
+
+        start_message = self._start_message
+        self._start_message = None
+        self._passthrough = True
+
+        body: bytes = message.get("body", b"")
+
+        if message.get("more_body", False) or len(body) < self.middleware.minimum_size:
+            await self._send(start_message)
+            await self._send(message)
+            return
+
+        headers = MutableHeaders(raw=start_message["headers"])
+        cacheable = (
+            self.get_request
+            and start_message["status"] == 200
+            and "no-store" not in headers.get("cache-control", "")
+        )
+
+        body = self.middleware.compress(self.encoding, body, cacheable)
+
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(body))
+        headers.add_vary_header("Accept-Encoding")
+
+        await self._send(start_message)
+        await self._send({"type": "http.response.body", "body": body})
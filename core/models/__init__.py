@@ -1,3 +1,10 @@
 from core.models.users import *
 from core.models.accounts import *
+from core.models.categories import *
 from core.models.transactions import *
+from core.models.recurring import *
+from core.models.changelog import *
+from core.models.shards import *
+from core.models.archive import *
+from core.models.rates import *
+from core.models.versions import *
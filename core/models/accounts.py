@@ -58,6 +58,13 @@ class FinancialAccount(Model):
     created_at = fields.DatetimeField(auto_now_add=True)
     """The time when this account was created."""
 
+    currency = fields.CharField(max_length=constraints.CURRENCY_CODE_LENGTH, default="USD")
+    """The ISO 4217 code of the currency that this account uses e.g. USD or EUR.
+
+    The amounts are converted between the accounts' currencies using
+    the exchange rates (see core.rates) e.g. to calculate net worth.
+    """
+
     currency_decimals = fields.IntField(default=2)
     """The number of decimals that the currency has that this account uses.
 
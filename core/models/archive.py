@@ -0,0 +1,36 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from tortoise import Model, fields
+from core.models import FinancialAccount
+
+__all__ = (
+    "BalanceCheckpoint",
+)
+
+
+class BalanceCheckpoint(Model):
+    """Represents the archived transactions of a financial account.
+
+    The transactions of an account dated before :attr:`date` may have been
+    moved to the archive database (see core.archive). The checkpoint holds
+    the total of archived transactions so that the balance is calculated
+    without reading the archive.
+    """
+
+    account: fields.OneToOneRelation[FinancialAccount] = fields.OneToOneField(
+        "models.FinancialAccount",
+        related_name="checkpoint",
+        primary_key=True,
+    )
+    """The account whose transactions are archived."""
+
+    date = fields.DatetimeField()
+    """The time before which the account's transactions are archived."""
+
+    balance = fields.BigIntField(default=0)
+    """The sum of amounts of archived transactions in minor units."""
+
+    count = fields.IntField(default=0)
+    """The number of archived transactions."""
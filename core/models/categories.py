@@ -0,0 +1,86 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from tortoise import Model, fields, validators
+from core.models import constraints, User, FinancialAccount
+
+__all__ = (
+    "Category",
+    "CategoryRollup",
+    "Budget",
+)
+
+
+class Category(Model):
+    """Represents a category of transactions e.g. groceries or rent."""
+
+    id = fields.UUIDField(primary_key=True)
+    """The category's unique identifier encoded as UUID4."""
+
+    user: fields.ForeignKeyRelation[User] = fields.ForeignKeyField("models.User", related_name="categories")
+    """The user that this category is associated to."""
+
+    name = fields.TextField(
+        validators=[
+            validators.MinLengthValidator(constraints.CATEGORY_NAME_MIN_LENGTH),
+            validators.MaxLengthValidator(constraints.CATEGORY_NAME_MAX_LENGTH),
+        ]
+    )
+    """The category's name."""
+
+
+class CategoryRollup(Model):
+    """Represents the totals of an account's transactions in a category in a month.
+
+    The rollups are updated along with every write to the transactions
+    (see DatabaseClient.update_rollup()) so that the category summaries
+    and budgets are calculated without reading the transactions.
+    """
+
+    id = fields.IntField(primary_key=True)
+    """The rollup's auto incremented identifier."""
+
+    account: fields.ForeignKeyRelation[FinancialAccount] = fields.ForeignKeyField(
+        "models.FinancialAccount", related_name="rollups"
+    )
+    """The account whose transactions are totalled."""
+
+    category: fields.ForeignKeyRelation[Category] = fields.ForeignKeyField("models.Category", related_name="rollups")
+    """The category whose transactions are totalled."""
+
+    month = fields.IntField()
+    """The month of transactions in YYYYMM format e.g. 202504 for April 2025 (in UTC)."""
+
+    income = fields.BigIntField(default=0)
+    """The sum of amounts of incomes (positive amounts) in minor units."""
+
+    expenses = fields.BigIntField(default=0)
+    """The sum of amounts of expenses (negative amounts) in minor units, as a positive number."""
+
+    count = fields.IntField(default=0)
+    """The number of transactions."""
+
+    class Meta:  # type: ignore
+        unique_together = (("account", "category", "month"),)
+
+
+class Budget(Model):
+    """Represents the monthly spending limit of an account in a category."""
+
+    id = fields.UUIDField(primary_key=True)
+    """The budget's unique identifier encoded as UUID4."""
+
+    account: fields.ForeignKeyRelation[FinancialAccount] = fields.ForeignKeyField(
+        "models.FinancialAccount", related_name="budgets"
+    )
+    """The account that this budget applies to."""
+
+    category: fields.ForeignKeyRelation[Category] = fields.ForeignKeyField("models.Category", related_name="budgets")
+    """The category that this budget applies to."""
+
+    monthly_limit = fields.BigIntField()
+    """The maximum expenses per month in minor units, as a positive number."""
+
+    class Meta:  # type: ignore
+        unique_together = (("account", "category"),)
@@ -0,0 +1,108 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from tortoise import Model, fields
+from enum import IntEnum
+from core.models import User
+
+__all__ = (
+    "ChangeLogEntry",
+    "PrunedChanges",
+    "EntityType",
+    "ChangeType",
+)
+
+
+class EntityType(IntEnum):
+    """An enum representing the types of entities that are tracked in change log."""
+
+    USER = 0
+    """The user (see core.models.User)."""
+
+    ACCOUNT = 1
+    """A financial account (see core.models.FinancialAccount)."""
+
+    TRANSACTION = 2
+    """A transaction (see core.models.Transaction)."""
+
+    CATEGORY = 3
+    """A category (see core.models.Category)."""
+
+    BUDGET = 4
+    """A budget (see core.models.Budget)."""
+
+    RECURRING_RULE = 5
+    """A recurring rule (see core.models.RecurringRule)."""
+
+
+class ChangeType(IntEnum):
+    """An enum representing the types of changes made to an entity."""
+
+    CREATE = 0
+    """The entity was created."""
+
+    UPDATE = 1
+    """The entity was updated."""
+
+    DELETE = 2
+    """The entity was deleted."""
+
+
+class ChangeLogEntry(Model):
+    """Represents an entry in the append-only log of changes made to a user's data.
+
+    The entries are written in the same database transaction as the change
+    itself and are used by clients to synchronize only the changed data. Old
+    entries are periodically pruned.
+    """
+
+    sequence = fields.BigIntField(primary_key=True)
+    """The auto incremented sequence number of this entry.
+
+    Sequence numbers are global to the database (not per user) and increase
+    monotonically. When sharding is enabled, each shard has its own sequence.
+    """
+
+    user: fields.ForeignKeyRelation[User] = fields.ForeignKeyField("models.User", related_name="changes")
+    """The user whose data was changed."""
+
+    entity_type = fields.IntEnumField(EntityType)
+    """The type of entity that was changed."""
+
+    entity_id = fields.UUIDField()
+    """The ID of entity that was changed."""
+
+    change_type = fields.IntEnumField(ChangeType)
+    """The type of change made to the entity."""
+
+    data = fields.JSONField(null=True, default=None)
+    """The entity's data (as returned by API) after the change.
+
+    This is None for deletions.
+    """
+
+    created_at = fields.DatetimeField(auto_now_add=True)
+    """The time when this change was made."""
+
+    class Meta:  # type: ignore
+        indexes = (("user_id", "sequence"),)
+
+
+class PrunedChanges(Model):
+    """Represents the pruned change log entries of a user.
+
+    The user's changes after :attr:`sequence` are still in the change
+    log. Clients that synchronized before it must download all data
+    again. This is stored in the same database as the user's change log.
+    """
+
+    user: fields.OneToOneRelation[User] = fields.OneToOneField(
+        "models.User",
+        related_name="pruned_changes",
+        primary_key=True,
+    )
+    """The user whose change log entries were pruned."""
+
+    sequence = fields.BigIntField()
+    """The sequence number of the user's latest pruned entry."""
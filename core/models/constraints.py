@@ -14,9 +14,18 @@ ACCOUNT_NAME_MIN_LENGTH = 3
 ACCOUNT_NAME_MAX_LENGTH = 128
 ACCOUNT_DESCRIPTION_MIN_LENGTH = 0
 ACCOUNT_DESCRIPTION_MAX_LENGTH = 1024
+CURRENCY_CODE_LENGTH = 3
+CURRENCY_CODE_PATTERN = r"^[A-Z]{3}$"
+
+# Categories
+CATEGORY_NAME_MIN_LENGTH = 1
+CATEGORY_NAME_MAX_LENGTH = 64
 
 # Transactions
 TRANSACTION_DESCRIPTION_MIN_LENGTH = 0
 TRANSACTION_DESCRIPTION_MAX_LENGTH = 512
 TRANSACTION_AMOUNT_MAX_DIGITS = 14
 TRANSACTION_AMOUNT_DECIMAL_PLACES = 2
+
+# Recurring rules
+RECURRING_RULE_MAX_INTERVAL = 366
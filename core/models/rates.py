@@ -0,0 +1,34 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from tortoise import Model, fields
+from core.models import constraints
+
+__all__ = (
+    "ExchangeRate",
+)
+
+
+class ExchangeRate(Model):
+    """Represents the exchange rate of a currency on a date.
+
+    The rates are imported from a file (see core.rates) and stored in the
+    primary database. Each rate is the number of units of the currency per
+    unit of the base currency (BUJET_BASE_CURRENCY).
+    """
+
+    id = fields.IntField(primary_key=True)
+    """The rate's auto incremented identifier."""
+
+    currency = fields.CharField(max_length=constraints.CURRENCY_CODE_LENGTH)
+    """The ISO 4217 code of the currency."""
+
+    date = fields.DateField()
+    """The date from which the rate applies, until the next rate of the currency."""
+
+    rate = fields.FloatField()
+    """The number of units of the currency per unit of the base currency."""
+
+    class Meta:  # type: ignore
+        unique_together = (("currency", "date"),)
@@ -0,0 +1,103 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from tortoise import Model, fields, validators
+from tortoise.indexes import Index
+from enum import IntEnum
+from core.models import constraints, User, FinancialAccount, Category
+
+__all__ = (
+    "RecurringRule",
+    "Frequency",
+)
+
+
+class Frequency(IntEnum):
+    """An enum representing the units in which recurring rules repeat."""
+
+    DAILY = 0
+    """The rule repeats every ``interval`` days."""
+
+    WEEKLY = 1
+    """The rule repeats every ``interval`` weeks."""
+
+    MONTHLY = 2
+    """The rule repeats every ``interval`` months on the day of month of its start.
+
+    In shorter months, the last day of month is used instead.
+    """
+
+    YEARLY = 3
+    """The rule repeats every ``interval`` years on the date of its start."""
+
+
+class RecurringRule(Model):
+    """Represents a transaction that repeats e.g. rent, salary or a subscription.
+
+    The occurrences of a rule are numbered from zero (its start). The due
+    occurrences are logged as transactions by the scheduler (see
+    DatabaseClient.materialize_recurring()) and the future occurrences are
+    only calculated when needed (see core.recurrence).
+    """
+
+    id = fields.UUIDField(primary_key=True)
+    """The rule's unique identifier encoded as UUID4."""
+
+    account: fields.ForeignKeyRelation[FinancialAccount] = fields.ForeignKeyField(
+        "models.FinancialAccount", related_name="recurring_rules"
+    )
+    """The account that the transactions are logged in."""
+
+    user: fields.ForeignKeyRelation[User] = fields.ForeignKeyField("models.User", related_name="recurring_rules")
+    """The user who owns the account of this rule."""
+
+    category: fields.ForeignKeyNullableRelation[Category] = fields.ForeignKeyField(
+        "models.Category",
+        related_name="recurring_rules",
+        null=True,
+        default=None,
+        on_delete=fields.SET_NULL,
+    )
+    """The category of the transactions, if any."""
+
+    amount = fields.IntField()
+    """The amount of the transactions in minor units format."""
+
+    description = fields.TextField(
+        validators=[
+            validators.MinLengthValidator(constraints.TRANSACTION_DESCRIPTION_MIN_LENGTH),
+            validators.MaxLengthValidator(constraints.TRANSACTION_DESCRIPTION_MAX_LENGTH),
+        ],
+        null=True,
+        default=None,
+    )
+    """The description of the transactions."""
+
+    frequency = fields.IntEnumField(Frequency)
+    """The unit in which the rule repeats."""
+
+    interval = fields.IntField(default=1)
+    """The number of frequency units between the occurrences e.g. 2 with weekly frequency for fortnightly."""
+
+    start = fields.DatetimeField()
+    """The date and time of the first occurrence."""
+
+    until = fields.DatetimeField(null=True, default=None)
+    """The time after which the rule does not occur, if any."""
+
+    count = fields.IntField(null=True, default=None)
+    """The total number of occurrences of the rule, if limited."""
+
+    occurrences = fields.IntField(default=0)
+    """The number of occurrences logged as transactions so far."""
+
+    next_date = fields.DatetimeField(null=True)
+    """The date of next occurrence to be logged. None if the rule has no more occurrences."""
+
+    class Meta:  # type: ignore
+        # The scheduler reads the rules in order of their next occurrence.
+        indexes = (
+            Index(fields=("next_date",), name="recurringrule_next_date"),
+            Index(fields=("account_id",), name="recurringrule_account"),
+        )
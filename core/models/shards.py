@@ -0,0 +1,38 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from tortoise import Model, fields
+from core.models import User
+
+__all__ = (
+    "ShardAssignment",
+)
+
+
+class ShardAssignment(Model):
+    """Represents the database shard that a user's data is stored in.
+
+    Assignments are stored in the primary database and form the directory
+    used to route the requests of a user to their shard (see core.sharding).
+    Users without an assignment are stored in the primary database (shard 0).
+    """
+
+    user: fields.OneToOneRelation[User] = fields.OneToOneField(
+        "models.User",
+        related_name="shard_assignment",
+        primary_key=True,
+    )
+    """The user whose data is stored in the shard."""
+
+    shard = fields.IntField()
+    """The number of shard that the user's data is stored in."""
+
+    sync_floor = fields.BigIntField(default=0)
+    """The change log sequence number before which the user's changes are unavailable.
+
+    The sequence numbers are specific to each shard. When the user is
+    moved to another shard, this is set to a number greater than all
+    sequence numbers that the user's clients may have seen so that the
+    clients synchronize all data again.
+    """
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from tortoise import Model, fields, validators
-from core.models import constraints, FinancialAccount
+from tortoise.indexes import Index
+from core.models import constraints, User, FinancialAccount, Category
 
 __all__ = (
     "Transaction",
@@ -21,6 +22,23 @@ class Transaction(Model):
     )
     """The account that this transaction is performed against."""
 
+    user: fields.ForeignKeyRelation[User] = fields.ForeignKeyField("models.User", related_name="transactions")
+    """The user who owns the account of this transaction.
+
+    This is the same as the account's user. It is stored on the transaction
+    so that the user's transactions across all accounts can be listed using
+    a single index.
+    """
+
+    category: fields.ForeignKeyNullableRelation[Category] = fields.ForeignKeyField(
+        "models.Category",
+        related_name="transactions",
+        null=True,
+        default=None,
+        on_delete=fields.SET_NULL,
+    )
+    """The category of this transaction, if any."""
+
     amount = fields.IntField()
     """The transaction amount in minor units format (currency decimals assumed 2).
 
@@ -41,3 +59,24 @@ class Transaction(Model):
 
     date = fields.DatetimeField(auto_now_add=True)
     """The date and time when this transaction was performed."""
+
+    external_id = fields.TextField(null=True, default=None)
+    """The identifier of this transaction in the bank statement it was imported from, if any.
+
+    This is used to skip the already imported transactions when the same
+    or an overlapping statement is imported again (see core.statements).
+    """
+
+    class Meta:  # type: ignore
+        # Listing transactions filters on the account and then either reads
+        # the transactions in order of date or filters by amount, category
+        # or description prefix. The user's feed reads them in order of date.
+        # Importing statements looks up the already imported transactions.
+        indexes = (
+            Index(fields=("account_id", "date", "id"), name="transaction_account_date"),
+            Index(fields=("user_id", "date", "id"), name="transaction_user_date"),
+            Index(fields=("account_id", "amount"), name="transaction_account_amount"),
+            Index(fields=("account_id", "category_id", "date"), name="transaction_account_category"),
+            Index(fields=("account_id", "description"), name="transaction_account_description"),
+            Index(fields=("account_id", "external_id"), name="transaction_account_external"),
+        )
@@ -42,6 +42,14 @@ class User(Model):
     separately either manually or using Pydantic models in core.schemas.
     """
 
+    password_digest = fields.CharField(max_length=64, null=True, default=None)
+    """The digest of the user's password (see core.utils.password_digest()).
+
+    This is used to verify the password on sign in without decrypting
+    the password. It is None for the users created before this field was
+    added until they sign in.
+    """
+
     token = fields.BinaryField(default=lambda: utils.fernet_encrypt(utils.generate_user_token()))
     """The user's unique authorization token.
 
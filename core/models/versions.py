@@ -0,0 +1,26 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from tortoise import Model, fields
+
+__all__ = (
+    "DataVersion",
+)
+
+
+class DataVersion(Model):
+    """Represents the data version of a user or financial account.
+
+    The version is incremented in the transaction of every write to the
+    data of the user or account (see DatabaseClient.bump_version()). It
+    is stored in the database so that all processes serving the API see
+    the same versions. Users and accounts without a version row are at
+    version zero.
+    """
+
+    key = fields.UUIDField(primary_key=True)
+    """The ID of the user or account."""
+
+    version = fields.BigIntField(default=0)
+    """The data version."""
@@ -0,0 +1,172 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Iterator, Sequence
+from array import array
+from tortoise.backends.base.client import BaseDBAsyncClient
+from core.models import constraints
+from core import models
+
+import bisect
+import csv
+import datetime
+import itertools
+import operator
+import re
+
+__all__ = (
+    "ExchangeRates",
+    "read_rates_file",
+    "import_rates",
+)
+
+_CURRENCY_CODE = re.compile(constraints.CURRENCY_CODE_PATTERN)
+
+# The number of rates inserted per query by import_rates().
+_IMPORT_BATCH_SIZE = 1000
+
+
+def read_rates_file(path: str) -> Iterator[tuple[str, datetime.date, float]]:
+    """Lazily reads the exchange rates from the given CSV file.
+
+    The file must have ``date``, ``currency`` and ``rate`` columns (in
+    any order) with dates in YYYY-MM-DD format. Each rate is the number
+    of units of the currency per unit of the base currency. The rates
+    are yielded as tuples of currency, date and rate.
+
+    ValueError is raised for invalid rows.
+    """
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+
+        for line, row in enumerate(reader, 2):
+            try:
+                currency = row["currency"].strip().upper()
+                date = datetime.date.fromisoformat(row["date"].strip())
+                rate = float(row["rate"])
+            except (KeyError, AttributeError, ValueError) as e:
+                raise ValueError(f"Invalid exchange rate at line {line}: {e}") from None
+
+            if not _CURRENCY_CODE.match(currency) or not rate > 0:
+                raise ValueError(f"Invalid exchange rate at line {line}")
+
+            yield currency, date, rate
+
+async def import_rates(rates: Iterator[tuple[str, datetime.date, float]], *, using_db: BaseDBAsyncClient | None = None) -> int:
+    """Stores the given exchange rates in the database.
+
+    The existing rates of the same currencies and dates are replaced.
+    The rates are inserted in batches so that the file is not loaded in
+    memory at once. Returns the number of imported rates.
+    """
+    imported = 0
+
+    while batch := list(itertools.islice(rates, _IMPORT_BATCH_SIZE)):
+        await models.ExchangeRate.bulk_create(
+            [models.ExchangeRate(currency=c, date=d, rate=r) for c, d, r in batch],
+            on_conflict=["currency", "date"],
+            update_fields=["rate"],
+            using_db=using_db,
+        )
+        imported += len(batch)
+
+    return imported
+
+
+class ExchangeRates:
+    """The exchange rates table cached in memory.
+
+    The rates of each currency are kept in two parallel arrays of dates
+    (as ordinals) and rates sorted by date. A rate applies from its date
+    until the next rate of the currency; dates before the first rate use
+    the first rate.
+
+    Parameters
+    ----------
+    base: :class:`str`
+        The currency in which the rates are given. Its rate is always 1.
+    """
+
+    __slots__ = (
+        "base",
+        "_tables",
+    )
+
+    def __init__(self, base: str) -> None:
+        self.base = base
+        self._tables: dict[str, tuple[array[int], array[float]]] = {}
+
+    async def load(self, client: BaseDBAsyncClient | None = None) -> int:
+        """Loads the rates from the database, replacing the cached ones.
+
+        Returns the number of loaded rates.
+        """
+        rows = await models.ExchangeRate.all().using_db(client).order_by("currency", "date").values_list("currency", "date", "rate")
+        tables: dict[str, tuple[array[int], array[float]]] = {}
+
+        for currency, group in itertools.groupby(rows, key=operator.itemgetter(0)):
+            dates, rates = array("l"), array("d")
+            for _, date, rate in group:
+                dates.append(date.toordinal())
+                rates.append(rate)
+            tables[currency] = (dates, rates)
+
+        self._tables = tables
+        return len(rows)
+
+    def has(self, currency: str) -> bool:
+        """Whether the rates of the given currency are known."""
+        return currency == self.base or currency in self._tables
+
+    def rate(self, currency: str, date: datetime.date) -> float:
+        """Returns the rate of the given currency on the given date.
+
+        KeyError is raised if the currency's rates are not known.
+        """
+        if currency == self.base:
+            return 1.0
+
+        dates, rates = self._tables[currency]
+        return rates[max(bisect.bisect_right(dates, date.toordinal()) - 1, 0)]
+
+    def series(self, currency: str, start: datetime.date, days: int) -> array[float]:
+        """Returns the rates of the given currency for each day starting from the given date.
+
+        The rates are found in a single pass over the currency's rates
+        instead of searching them for each day. KeyError is raised if the
+        currency's rates are not known.
+        """
+        if currency == self.base:
+            return array("d", [1.0]) * days
+
+        dates, rates = self._tables[currency]
+        index = max(bisect.bisect_right(dates, start.toordinal()) - 1, 0)
+        result = array("d")
+
+        for day in range(start.toordinal(), start.toordinal() + days):
+            while index + 1 < len(dates) and dates[index + 1] <= day:
+                index += 1
+            result.append(rates[index])
+
+        return result
+
+    def convert(self, amount: int, source: str, target: str, date: datetime.date) -> int:
+        """Converts the given amount (in minor units) between the currencies using the rates on the given date."""
+        if source == target:
+            return amount
+
+        return round(amount * self.rate(target, date) / self.rate(source, date))
+
+    def convert_series(self, amounts: Sequence[int], source: str, target: str, start: datetime.date) -> array[int]:
+        """Converts the given daily amounts (in minor units) between the currencies.
+
+        The amounts are of consecutive days starting from the given date
+        and each is converted using the rates of its day. The whole array
+        is converted at once using the rate series of both currencies.
+        """
+        if source == target:
+            return array("q", amounts)
+
+        factors = map(operator.truediv, self.series(target, start, len(amounts)), self.series(source, start, len(amounts)))
+        return array("q", map(round, map(operator.mul, amounts, factors)))
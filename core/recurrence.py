@@ -0,0 +1,63 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Iterator
+from core import models
+
+import calendar
+import datetime
+
+__all__ = (
+    "occurrence_date",
+    "next_occurrence",
+    "iter_occurrences",
+)
+
+
+def _add_months(date: datetime.datetime, months: int) -> datetime.datetime:
+    month = date.month - 1 + months
+    year = date.year + month // 12
+    month = month % 12 + 1
+    return date.replace(year=year, month=month, day=min(date.day, calendar.monthrange(year, month)[1]))
+
+def occurrence_date(rule: models.RecurringRule, index: int) -> datetime.datetime:
+    """Returns the date of the given occurrence (numbered from zero) of the rule.
+
+    Each date is calculated from the rule's start so monthly rules starting
+    on 31st fall on the last day of shorter months and on 31st again after
+    them.
+    """
+    step = index * rule.interval
+
+    if rule.frequency == models.Frequency.DAILY:
+        return rule.start + datetime.timedelta(days=step)
+    if rule.frequency == models.Frequency.WEEKLY:
+        return rule.start + datetime.timedelta(weeks=step)
+    if rule.frequency == models.Frequency.MONTHLY:
+        return _add_months(rule.start, step)
+
+    return _add_months(rule.start, step * 12)
+
+def next_occurrence(rule: models.RecurringRule, index: int) -> datetime.datetime | None:
+    """Returns the date of the given occurrence, or None if the rule ends before it.
+
+    The rule ends after its until time or count of occurrences.
+    """
+    if rule.count is not None and index >= rule.count:
+        return None
+
+    date = occurrence_date(rule, index)
+    return None if rule.until is not None and date > rule.until else date
+
+def iter_occurrences(rule: models.RecurringRule, first: int, end: datetime.datetime) -> Iterator[tuple[int, datetime.datetime]]:
+    """Lazily yields the occurrences of the rule dated at or before the given time.
+
+    The occurrences starting from the given one are yielded as tuples
+    of the occurrence number and date.
+    """
+    index = first
+
+    while (date := next_occurrence(rule, index)) is not None and date <= end:
+        yield index, date
+        index += 1
@@ -0,0 +1,251 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Hashable
+from multiprocessing.pool import Pool
+from array import array
+from enum import Enum
+from core.datastructures import LRUCache
+
+import asyncio
+import datetime
+import multiprocessing
+import statistics
+
+__all__ = (
+    "ReportType",
+    "ReportExecutor",
+    "ReportTimeout",
+)
+
+
+class ReportType(str, Enum):
+    """An enum representing the reports that can be generated for an account."""
+
+    PERCENTILES = "percentiles"
+    """Percentiles of the transaction amounts."""
+
+    MOVING_AVERAGE = "moving-average"
+    """Moving average of the daily net amounts."""
+
+    MONTHLY = "monthly"
+    """Income and expense totals for each month across all years."""
+
+
+class ReportTimeout(Exception):
+    """Raised when a report takes longer than the allowed time to generate."""
+
+
+class _PoolRecycled(Exception):
+    # Set on the reports whose worker pool was terminated to time out
+    # another report. These reports are submitted again.
+    pass
+
+
+# Report implementations. These are executed in worker processes so they
+# must be top level functions that only operate on the (picklable) column
+# data and parameters passed to them.
+
+def _filter_kind(amounts: array[int], kind: str) -> list[int]:
+    if kind == "income":
+        return [a for a in amounts if a > 0]
+    if kind == "expense":
+        return [-a for a in amounts if a < 0]
+    return list(amounts)
+
+def _percentiles(dates: array[float], amounts: array[int], params: dict[str, Any]) -> dict[str, Any]:
+    values = _filter_kind(amounts, params["kind"])
+
+    if len(values) < 2:
+        return {"count": len(values), "percentiles": {}}
+
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {
+        "count": len(values),
+        "percentiles": {str(p): cuts[p - 1] for p in params["percentiles"]},
+    }
+
+def _moving_average(dates: array[float], amounts: array[int], params: dict[str, Any]) -> dict[str, Any]:
+    window: int = params["window"]
+    totals: dict[datetime.date, int] = {}
+
+    for ts, amount in zip(dates, amounts):
+        day = datetime.datetime.fromtimestamp(ts, datetime.timezone.utc).date()
+        totals[day] = totals.get(day, 0) + amount
+
+    if not totals:
+        return {"window": window, "series": []}
+
+    start = min(totals)
+    days = (max(totals) - start).days + 1
+    daily = [totals.get(start + datetime.timedelta(days=i), 0) for i in range(days)]
+
+    series = []
+    running = 0
+
+    for i, value in enumerate(daily):
+        running += value
+        if i >= window:
+            running -= daily[i - window]
+        series.append({
+            "date": (start + datetime.timedelta(days=i)).isoformat(),
+            "average": running / min(i + 1, window),
+        })
+
+    return {"window": window, "series": series}
+
+def _monthly(dates: array[float], amounts: array[int], params: dict[str, Any]) -> dict[str, Any]:
+    months: dict[str, list[int]] = {}
+
+    for ts, amount in zip(dates, amounts):
+        key = datetime.datetime.fromtimestamp(ts, datetime.timezone.utc).strftime("%Y-%m")
+        totals = months.setdefault(key, [0, 0])
+        totals[0 if amount > 0 else 1] += amount
+
+    return {
+        "months": [
+            {"month": key, "income": income, "expense": expense}
+            for key, (income, expense) in sorted(months.items())
+        ]
+    }
+
+_REPORTS: dict[ReportType, Callable[[array[float], array[int], dict[str, Any]], dict[str, Any]]] = {
+    ReportType.PERCENTILES: _percentiles,
+    ReportType.MOVING_AVERAGE: _moving_average,
+    ReportType.MONTHLY: _monthly,
+}
+
+def _run_report(report: ReportType, dates: array[float], amounts: array[int], params: dict[str, Any]) -> dict[str, Any]:
+    return _REPORTS[report](dates, amounts, params)
+
+
+class ReportExecutor:
+    """Executes CPU bound reports outside of the event loop.
+
+    Report generation can take considerable time for accounts with large
+    transaction history. Running it on the event loop would block every
+    other request so reports are shipped to a bounded pool of worker
+    processes instead.
+
+    Each report is given ``timeout`` seconds to complete, after which
+    :class:`ReportTimeout` is raised. Results are cached by the version
+    of the account's data and report parameters.
+
+    Parameters
+    ----------
+    max_workers: :class:`int`
+        The maximum number of worker processes.
+    timeout: :class:`int`
+        The number of seconds after which a report is timed out.
+    cache_size: :class:`int`
+        The maximum number of report results kept in cache.
+    """
+
+    def __init__(self, max_workers: int, timeout: int, cache_size: int) -> None:
+        self._max_workers = max_workers
+        self._timeout = timeout
+        self._cache = LRUCache[tuple[Any, ...], dict[str, Any]](cache_size)
+
+        # The pool is started on first report. The running reports of the
+        # pool are tracked so that they can be submitted again when the
+        # pool is terminated.
+        self._pool: Pool | None = None
+        self._pending: set[asyncio.Future[dict[str, Any]]] = set()
+
+        # Bounds the number of reports waiting for a worker so that a
+        # burst of report requests does not queue unbounded work. A slot
+        # is held until the report's worker is done with it.
+        self._slots = asyncio.Semaphore(max_workers * 2)
+
+    def _submit(self, report: ReportType, dates: array[float], amounts: array[int], params: dict[str, Any]) -> asyncio.Future[dict[str, Any]]:
+        if self._pool is None:
+            self._pool = multiprocessing.get_context("spawn").Pool(self._max_workers)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        pending = self._pending
+        pending.add(future)
+        future.add_done_callback(pending.discard)
+
+        def set_result(result: dict[str, Any]) -> None:
+            if not future.done():
+                future.set_result(result)
+
+        def set_exception(exc: BaseException) -> None:
+            if not future.done():
+                future.set_exception(exc)
+
+        # The callbacks are called from the pool's result handler thread.
+        self._pool.apply_async(
+            _run_report,
+            (report, dates, amounts, params),
+            callback=lambda result: loop.call_soon_threadsafe(set_result, result),
+            error_callback=lambda exc: loop.call_soon_threadsafe(set_exception, exc),
+        )
+        return future
+
+    async def _recycle(self) -> None:
+        # A running report cannot be cancelled so the pool is terminated,
+        # killing its workers, and a new one is started on next report.
+        pool, pending = self._pool, self._pending
+        self._pool, self._pending = None, set()
+
+        for future in pending:
+            if not future.done():
+                future.set_exception(_PoolRecycled())
+
+        if pool is not None:
+            await asyncio.to_thread(pool.terminate)
+
+    async def run(
+        self,
+        report: ReportType,
+        version: Hashable,
+        params: dict[str, Any],
+        load_columns: Callable[[], Awaitable[tuple[array[float], array[int]]]],
+    ) -> dict[str, Any]:
+        """Generates a report.
+
+        ``version`` identifies the version of account's data (see
+        DatabaseClient.get_version()). If the report is not cached
+        for this version and parameters, ``load_columns`` is called
+        to load the columns for the report. It must return the POSIX
+        timestamps and amounts of account's transactions, both in the
+        same order.
+
+        If the report does not complete in time, its worker is killed
+        and :class:`ReportTimeout` is raised. The other reports running
+        in the worker pool are restarted in a new pool.
+        """
+        key = (version, report, tuple(sorted(params.items())))
+        result = self._cache.get(key)
+
+        if result is not None:
+            return result
+
+        dates, amounts = await load_columns()
+
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self._timeout
+
+            while True:
+                try:
+                    result = await asyncio.wait_for(self._submit(report, dates, amounts, params), deadline - loop.time())
+                except _PoolRecycled:
+                    continue
+                except asyncio.TimeoutError:
+                    await self._recycle()
+                    raise ReportTimeout(f"Report {report.value!r} did not complete in {self._timeout} seconds.") from None
+
+                break
+
+        self._cache.insert(key, result)
+        return result
+
+    def close(self) -> None:
+        """Shuts down the worker processes."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
@@ -0,0 +1,46 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Any
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+import orjson
+import uuid
+
+__all__ = (
+    "ORJSONResponse",
+    "dumps",
+)
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    if isinstance(obj, uuid.UUID):
+        # Subclasses of UUID (e.g. those returned by asyncpg) are not
+        # serialized natively by orjson.
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps(content: Any) -> bytes:
+    """Serializes the given content to JSON in the same way as :class:`ORJSONResponse`."""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response that serializes the content using orjson.
+
+    This response is intended for trusted data (e.g. the dictionaries
+    returned by the DatabaseClient.fetch_* methods, which are built from
+    the database rows in the format of the API models). The content is
+    serialized as-is without running Pydantic validation. API models, if
+    any, are serialized from their attributes.
+
+    UTC datetimes are serialized with a ``Z`` suffix so that the output
+    matches that of Pydantic.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
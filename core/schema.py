@@ -0,0 +1,111 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.transactions import in_transaction
+from tortoise.utils import generate_schema_for_client
+from core.search import create_search_index
+from core.archive import update_archive
+
+__all__ = (
+    "prepare_schema",
+)
+
+# Columns added to models after their tables were first created. Tortoise
+# only creates the missing tables so these columns are added to existing
+# tables here. Each entry is the table, column, column definition for
+# each dialect and the query filling the column for existing rows (if any).
+_ADDED_COLUMNS: list[tuple[str, str, dict[str, str], str | None]] = [
+    (
+        "transaction",
+        "user_id",
+        {
+            "sqlite": 'CHAR(36) REFERENCES "user" ("id") ON DELETE CASCADE',
+            "postgres": 'UUID REFERENCES "user" ("id") ON DELETE CASCADE',
+        },
+        'UPDATE "transaction" SET "user_id" = '
+        '(SELECT "user_id" FROM "financialaccount" WHERE "financialaccount"."id" = "transaction"."account_id")',
+    ),
+    (
+        "transaction",
+        "category_id",
+        {
+            # PostgreSQL cannot reference the category table as it is
+            # created after the columns are added. The transactions of a
+            # deleted category are uncategorized by the route instead.
+            "sqlite": 'CHAR(36) REFERENCES "category" ("id") ON DELETE SET NULL',
+            "postgres": "UUID",
+        },
+        None,
+    ),
+    (
+        "financialaccount",
+        "currency",
+        {
+            "sqlite": "VARCHAR(3) NOT NULL DEFAULT 'USD'",
+            "postgres": "VARCHAR(3) NOT NULL DEFAULT 'USD'",
+        },
+        None,
+    ),
+    (
+        "transaction",
+        "external_id",
+        {
+            "sqlite": "TEXT",
+            "postgres": "TEXT",
+        },
+        None,
+    ),
+    (
+        "user",
+        "password_digest",
+        {
+            "sqlite": "VARCHAR(64)",
+            "postgres": "VARCHAR(64)",
+        },
+        None,
+    ),
+]
+
+
+async def _columns(client: BaseDBAsyncClient, table: str) -> set[str]:
+    if client.capabilities.dialect == "sqlite":
+        _, rows = await client.execute_query(f'PRAGMA table_info("{table}")')
+        return {row["name"] for row in rows}
+
+    _, rows = await client.execute_query(
+        "SELECT column_name FROM information_schema.columns WHERE table_name = $1",
+        [table],
+    )
+    return {row["column_name"] for row in rows}
+
+async def _add_columns(client: BaseDBAsyncClient) -> None:
+    for table, column, definitions, backfill in _ADDED_COLUMNS:
+        columns = await _columns(client, table)
+
+        # The table is created with the column if it does not exist.
+        if not columns or column in columns:
+            continue
+
+        async with in_transaction() as conn:
+            await conn.execute_script(
+                f'ALTER TABLE "{table}" ADD COLUMN "{column}" {definitions[client.capabilities.dialect]}'
+            )
+            if backfill:
+                await conn.execute_script(backfill)
+
+async def prepare_schema(client: BaseDBAsyncClient) -> None:
+    """Creates or updates the schema of the given database.
+
+    The missing tables and indexes are created and the columns added to
+    models after their tables were created are added to the existing
+    tables. The search index is also created (see core.search) and the
+    archive, if any, is updated with the added columns (see core.archive).
+
+    The given client must be the default connection in current context.
+    """
+    await _add_columns(client)
+    await generate_schema_for_client(client, safe=True)
+    await create_search_index(client)
+    await update_archive(client)
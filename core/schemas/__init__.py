@@ -1,3 +1,11 @@
 from core.schemas.users import *
 from core.schemas.accounts import *
 from core.schemas.transactions import *
+from core.schemas.categories import *
+from core.schemas.recurring import *
+from core.schemas.networth import *
+from core.schemas.reports import *
+from core.schemas.sync import *
+from core.schemas.batch import *
+from core.schemas.admin import *
+from core.schemas.statements import *
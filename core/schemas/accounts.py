@@ -47,6 +47,7 @@ class FinancialAccount(APIModel):
     )
     type: AccountType = Field(default=AccountType.CHECKING)
     created_at: AwareDatetime = Field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
+    currency: str = Field(default="USD", pattern=constraints.CURRENCY_CODE_PATTERN)
     currency_decimals: int = Field(default=2)
 
     def to_db_model(self) -> DBFinancialAccount:
@@ -62,6 +63,7 @@ class FinancialAccount(APIModel):
             description=db_model.description,
             created_at=db_model.created_at,
             type=db_model.type,
+            currency=db_model.currency,
             currency_decimals=db_model.currency_decimals,
         )
 
@@ -81,6 +83,7 @@ class CreateAccountJSON(APIModel):
         default=None,
     )
     type: AccountType = Field(default=AccountType.CHECKING)
+    currency: str = Field(default="USD", pattern=constraints.CURRENCY_CODE_PATTERN)
     # currency_decimals: int = Field(default=2)
 
     def to_db_model(self, user: User) -> DBFinancialAccount:
@@ -112,6 +115,7 @@ class EditAccountJSON(APIModel):
         max_length=constraints.ACCOUNT_DESCRIPTION_MAX_LENGTH,
         default=MISSING,
     )
+    currency: str = Field(default=MISSING, pattern=constraints.CURRENCY_CODE_PATTERN)
     # currency_decimals: int = Field(default=MISSING)
 
     def to_dict(self) -> dict[str, Any]:
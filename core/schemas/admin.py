@@ -0,0 +1,50 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from core.schemas.base import APIModel
+
+import datetime
+
+__all__ = (
+    "StartBackupJSON",
+    "BackupStatus",
+    "ReloadRatesResponse",
+)
+
+
+class StartBackupJSON(APIModel):
+    """Pydantic model representing JSON body for the POST /admin/backup or Start Backup endpoint."""
+
+    compress: bool = True
+    """Whether to compress the backups using gzip."""
+
+    verify: bool = True
+    """Whether to verify that the backups can be restored."""
+
+
+class BackupStatus(APIModel):
+    """Pydantic model corresponding to core.backup.BackupProgress.
+
+    For the details of each field in this model, see the documentation
+    of core.backup.BackupProgress object.
+    """
+
+    running: bool
+    files: list[str]
+    files_done: int
+    pages_total: int
+    pages_copied: int
+    restarts: int
+    bytes_written: int
+    verified: bool | None
+    started_at: datetime.datetime
+    finished_at: datetime.datetime | None
+    error: str | None
+
+
+class ReloadRatesResponse(APIModel):
+    """Pydantic model representing JSON body for the POST /admin/rates/reload or Reload Rates endpoint."""
+
+    count: int
+    """The number of exchange rates loaded."""
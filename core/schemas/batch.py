@@ -0,0 +1,51 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Any, Literal
+from pydantic import Field
+from core.schemas.base import APIModel
+from core import config
+
+__all__ = (
+    "BatchSubRequest",
+    "BatchRequestJSON",
+    "BatchSubResponse",
+    "BatchResponse",
+)
+
+
+class BatchSubRequest(APIModel):
+    """Pydantic model representing a sub-request in :class:`BatchRequestJSON`."""
+
+    method: Literal["GET", "POST", "PATCH", "DELETE"]
+    """The HTTP method of the request."""
+
+    path: str = Field(pattern=r"^/")
+    """The path of the request, optionally including the query string."""
+
+    body: Any = None
+    """The JSON body of the request, if any."""
+
+
+class BatchRequestJSON(APIModel):
+    """Pydantic model representing JSON body for the POST /batch or Batch endpoint."""
+
+    requests: list[BatchSubRequest] = Field(min_length=1, max_length=config.BATCH_MAX_REQUESTS)
+
+
+class BatchSubResponse(APIModel):
+    """Pydantic model representing the response of a sub-request in :class:`BatchResponse`."""
+
+    status: int
+    """The HTTP status code of the response."""
+
+    body: Any
+    """The JSON body of the response, or null if the response has no body."""
+
+
+class BatchResponse(APIModel):
+    """Pydantic model representing JSON body for the POST /batch or Batch endpoint."""
+
+    responses: list[BatchSubResponse]
+    """The responses in the order of sub-requests."""
@@ -0,0 +1,139 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Self, Any
+from pydantic import UUID4, Field
+from core.schemas.base import APIModel
+from core.utils import MISSING
+from core.models import (
+    constraints,
+    Category as DBCategory,
+    User,
+)
+
+import uuid
+
+__all__ = (
+    "Category",
+    "CreateCategoryJSON",
+    "EditCategoryJSON",
+    "CategoryTotal",
+    "Budget",
+    "BudgetStatus",
+    "SetBudgetJSON",
+)
+
+
+class Category(APIModel):
+    """Pydantic model corresponding to core.models.Category.
+
+    For the details of each field in this model, see the documentation
+    of core.models.Category object.
+    """
+
+    id: UUID4
+    user_id: UUID4
+    name: str = Field(
+        min_length=constraints.CATEGORY_NAME_MIN_LENGTH,
+        max_length=constraints.CATEGORY_NAME_MAX_LENGTH,
+    )
+
+    @classmethod
+    def from_db_model(cls, db_model: DBCategory) -> Self:
+        return cls(
+            id=db_model.id,
+            user_id=db_model.user_id,  # type: ignore
+            name=db_model.name,
+        )
+
+
+class CreateCategoryJSON(APIModel):
+    """Pydantic model representing JSON body for the POST /categories or Create Category endpoint.
+
+    The fields in this schema are defined by the category model.
+    """
+    name: str = Field(
+        min_length=constraints.CATEGORY_NAME_MIN_LENGTH,
+        max_length=constraints.CATEGORY_NAME_MAX_LENGTH,
+    )
+
+    def to_db_model(self, user: User) -> DBCategory:
+        """Creates models.Category from the given data.
+
+        Parameters
+        ----------
+        user: :class:`models.User`
+            The user that this category belongs to.
+        """
+        return DBCategory(id=uuid.uuid4(), user=user, name=self.name)
+
+
+class EditCategoryJSON(APIModel):
+    """Pydantic model representing JSON body for the PATCH /categories/{category_id} or Edit Category endpoint.
+
+    The fields in this schema are defined by the category model.
+    """
+    name: str = Field(
+        min_length=constraints.CATEGORY_NAME_MIN_LENGTH,
+        max_length=constraints.CATEGORY_NAME_MAX_LENGTH,
+        default=MISSING,
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the dictionary that can be used to update the model in database"""
+        return self.model_dump(exclude_defaults=True)
+
+
+class CategoryTotal(APIModel):
+    """Pydantic model corresponding to core.models.CategoryRollup.
+
+    Represents the totals of an account's transactions in a category
+    in the month returned by GET /accounts/{account_id}/categories.
+    """
+
+    category_id: UUID4
+    income: int
+    """The sum of incomes in minor units."""
+
+    expenses: int
+    """The sum of expenses in minor units, as a positive number."""
+
+    count: int
+    """The number of transactions."""
+
+
+class Budget(APIModel):
+    """Pydantic model corresponding to core.models.Budget.
+
+    For the details of each field in this model, see the documentation
+    of core.models.Budget object.
+    """
+
+    id: UUID4
+    account_id: UUID4
+    category_id: UUID4
+    monthly_limit: int
+
+
+class BudgetStatus(Budget):
+    """Pydantic model representing a budget along with its spending in a month.
+
+    Returned by GET /accounts/{account_id}/budgets endpoint.
+    """
+
+    spent: int
+    """The expenses in the budget's category in the month, in minor units."""
+
+    remaining: int
+    """The amount that can still be spent in the month. Negative if the limit was exceeded."""
+
+
+class SetBudgetJSON(APIModel):
+    """
+    Pydantic model representing JSON body for the PUT /accounts/{account_id}/budgets/{category_id}
+    or Set Budget endpoint.
+    """
+
+    monthly_limit: int = Field(gt=0)
+    """The maximum expenses per month in minor units."""
@@ -0,0 +1,67 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from pydantic import UUID4
+from core.schemas.base import APIModel
+
+import datetime
+
+__all__ = (
+    "AccountNetWorth",
+    "NetWorthResponse",
+    "NetWorthPoint",
+    "NetWorthHistoryResponse",
+)
+
+
+class AccountNetWorth(APIModel):
+    """Pydantic model representing an account's balance in the net worth."""
+
+    account_id: UUID4
+    currency: str
+    """The account's currency."""
+
+    balance: int
+    """The balance in the account's currency, in minor units."""
+
+    converted: int
+    """The balance in the net worth's currency, in minor units."""
+
+
+class NetWorthResponse(APIModel):
+    """
+    Pydantic model representing JSON body for the GET /net-worth
+    or Net Worth endpoint.
+    """
+
+    currency: str
+    """The currency in which the net worth is calculated."""
+
+    date: datetime.date
+    """The date of exchange rates used for conversion."""
+
+    total: int
+    """The sum of converted balances of all accounts, in minor units."""
+
+    accounts: list[AccountNetWorth]
+
+
+class NetWorthPoint(APIModel):
+    """Pydantic model representing the net worth at the end of a day."""
+
+    date: datetime.date
+    balance: int
+
+
+class NetWorthHistoryResponse(APIModel):
+    """
+    Pydantic model representing JSON body for the GET /net-worth/history
+    or Net Worth History endpoint.
+    """
+
+    currency: str
+    """The currency in which the net worth is calculated."""
+
+    points: list[NetWorthPoint]
+    """The net worth at the end of each day (in UTC), oldest first."""
@@ -0,0 +1,167 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Self, Any
+from pydantic import UUID4, AwareDatetime, Field, field_validator
+from core.schemas.base import APIModel
+from core.utils import MISSING
+from core.recurrence import next_occurrence
+from core.models import (
+    constraints,
+    RecurringRule as DBRecurringRule,
+    FinancialAccount as DBFinancialAccount,
+    Frequency as Frequency,  # exported
+)
+
+import datetime
+import uuid
+
+__all__ = (
+    "RecurringRule",
+    "Frequency",
+    "CreateRecurringRuleJSON",
+    "EditRecurringRuleJSON",
+    "ForecastOccurrence",
+    "ForecastResponse",
+)
+
+
+class RecurringRule(APIModel):
+    """Pydantic model corresponding to core.models.RecurringRule.
+
+    For the details of each field in this model, see the documentation
+    of core.models.RecurringRule object.
+    """
+
+    id: UUID4
+    account_id: UUID4
+    category_id: UUID4 | None = None
+    amount: int
+    description: str | None = None
+    frequency: Frequency
+    interval: int
+    start: AwareDatetime
+    until: AwareDatetime | None = None
+    count: int | None = None
+    occurrences: int
+    next_date: AwareDatetime | None = None
+
+    @classmethod
+    def from_db_model(cls, db_model: DBRecurringRule) -> Self:
+        return cls(
+            id=db_model.id,
+            account_id=db_model.account_id,  # type: ignore
+            category_id=db_model.category_id,  # type: ignore
+            amount=db_model.amount,
+            description=db_model.description,
+            frequency=db_model.frequency,
+            interval=db_model.interval,
+            start=db_model.start,
+            until=db_model.until,
+            count=db_model.count,
+            occurrences=db_model.occurrences,
+            next_date=db_model.next_date,
+        )
+
+
+class CreateRecurringRuleJSON(APIModel):
+    """
+    Pydantic model representing JSON body for the POST /accounts/{account_id}/recurring
+    or Create Recurring Rule endpoint.
+
+    The fields in this schema are defined by the recurring rule model.
+    """
+
+    amount: int
+    description: str | None = Field(
+        min_length=constraints.TRANSACTION_DESCRIPTION_MIN_LENGTH,
+        max_length=constraints.TRANSACTION_DESCRIPTION_MAX_LENGTH,
+        default=None,
+    )
+    category_id: UUID4 | None = None
+    frequency: Frequency
+    interval: int = Field(default=1, ge=1, le=constraints.RECURRING_RULE_MAX_INTERVAL)
+    start: AwareDatetime = Field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
+    until: AwareDatetime | None = None
+    count: int | None = Field(default=None, ge=1)
+
+    @field_validator("amount")
+    @classmethod
+    def validate_amount(cls, value: int) -> int:
+        if value == 0:
+            raise ValueError("amount cannot be zero")
+        return value
+
+    def to_db_model(self, account: DBFinancialAccount) -> DBRecurringRule:
+        """Creates models.RecurringRule from the given data.
+
+        Parameters
+        ----------
+        account: :class:`models.FinancialAccount`
+            The account that the rule's transactions are logged in.
+        """
+        data = self.model_dump()
+        data["id"] = uuid.uuid4()
+        data["account_id"] = account.id
+        data["user_id"] = account.user_id  # type: ignore
+        rule = DBRecurringRule(**data)
+        rule.next_date = next_occurrence(rule, 0)
+        return rule
+
+
+class EditRecurringRuleJSON(APIModel):
+    """
+    Pydantic model representing JSON body for the PATCH /accounts/{account_id}/recurring/{rule_id}
+    or Edit Recurring Rule endpoint.
+
+    The changes apply to the occurrences that are not yet logged. The
+    frequency, interval and start of a rule cannot be changed.
+    """
+
+    amount: int = Field(default=MISSING)
+    description: str | None = Field(
+        min_length=constraints.TRANSACTION_DESCRIPTION_MIN_LENGTH,
+        max_length=constraints.TRANSACTION_DESCRIPTION_MAX_LENGTH,
+        default=MISSING,
+    )
+    category_id: UUID4 | None = Field(default=MISSING)
+    until: AwareDatetime | None = Field(default=MISSING)
+    count: int | None = Field(default=MISSING, ge=1)
+
+    @field_validator("amount")
+    @classmethod
+    def validate_amount(cls, value: int) -> int:
+        if value == 0:
+            raise ValueError("amount cannot be zero")
+        return value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the dictionary that can be used to update the model in database"""
+        return self.model_dump(exclude_defaults=True)
+
+
+class ForecastOccurrence(APIModel):
+    """Pydantic model representing a future occurrence of a recurring rule."""
+
+    rule_id: UUID4
+    date: AwareDatetime
+    amount: int
+    description: str | None = None
+    category_id: UUID4 | None = None
+
+
+class ForecastResponse(APIModel):
+    """
+    Pydantic model representing JSON body for the GET /accounts/{account_id}/forecast
+    or Forecast endpoint.
+    """
+
+    balance: int
+    """The current balance in minor units."""
+
+    projected_balance: int
+    """The balance after the occurrences up to the end of forecast, in minor units."""
+
+    occurrences: list[ForecastOccurrence]
+    """The upcoming occurrences, earliest first."""
@@ -0,0 +1,25 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Any
+from core.schemas.base import APIModel
+from core.reports import ReportType as ReportType  # exported
+
+__all__ = (
+    "ReportType",
+    "ReportResponse",
+)
+
+
+class ReportResponse(APIModel):
+    """
+    Pydantic model representing JSON body for the GET /accounts/{account_id}/reports/{report}
+    or Generate Report endpoint.
+    """
+
+    report: ReportType
+    """The type of report generated."""
+
+    result: dict[str, Any]
+    """The report's result. The structure depends upon the type of report."""
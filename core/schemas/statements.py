@@ -0,0 +1,22 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from core.schemas.base import APIModel
+
+__all__ = (
+    "ImportStatementResponse",
+)
+
+
+class ImportStatementResponse(APIModel):
+    """Pydantic model representing JSON body for the POST /accounts/{account_id}/import or Import Statement endpoint."""
+
+    imported: int
+    """The number of transactions logged from the statement."""
+
+    duplicates: int
+    """The number of transactions skipped because they were already imported."""
+
+    skipped: int
+    """The number of transactions skipped because of their zero amount."""
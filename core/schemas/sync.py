@@ -0,0 +1,53 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Any
+from pydantic import UUID4
+from core.schemas.base import APIModel
+from core.models import (
+    EntityType as EntityType,  # exported
+    ChangeType as ChangeType,  # exported
+)
+
+__all__ = (
+    "EntityType",
+    "ChangeType",
+    "Change",
+    "SyncResponse",
+    "SyncCursorResponse",
+)
+
+
+class Change(APIModel):
+    """Pydantic model corresponding to core.models.ChangeLogEntry.
+
+    For the details of each field in this model, see the documentation
+    of core.models.ChangeLogEntry object.
+    """
+
+    sequence: int
+    entity_type: EntityType
+    entity_id: UUID4
+    change_type: ChangeType
+    data: dict[str, Any] | None = None
+
+
+class SyncResponse(APIModel):
+    """Pydantic model representing JSON body for the GET /sync or Sync endpoint."""
+
+    changes: list[Change]
+    """The compacted changes, ordered by their sequence numbers."""
+
+    next: int
+    """The sequence number to pass in ``since`` to fetch the next changes."""
+
+    has_more: bool
+    """Whether there are more changes after ``next``."""
+
+
+class SyncCursorResponse(APIModel):
+    """Pydantic model representing JSON body for the GET /sync/cursor or Get Sync Cursor endpoint."""
+
+    sequence: int
+    """The latest sequence number in change log."""
@@ -21,6 +21,10 @@ __all__ = (
     "LogTransactionJSON",
     "EditTransactionJSON",
     "CountTransactionsResponse",
+    "SearchTransactionsResponse",
+    "TransactionFeedResponse",
+    "AutocompleteSuggestion",
+    "AutocompleteResponse",
 )
 
 
@@ -40,6 +44,7 @@ class Transaction(APIModel):
         default=None,
     )
     date: AwareDatetime = Field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
+    category_id: UUID4 | None = None
 
     @field_validator("amount")
     @classmethod
@@ -51,6 +56,7 @@ class Transaction(APIModel):
     def to_db_model(self, account: DBFinancialAccount) -> DBTransaction:
         data = self.model_dump()
         data["account"] = account
+        data["user_id"] = account.user_id  # type: ignore
         return DBTransaction(**data)
 
     @classmethod
@@ -61,6 +67,7 @@ class Transaction(APIModel):
             amount=db_model.amount,
             description=db_model.description,
             date=db_model.date,
+            category_id=db_model.category_id,  # type: ignore
         )
 
 
@@ -79,6 +86,7 @@ class LogTransactionJSON(APIModel):
         default=None,
     )
     date: AwareDatetime = Field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
+    category_id: UUID4 | None = None
 
     @field_validator("amount")
     @classmethod
@@ -91,6 +99,7 @@ class LogTransactionJSON(APIModel):
         data = self.model_dump()
         data["id"] = uuid.uuid4()
         data["account_id"] = account.id
+        data["user_id"] = account.user_id  # type: ignore
         return DBTransaction(**data)
 
 
@@ -109,6 +118,7 @@ class EditTransactionJSON(APIModel):
         default=MISSING,
     )
     date: AwareDatetime = Field(default=MISSING)
+    category_id: UUID4 | None = Field(default=MISSING)
 
     @field_validator("amount")
     @classmethod
@@ -130,3 +140,40 @@ class CountTransactionsResponse(APIModel):
 
     count: int
     """The number of transactions in the account."""
+
+
+class SearchTransactionsResponse(APIModel):
+    """Pydantic model representing JSON body for the GET /transactions/search or Search Transactions endpoint."""
+
+    transactions: list[Transaction]
+    """The matching transactions, most relevant first."""
+
+    next: str | None = None
+    """The cursor to pass in ``after`` to fetch the next transactions, if any."""
+
+
+class TransactionFeedResponse(APIModel):
+    """Pydantic model representing JSON body for the GET /transactions or Get Feed endpoint."""
+
+    transactions: list[Transaction]
+    """The user's transactions across all accounts, latest first."""
+
+    next: str | None = None
+    """The cursor to pass in ``before`` to fetch the next transactions, if any."""
+
+
+class AutocompleteSuggestion(APIModel):
+    """A transaction description suggested by the GET /autocomplete or Autocomplete endpoint."""
+
+    description: str
+    """The suggested description."""
+
+    count: int
+    """The number of user's transactions having this description."""
+
+
+class AutocompleteResponse(APIModel):
+    """Pydantic model representing JSON body for the GET /autocomplete or Autocomplete endpoint."""
+
+    suggestions: list[AutocompleteSuggestion]
+    """The suggestions, most frequently used first."""
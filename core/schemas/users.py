@@ -12,6 +12,7 @@ from core import utils
 import uuid
 
 __all__ = (
+    "PublicUser",
     "User",
     "CreateUserJSON",
     "GetUserHeader",
@@ -19,6 +20,34 @@ __all__ = (
 )
 
 
+class PublicUser(APIModel):
+    """Pydantic model corresponding to core.models.User without the credentials.
+
+    Unlike core.schemas.User, constructing this model does not require
+    decrypting the password and token so it should be preferred whenever
+    the credentials are not needed by the client.
+    """
+
+    id: UUID4
+    username: str = Field(
+        min_length=constraints.USER_USERNAME_MIN_LENGTH,
+        max_length=constraints.USER_USERNAME_MAX_LENGTH,
+    )
+    display_name: str | None = Field(
+        min_length=constraints.USER_DISPLAY_NAME_MIN_LENGTH,
+        max_length=constraints.USER_DISPLAY_NAME_MAX_LENGTH,
+        default=None,
+    )
+
+    @classmethod
+    def from_db_model(cls, db_model: DBUser) -> Self:
+        return cls(
+            id=db_model.id,
+            username=db_model.username,
+            display_name=db_model.display_name,
+        )
+
+
 class User(APIModel):
     """Pydantic model corresponding to core.models.User.
 
@@ -64,13 +93,24 @@ class User(APIModel):
         return DBUser(**data)
 
     @classmethod
-    def from_db_model(cls, db_model: DBUser) -> Self:
+    def from_db_model(cls, db_model: DBUser, *, password: str = utils.MISSING, token: str = utils.MISSING) -> Self:
+        """Constructs the API model from the given database model.
+
+        Decrypting the credentials is relatively expensive. If the decrypted
+        password or token is already known (e.g. from the request), it should
+        be passed so that only the unknown credentials are decrypted.
+        """
+        if password is utils.MISSING:
+            password = utils.fernet_decrypt(db_model.password)
+        if token is utils.MISSING:
+            token = utils.fernet_decrypt(db_model.token)
+
         return cls(
             id=db_model.id,
             username=db_model.username,
             display_name=db_model.display_name,
-            password=utils.fernet_decrypt(db_model.password),
-            token=utils.fernet_decrypt(db_model.token),
+            password=password,
+            token=token,
         )
 
 
@@ -95,6 +135,7 @@ class CreateUserJSON(APIModel):
     def to_db_model(self) -> DBUser:
         data = self.model_dump()
         data["id"] = uuid.uuid4()
+        data["password_digest"] = utils.password_digest(data["password"])
         data["password"] = utils.fernet_encrypt(data["password"])
         data["token"] = utils.fernet_encrypt(utils.generate_user_token())
         return DBUser(**data)
@@ -132,14 +173,19 @@ class EditUserJSON(APIModel):
     )
     password: str = Field(min_length=constraints.USER_PASSWORD_MIN_LENGTH, default=utils.MISSING)
 
-    def to_dict(self) -> dict[str, Any]:
-        """Returns the dictionary that can be uesd to update the model in database"""
+    def to_dict(self, token: str | None = None) -> dict[str, Any]:
+        """Returns the dictionary that can be uesd to update the model in database
+
+        If password is being changed, a new authorization token is generated. The
+        token parameter can be used to provide this new token instead.
+        """
         data = self.model_dump(exclude_defaults=True)
 
         # If password is changed, reset the authorization token as a
         # security measure.
         if "password" in data:
+            data["password_digest"] = utils.password_digest(data["password"])
             data["password"] = utils.fernet_encrypt(data["password"])
-            data["token"] = utils.fernet_encrypt(utils.generate_user_token())
+            data["token"] = utils.fernet_encrypt(token or utils.generate_user_token())
 
         return data
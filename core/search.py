@@ -0,0 +1,76 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from tortoise.backends.base.client import BaseDBAsyncClient
+from core import models
+
+__all__ = (
+    "SEARCH_TABLE",
+    "create_search_index",
+    "rebuild_search_index",
+    "to_match_query",
+)
+
+SEARCH_TABLE = "transaction_search"
+"""The name of FTS5 table indexing the descriptions of transactions."""
+
+
+def _schema() -> str:
+    table = models.Transaction._meta.db_table
+
+    # The index is an external content table i.e. it only stores the index
+    # and reads the descriptions from transactions table by their rowid.
+    # The triggers keep the index in sync with every write, including the
+    # deletions cascaded from accounts and users.
+    return f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        description,
+        content='{table}',
+        content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2'
+    );
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_insert AFTER INSERT ON "{table}" BEGIN
+        INSERT INTO {SEARCH_TABLE} (rowid, description) VALUES (new.rowid, new.description);
+    END;
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_delete AFTER DELETE ON "{table}" BEGIN
+        INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}, rowid, description) VALUES ('delete', old.rowid, old.description);
+    END;
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_update AFTER UPDATE OF description ON "{table}" BEGIN
+        INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}, rowid, description) VALUES ('delete', old.rowid, old.description);
+        INSERT INTO {SEARCH_TABLE} (rowid, description) VALUES (new.rowid, new.description);
+    END;
+    """
+
+async def create_search_index(client: BaseDBAsyncClient) -> None:
+    """Creates the full text search index of transactions in the given database.
+
+    This must be called after the schema is generated. If the index did
+    not exist, it is built from the existing transactions. Nothing is
+    done for databases other than SQLite.
+    """
+    if client.capabilities.dialect != "sqlite":
+        return
+
+    _, rows = await client.execute_query("SELECT 1 FROM sqlite_master WHERE name = ?", [SEARCH_TABLE])
+    await client.execute_script(_schema())
+
+    if not rows:
+        await rebuild_search_index(client)
+
+async def rebuild_search_index(client: BaseDBAsyncClient) -> None:
+    """Rebuilds the full text search index of transactions in the given database.
+
+    The index refers to transactions by their rowid which may be changed
+    by VACUUM so the index must be rebuilt after vacuuming the database.
+    """
+    if client.capabilities.dialect == "sqlite":
+        await client.execute_script(f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}) VALUES ('rebuild')")
+
+def to_match_query(query: str) -> str:
+    """Converts the search query entered by user to FTS5 query.
+
+    Each word is quoted so that the query syntax characters in user
+    input are matched literally. Transactions must match all words.
+    """
+    return " ".join('"{}"'.format(word.replace('"', '""')) for word in query.split())
@@ -0,0 +1,273 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterator
+from collections import OrderedDict
+from contextvars import ContextVar
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.backends.sqlite import SqliteClient
+from core.schema import prepare_schema
+from core.archive import archive_path
+from core import models
+
+import asyncio
+import contextlib
+import os
+import uuid
+
+__all__ = (
+    "ShardManager",
+    "ShardRouter",
+    "shard_path",
+)
+
+# The shard that the current context (request) is routed to.
+_current_shard: ContextVar[int] = ContextVar("_current_shard", default=0)
+
+# The read-only connection of the shard that the current context is routed to.
+_current_reader: ContextVar[BaseDBAsyncClient | None] = ContextVar("_current_reader", default=None)
+
+
+def shard_path(primary_path: str, shard: int) -> str:
+    """Returns the path of the SQLite database file of the given shard.
+
+    Shard 0 is the primary database. Other shards are stored alongside
+    the primary database e.g. ``db-shard1.sqlite3`` for ``db.sqlite3``.
+    """
+    if shard == 0:
+        return primary_path
+
+    stem, ext = os.path.splitext(primary_path)
+    return f"{stem}-shard{shard}{ext}"
+
+
+class ShardRouter:
+    """Tortoise ORM database router for sharded storage.
+
+    The users and shard assignments (the directory) are always stored in
+    the primary database. While a context is routed to another shard
+    (see :meth:`ShardManager.route`), queries for these models are sent
+    to the ``primary`` connection which is only available in routed
+    contexts. All other queries go to the routed ``default`` connection.
+    """
+
+    def _route(self, model: type[Any]) -> str | None:
+        if _current_shard.get() and model in (models.User, models.ShardAssignment):
+            return "primary"
+        return None
+
+    def db_for_read(self, model: type[Any]) -> str | None:
+        return self._route(model)
+
+    def db_for_write(self, model: type[Any]) -> str | None:
+        return self._route(model)
+
+
+class ShardManager:
+    """Manages the connections to database shards.
+
+    Users' data (accounts, transactions, change log) is split across
+    ``count`` SQLite databases so that writes of different users do
+    not contend for the single writer lock of one database. Shard 0 is
+    the primary database which also stores the users and the directory
+    of shard assignments (see core.models.ShardAssignment).
+
+    Connections to shards are opened on demand. At most ``max_open``
+    connections are kept open, the least recently used ones are closed
+    once they are no longer in use.
+
+    Along with the connection of each shard, a read-only connection is
+    opened that is used for long running reads (see :meth:`reader`) so
+    that these do not wait for (or hold up) the writes on the shard.
+    Similarly, the read-only connection to the archive of a shard (see
+    core.archive) is opened on the first read of archived transactions.
+
+    Parameters
+    ----------
+    primary: :class:`BaseDBAsyncClient`
+        The connection to the primary database.
+    primary_path: :class:`str`
+        The path of the primary database file.
+    count: :class:`int`
+        The number of shards, including the primary database.
+    max_open: :class:`int`
+        The maximum number of idle shard connections kept open.
+    primary_reader: :class:`BaseDBAsyncClient` | None
+        The read-only connection to the primary database. If not
+        provided, the reads are done on the primary connection.
+    """
+
+    def __init__(
+        self,
+        primary: BaseDBAsyncClient,
+        primary_path: str,
+        count: int,
+        max_open: int,
+        primary_reader: BaseDBAsyncClient | None = None,
+    ) -> None:
+        self.primary = primary
+        self.primary_path = primary_path
+        self.primary_reader = primary_reader or primary
+        self.count = count
+        self.max_open = max_open
+        self._clients: OrderedDict[int, BaseDBAsyncClient] = OrderedDict()
+        self._readers: dict[int, BaseDBAsyncClient] = {}
+        self._archives: dict[int, BaseDBAsyncClient] = {}
+        self._users: dict[int, int] = {}
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_url(
+        cls,
+        db_url: str,
+        count: int,
+        max_open: int,
+        primary_reader: BaseDBAsyncClient | None = None,
+    ) -> ShardManager:
+        """Creates the manager for the initialized default connection of the given URL.
+
+        Sharding is only supported for SQLite. For other databases,
+        ``count`` must be 1.
+        """
+        if count > 1 and not db_url.startswith("sqlite://"):
+            raise ValueError("Database sharding is only supported with SQLite")
+
+        return cls(connections.get("default"), db_url.removeprefix("sqlite://"), count, max_open, primary_reader)
+
+    def shard_for_new_user(self, user_id: uuid.UUID) -> int:
+        """Returns the shard in which a new user is stored."""
+        return user_id.int % self.count
+
+    async def _open(self, shard: int) -> BaseDBAsyncClient:
+        # The connection is named "default" so that it can replace the
+        # primary connection in routed contexts (see route()).
+        client = SqliteClient(shard_path(self.primary_path, shard), connection_name="default")
+        await client.create_connection(with_db=True)
+
+        # The schema generator creates the tables of models whose
+        # connection is the given client.
+        token = connections.set("default", client)
+        try:
+            await prepare_schema(client)
+        finally:
+            connections.reset(token)
+
+        # The reader is opened after the schema is generated as it
+        # cannot create the tables.
+        self._readers[shard] = SqliteClient(
+            shard_path(self.primary_path, shard),
+            connection_name="read",
+            query_only="ON",
+        )
+        return client
+
+    async def _close_idle(self) -> None:
+        for shard in list(self._clients):
+            if len(self._clients) <= self.max_open:
+                break
+            if self._users.get(shard, 0) == 0:
+                await self._clients.pop(shard).close()
+                await self._readers.pop(shard).close()
+                if shard in self._archives:
+                    await self._archives.pop(shard).close()
+
+    async def acquire(self, shard: int) -> BaseDBAsyncClient:
+        """Acquires the connection to the given shard.
+
+        The connection must be released using release() once
+        it is no longer used.
+        """
+        if shard == 0:
+            return self.primary
+
+        if not 0 < shard < self.count:
+            raise ValueError(f"Invalid shard {shard}")
+
+        client = self._clients.get(shard)
+
+        if client is None:
+            async with self._lock:
+                client = self._clients.get(shard)
+                if client is None:
+                    client = self._clients[shard] = await self._open(shard)
+
+        self._clients.move_to_end(shard)
+        self._users[shard] = self._users.get(shard, 0) + 1
+        return client
+
+    async def release(self, shard: int) -> None:
+        """Releases the connection acquired by acquire()."""
+        if shard == 0:
+            return
+
+        self._users[shard] -= 1
+
+        if len(self._clients) > self.max_open:
+            await self._close_idle()
+
+    @contextlib.asynccontextmanager
+    async def route(self, shard: int) -> AsyncIterator[BaseDBAsyncClient]:
+        """Routes the queries in the current context to the given shard.
+
+        Within this context manager, the queries (including the transactions
+        started by in_transaction()) are executed on the given shard, except
+        for the queries to users and shard assignments (see :class:`ShardRouter`).
+
+        The connection to the shard is returned.
+        """
+        client = await self.acquire(shard)
+        primary_token = connections.set("primary", self.primary)
+        connection_token = connections.set("default", client)
+        shard_token = _current_shard.set(shard)
+        reader_token = _current_reader.set(self._readers[shard] if shard else self.primary_reader)
+
+        try:
+            yield client
+        finally:
+            _current_reader.reset(reader_token)
+            _current_shard.reset(shard_token)
+            connections.reset(connection_token)
+            connections.reset(primary_token)
+            await self.release(shard)
+
+    def reader(self) -> BaseDBAsyncClient:
+        """Returns the read-only connection of the shard that the current context is routed to.
+
+        The reader must only be used for queries that are fine with not
+        seeing the writes made in the current context (e.g. in an open
+        transaction) or, for replicas, the most recent writes.
+        """
+        return _current_reader.get() or self.primary_reader
+
+    def archive_reader(self) -> BaseDBAsyncClient | None:
+        """Returns the read-only connection to the archive of the shard that the current context is routed to.
+
+        None is returned if the shard has no archive e.g. when no
+        transactions were archived or the database is not SQLite.
+        """
+        shard = _current_shard.get()
+        client = self._archives.get(shard)
+
+        if client is None:
+            path = archive_path(shard_path(self.primary_path, shard))
+            if self.primary.capabilities.dialect != "sqlite" or not os.path.exists(path):
+                return None
+
+            client = self._archives[shard] = SqliteClient(path, connection_name="archive", query_only="ON")
+
+        return client
+
+    async def close(self) -> None:
+        """Closes the connections to all shards."""
+        while self._clients:
+            shard, client = self._clients.popitem()
+            await client.close()
+            await self._readers.pop(shard).close()
+
+        while self._archives:
+            await self._archives.popitem()[1].close()
+
+        if self.primary_reader is not self.primary:
+            await self.primary_reader.close()
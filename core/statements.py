@@ -0,0 +1,357 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import AsyncIterator
+from pydantic import ValidationError
+from core.models import constraints
+from core import schemas
+
+import codecs
+import datetime
+import decimal
+import hashlib
+import html
+import re
+
+__all__ = (
+    "StatementError",
+    "StatementParser",
+    "OFXParser",
+    "QIFParser",
+    "read_statement",
+)
+
+# The maximum number of characters kept in the parser's buffer while
+# waiting for the end of a tag or line.
+_MAX_PENDING = 65536
+
+_OFX_TAG = re.compile(r"<(/?)([^<>]*)>([^<]*)")
+_OFX_DATE = re.compile(
+    r"^(\d{4})(\d{2})(\d{2})(?:(\d{2})(\d{2})(\d{2})?)?(?:\.\d+)?"
+    r"(?:\[([+-]?\d+(?:\.\d+)?)(?::[^\]]*)?\])?$"
+)
+_QIF_DATE_SEPARATORS = re.compile(r"[/.\-']")
+_QIF_TYPES = ("bank", "cash", "ccard", "oth a", "oth l")
+
+
+class StatementError(ValueError):
+    """Raised when a bank statement cannot be parsed."""
+
+
+def _parse_amount(text: str) -> int:
+    # Amounts are given in major units with either a dot or a comma as
+    # the decimal separator and optionally the other as the thousands
+    # separator e.g. 1,234.56 or 1.234,56.
+    text = text.strip().replace(" ", "")
+    dot, comma = text.rfind("."), text.rfind(",")
+
+    if dot != -1 and comma != -1:
+        separator = "." if dot > comma else ","
+        text = text.replace("," if separator == "." else ".", "")
+    elif comma != -1 and text.count(",") == 1 and len(text) - comma - 1 in (1, 2):
+        separator = ","
+    else:
+        separator = "."
+        text = text.replace(",", "")
+
+    try:
+        value = decimal.Decimal(text.replace(separator, "."))
+    except decimal.InvalidOperation:
+        raise StatementError(f"Invalid amount {text!r}") from None
+
+    if not value.is_finite():
+        raise StatementError(f"Invalid amount {text!r}")
+
+    return int((value * 100).quantize(decimal.Decimal(1), rounding=decimal.ROUND_HALF_UP))
+
+def _parse_ofx_date(text: str) -> datetime.datetime:
+    # OFX dates are in YYYYMMDD[HHMMSS[.XXX]][[offset:TZ]] format where
+    # the offset is in hours from UTC. Dates without offset are in UTC.
+    match = _OFX_DATE.match(text.strip())
+    if match is None:
+        raise StatementError(f"Invalid date {text!r}")
+
+    year, month, day, hour, minute, second, offset = match.groups()
+    tz = datetime.timezone(datetime.timedelta(hours=float(offset))) if offset else datetime.timezone.utc
+
+    try:
+        return datetime.datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0), tzinfo=tz)
+    except ValueError:
+        raise StatementError(f"Invalid date {text!r}") from None
+
+def _parse_qif_date(text: str, day_first: bool) -> datetime.datetime:
+    # QIF dates are in M/D/Y (or D/M/Y) format with two or four digit
+    # years. Quicken separates the two digit years of 2000s by ' e.g.
+    # 3/15'25. Dates in YYYY-MM-DD format are also accepted.
+    parts = _QIF_DATE_SEPARATORS.split(text.replace(" ", ""))
+
+    try:
+        if len(parts) != 3:
+            raise ValueError
+        if len(parts[0]) == 4:
+            year, month, day = map(int, parts)
+        else:
+            first, second, year = map(int, parts)
+            day, month = (first, second) if day_first else (second, first)
+            if len(parts[2]) <= 2:
+                year += 2000 if year < 50 else 1900
+
+        return datetime.datetime(year, month, day, tzinfo=datetime.timezone.utc)
+    except ValueError:
+        raise StatementError(f"Invalid date {text!r}") from None
+
+
+class StatementParser:
+    """The base class of incremental bank statement parsers.
+
+    The statement is fed to the parser in chunks of bytes as they are
+    received and the parsed transactions are returned as soon as they
+    are complete. Only the incomplete part of the statement is kept in
+    memory so statements of any size can be parsed.
+
+    The transactions are returned as (external ID, transaction data)
+    tuples where the external ID identifies the transaction in the
+    statement. It is the ID assigned by the bank if given or derived
+    from the transaction's data otherwise.
+
+    The statement is decoded as UTF-8 and the invalid bytes are replaced.
+    StatementError is raised if the statement is invalid.
+    """
+
+    __slots__ = (
+        "skipped",
+        "_decoder",
+        "_buffer",
+        "_ordinals",
+    )
+
+    def __init__(self) -> None:
+        self.skipped = 0
+        """The number of transactions skipped because of their zero amount."""
+
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buffer = ""
+        self._ordinals: dict[bytes, int] = {}
+
+    def feed(self, data: bytes) -> list[tuple[str, schemas.LogTransactionJSON]]:
+        """Parses the given chunk of the statement.
+
+        Returns the transactions completed by the chunk.
+        """
+        self._buffer += self._decoder.decode(data)
+        entries: list[tuple[str, schemas.LogTransactionJSON]] = []
+        self._parse(entries, final=False)
+
+        if len(self._buffer) > _MAX_PENDING:
+            raise StatementError("The statement is not in the expected format")
+
+        return entries
+
+    def close(self) -> list[tuple[str, schemas.LogTransactionJSON]]:
+        """Parses the rest of the statement once all chunks are fed.
+
+        Returns the remaining transactions.
+        """
+        self._buffer += self._decoder.decode(b"", final=True)
+        entries: list[tuple[str, schemas.LogTransactionJSON]] = []
+        self._parse(entries, final=True)
+        return entries
+
+    def _parse(self, entries: list[tuple[str, schemas.LogTransactionJSON]], final: bool) -> None:
+        raise NotImplementedError
+
+    def _derive_id(self, prefix: str, date: datetime.datetime, *fields: object) -> str:
+        # The ID of a transaction without one is the hash of its data and
+        # its ordinal among the identical transactions in the statement.
+        # The ordinals are counted for the whole statement as the identical
+        # transactions may not be adjacent; only the digest of each distinct
+        # transaction is kept.
+        key = hashlib.sha256("\x1f".join(map(str, (date.isoformat(), *fields))).encode()).digest()
+        ordinal = self._ordinals.get(key, 0)
+        self._ordinals[key] = ordinal + 1
+        return prefix + hashlib.sha256(key + ordinal.to_bytes(8, "big")).hexdigest()
+
+    def _add_entry(
+        self,
+        entries: list[tuple[str, schemas.LogTransactionJSON]],
+        external_id: str,
+        amount: int,
+        date: datetime.datetime,
+        description: str | None,
+    ) -> None:
+        if amount == 0:
+            self.skipped += 1
+            return
+
+        if description is not None:
+            description = description[:constraints.TRANSACTION_DESCRIPTION_MAX_LENGTH]
+
+        try:
+            data = schemas.LogTransactionJSON(amount=amount, date=date, description=description or None)
+        except ValidationError as e:
+            raise StatementError(f"Invalid transaction {external_id!r}: {e}") from None
+
+        entries.append((external_id, data))
+
+
+class OFXParser(StatementParser):
+    """Incremental parser of OFX (and QFX) statements.
+
+    Both SGML (OFX 1.x) and XML (OFX 2.x) statements are supported. The
+    transactions of all statements in the file are returned. The FITID
+    of transactions is used as their external ID.
+    """
+
+    __slots__ = (
+        "_fields",
+        "_found",
+    )
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._fields: dict[str, str] | None = None
+        self._found = False
+
+    def _parse(self, entries: list[tuple[str, schemas.LogTransactionJSON]], final: bool) -> None:
+        # The text after the last tag may continue in the next chunk so
+        # it is kept in the buffer along with the tag.
+        end = len(self._buffer) if final else self._buffer.rfind("<")
+
+        for match in _OFX_TAG.finditer(self._buffer, 0, max(end, 0)):
+            closing, name, text = match.groups()
+            name = name.strip().upper()
+
+            if name == "OFX":
+                self._found = True
+            elif name == "STMTTRN":
+                if closing:
+                    self._add_transaction(entries)
+                else:
+                    self._fields = {}
+            elif self._fields is not None and not closing:
+                value = text.strip()
+                if value:
+                    self._fields[name] = html.unescape(value)
+
+        if end > 0:
+            self._buffer = self._buffer[end:]
+
+        if final:
+            if not self._found:
+                raise StatementError("The statement is not an OFX statement")
+            if self._fields is not None:
+                raise StatementError("The statement ends in the middle of a transaction")
+
+    def _add_transaction(self, entries: list[tuple[str, schemas.LogTransactionJSON]]) -> None:
+        fields = self._fields
+        self._fields = None
+
+        if fields is None or "TRNAMT" not in fields or "DTPOSTED" not in fields:
+            raise StatementError("The statement has a transaction without amount or date")
+
+        amount = _parse_amount(fields["TRNAMT"])
+        date = _parse_ofx_date(fields["DTPOSTED"])
+        description = fields.get("NAME") or fields.get("MEMO")
+        external_id = fields.get("FITID") or self._derive_id("ofx:", date, amount, description, fields.get("CHECKNUM"))
+        self._add_entry(entries, external_id, amount, date, description)
+
+
+class QIFParser(StatementParser):
+    """Incremental parser of QIF statements.
+
+    Only the transactions of bank, cash, credit card and other asset or
+    liability accounts are returned. QIF transactions have no ID so their
+    external ID is derived from their data.
+
+    Parameters
+    ----------
+    day_first: :class:`bool`
+        Whether the dates are in D/M/Y instead of M/D/Y format.
+    """
+
+    __slots__ = (
+        "day_first",
+        "_record",
+        "_active",
+        "_found",
+    )
+
+    def __init__(self, day_first: bool = False) -> None:
+        super().__init__()
+        self.day_first = day_first
+        self._record: dict[str, str] = {}
+        self._active = False
+        self._found = False
+
+    def _parse(self, entries: list[tuple[str, schemas.LogTransactionJSON]], final: bool) -> None:
+        lines = self._buffer.splitlines()
+        if not final and lines and not self._buffer.endswith(("\n", "\r")):
+            self._buffer = lines.pop()
+        else:
+            self._buffer = ""
+
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+
+            if line.startswith("!"):
+                header = line.lower()
+                if header.startswith("!type:"):
+                    self._found = True
+                    self._active = header[6:].strip() in _QIF_TYPES
+                elif not header.startswith(("!option", "!clear")):
+                    self._active = False
+                self._record = {}
+            elif line == "^":
+                self._add_transaction(entries)
+            elif self._active:
+                self._record.setdefault(line[0], line[1:].strip())
+
+        if final:
+            if not self._found:
+                raise StatementError("The statement is not a QIF statement")
+            if self._record:
+                self._add_transaction(entries)
+
+    def _add_transaction(self, entries: list[tuple[str, schemas.LogTransactionJSON]]) -> None:
+        record = self._record
+        self._record = {}
+
+        if not record:
+            return
+
+        text = record.get("T") or record.get("U")
+        if text is None or "D" not in record:
+            raise StatementError("The statement has a transaction without amount or date")
+
+        amount = _parse_amount(text)
+        date = _parse_qif_date(record["D"], self.day_first)
+        payee, memo, number = record.get("P"), record.get("M"), record.get("N")
+        external_id = self._derive_id("qif:", date, amount, payee, memo, number)
+        self._add_entry(entries, external_id, amount, date, payee or memo)
+
+
+async def read_statement(
+    chunks: AsyncIterator[bytes],
+    parser: StatementParser,
+    batch_size: int,
+) -> AsyncIterator[list[tuple[str, schemas.LogTransactionJSON]]]:
+    """Parses the statement received in the given chunks using the given parser.
+
+    The transactions are yielded in batches of the given size (except the
+    last one) as the statement is received.
+    """
+    batch: list[tuple[str, schemas.LogTransactionJSON]] = []
+
+    async for chunk in chunks:
+        batch += parser.feed(chunk)
+        while len(batch) >= batch_size:
+            yield batch[:batch_size]
+            batch = batch[batch_size:]
+
+    batch += parser.close()
+    while batch:
+        yield batch[:batch_size]
+        batch = batch[batch_size:]
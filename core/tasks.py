@@ -0,0 +1,64 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable
+
+import asyncio
+import logging
+
+__all__ = (
+    "PeriodicTask",
+)
+
+_log = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """Runs a coroutine function periodically in the background.
+
+    The function is first called after ``interval`` seconds of starting
+    the task. Errors raised by the function are logged and do not stop
+    the task.
+
+    Parameters
+    ----------
+    name: :class:`str`
+        The name of task, used in logs.
+    interval: :class:`float`
+        The number of seconds between calls.
+    func:
+        The coroutine function to call.
+    """
+
+    def __init__(self, name: str, interval: float, func: Callable[[], Awaitable[Any]]) -> None:
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Starts the task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        """Stops the task, cancelling the call in progress (if any)."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.func()
+            except Exception:
+                _log.exception(f"Periodic task {self.name!r} failed.")
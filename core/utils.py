@@ -5,12 +5,15 @@ from __future__ import annotations
 from typing import Any
 from cryptography.fernet import Fernet
 
+import hashlib
+import hmac
 import secrets
 
 __all__ = (
     "Any",
     "fernet_encrypt",
     "fernet_decrypt",
+    "password_digest",
     "generate_user_token",
 )
 
@@ -32,6 +35,16 @@ def fernet_decrypt(value: bytes) -> str:
 
     return Fernet(ENCRYPTION_KEY).decrypt(value).decode()
 
+def password_digest(password: str) -> str:
+    """Returns the digest used to verify the given password.
+
+    The digest is a HMAC of the password keyed with the encryption key.
+    Computing it is much cheaper than decrypting the stored password.
+    """
+    from core.config import ENCRYPTION_KEY  # circular import
+
+    return hmac.new(ENCRYPTION_KEY.encode(), password.encode(), hashlib.sha256).hexdigest()
+
 def generate_user_token():
     """Generates a unique authorization token."""
     return secrets.token_urlsafe(36)
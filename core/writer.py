@@ -0,0 +1,173 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Generic, TypeVar
+from tortoise import connections
+from tortoise.transactions import in_transaction
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+import asyncio
+import contextvars
+
+__all__ = (
+    "WriteCoordinator",
+)
+
+_T = TypeVar("_T")
+
+WriteFunc = Callable[[BaseDBAsyncClient], Awaitable[_T]]
+
+
+class _Job(Generic[_T]):
+    __slots__ = (
+        "func",
+        "future",
+        "context",
+        "client",
+    )
+
+    def __init__(self, func: WriteFunc[_T], future: asyncio.Future[_T]) -> None:
+        self.func = func
+        self.future = future
+
+        # The context of submitter which determines the database
+        # (shard) that the write is executed on.
+        self.context = contextvars.copy_context()
+        self.client = connections.get("default")
+
+
+class WriteCoordinator:
+    """Commits the writes submitted by concurrent requests in batches.
+
+    Every database transaction ends with a commit (and an fsync) which
+    limits the rate of writes. The coordinator runs a single writer
+    task that collects the writes submitted over a small window and
+    executes them in one database transaction.
+
+    The writes to different databases (see core.sharding) are committed
+    in separate transactions.
+
+    Each write is executed in its own savepoint so that a failing write
+    does not affect the others in the batch. The result of, or the error
+    raised by, a write is returned to its submitter by submit() once the
+    batch is committed.
+
+    A batch is committed once ``max_size`` writes are collected or
+    ``max_delay`` seconds have passed since the first write in batch
+    was submitted, whichever is earlier.
+
+    The coordinator is opt-in. Until it is started (or after it is stopped),
+    submit() executes the write in its own transaction.
+
+    Parameters
+    ----------
+    max_size: :class:`int`
+        The maximum number of writes in a batch.
+    max_delay: :class:`float`
+        The maximum number of seconds a write waits for the batch to fill.
+    """
+
+    def __init__(self, max_size: int, max_delay: float) -> None:
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self._queue: asyncio.Queue[_Job[Any] | None] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Starts the writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="write-coordinator")
+
+    async def stop(self) -> None:
+        """Stops the writer task after committing the pending writes."""
+        if self._task is None:
+            return
+
+        task = self._task
+        self._task = None
+
+        await self._queue.put(None)
+        await task
+
+    async def submit(self, func: WriteFunc[_T]) -> _T:
+        """Submits a write and waits for it to be committed.
+
+        ``func`` is a coroutine function that performs the write using
+        the database connection passed to it. Its return value is returned
+        and the error raised by it is propagated.
+        """
+        if self._task is None:
+            async with in_transaction() as conn:
+                return await func(conn)
+
+        future: asyncio.Future[_T] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_Job(func, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            job = await self._queue.get()
+
+            if job is None:
+                break
+
+            jobs = [job]
+            deadline = loop.time() + self.max_delay
+
+            while len(jobs) < self.max_size:
+                try:
+                    job = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        job = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+
+                if job is None:
+                    stopping = True
+                    break
+
+                jobs.append(job)
+
+            # The jobs are grouped by their database regardless of the order
+            # they were submitted in so each database is committed once.
+            groups: dict[BaseDBAsyncClient, list[_Job[Any]]] = {}
+            for job in jobs:
+                groups.setdefault(job.client, []).append(job)
+
+            for group in groups.values():
+                await asyncio.create_task(self._commit(group), context=group[0].context)
+
+    async def _commit(self, jobs: list[_Job[Any]]) -> None:
+        results: list[tuple[_Job[Any], Any]] = []
+
+        try:
+            async with in_transaction():
+                for job in jobs:
+                    # The submitter is no longer waiting (e.g. request cancelled).
+                    if job.future.done():
+                        continue
+
+                    try:
+                        async with in_transaction() as savepoint:
+                            result = await job.func(savepoint)
+                    except Exception as exc:
+                        job.future.set_exception(exc)
+                    else:
+                        results.append((job, result))
+        except Exception as exc:
+            for job, _ in results:
+                if not job.future.done():
+                    job.future.set_exception(exc)
+            return
+
+        for job, result in results:
+            if not job.future.done():
+                job.future.set_result(result)
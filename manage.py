@@ -0,0 +1,256 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable
+from tortoise import Tortoise, connections
+from tortoise.transactions import in_transaction
+from core.database import DatabaseClient, get_tortoise_config
+from core.sharding import ShardManager
+from core.search import rebuild_search_index
+from core.schema import prepare_schema
+from core.archive import archive_transactions
+from core.backup import BackupProgress, database_paths, run_backup
+from core.rates import import_rates, read_rates_file
+from core import models, config
+
+import argparse
+import asyncio
+import datetime
+import logging
+import uuid
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(levelname)s - %(message)s",
+)
+
+_log = logging.getLogger(__name__)
+
+
+async def _with_database(db_url: str, func: Callable[[DatabaseClient], Awaitable[Any]]) -> None:
+    await Tortoise.init(config=get_tortoise_config(db_url))
+    await prepare_schema(connections.get("default"))
+
+    shards = ShardManager.from_url(db_url, config.DATABASE_SHARDS, config.DATABASE_SHARD_MAX_OPEN)
+
+    try:
+        await func(DatabaseClient(shards))
+    finally:
+        await shards.close()
+        await connections.close_all()
+
+async def _users_by_shard(db: DatabaseClient) -> list[list[uuid.UUID]]:
+    assigned: dict[uuid.UUID, int] = dict(await models.ShardAssignment.all().values_list("user_id", "shard"))  # type: ignore
+    users: list[list[uuid.UUID]] = [[] for _ in range(db.shards.count)]
+
+    for user_id in sorted(await models.User.all().values_list("id", flat=True)):  # type: ignore
+        users[assigned.get(user_id, 0)].append(user_id)
+
+    return users
+
+async def _status(db: DatabaseClient, args: argparse.Namespace) -> None:
+    for shard, users in enumerate(await _users_by_shard(db)):
+        _log.info(f"Shard {shard}: {len(users)} users")
+
+async def _move(db: DatabaseClient, args: argparse.Namespace) -> None:
+    _log.info(f"Moving user {args.user_id} to shard {args.shard}...")
+    await db.move_user(uuid.UUID(args.user_id), args.shard)
+    _log.info("User moved successfully.")
+
+async def _rebalance(db: DatabaseClient, args: argparse.Namespace) -> None:
+    users = await _users_by_shard(db)
+    total = sum(len(u) for u in users)
+    count = db.shards.count
+    ideal = [total // count + (1 if shard < total % count else 0) for shard in range(count)]
+
+    surplus = [user_id for shard, u in enumerate(users) for user_id in u[ideal[shard]:]]
+    moves = []
+
+    for shard, u in enumerate(users):
+        for _ in range(ideal[shard] - len(u)):
+            moves.append((surplus.pop(), shard))
+
+    if not moves:
+        _log.info("Shards are already balanced.")
+        return
+
+    for user_id, shard in moves:
+        if args.dry_run:
+            _log.info(f"Would move user {user_id} to shard {shard}")
+        else:
+            _log.info(f"Moving user {user_id} to shard {shard}...")
+            await db.move_user(user_id, shard)
+
+    if not args.dry_run:
+        _log.info(f"Rebalanced {len(moves)} users.")
+
+async def _maintenance(db: DatabaseClient, args: argparse.Namespace) -> None:
+    deleted = await db.prune_changes(datetime.timedelta(days=config.CHANGELOG_RETENTION_DAYS))
+    _log.info(f"Pruned {deleted} change log entries.")
+
+    for shard in range(db.shards.count):
+        async with db.shards.route(shard) as client:
+            if client.capabilities.dialect != "sqlite":
+                await client.execute_script("VACUUM ANALYZE" if args.vacuum else "ANALYZE")
+                _log.info("Database maintained successfully.")
+                continue
+
+            _, rows = await client.execute_query("PRAGMA integrity_check")
+            result = ", ".join(str(row[0]) for row in rows)
+
+            if result != "ok":
+                _log.error(f"Shard {shard} failed integrity check: {result}")
+                continue
+
+            await client.execute_script("PRAGMA optimize")
+            await client.execute_script("PRAGMA wal_checkpoint(TRUNCATE)")
+
+            if args.vacuum:
+                await client.execute_script("VACUUM")
+                await rebuild_search_index(client)
+
+        _log.info(f"Shard {shard} maintained successfully.")
+
+async def _archive(db: DatabaseClient, args: argparse.Namespace) -> None:
+    before = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=args.days)
+
+    for shard in range(db.shards.count):
+        async with db.shards.route(shard) as client:
+            if client.capabilities.dialect != "sqlite":
+                _log.error("Archival is only supported with SQLite.")
+                return
+
+            archived = await archive_transactions(client, before)
+
+        _log.info(f"Shard {shard}: archived {archived} transactions.")
+
+async def _backup(db: DatabaseClient, args: argparse.Namespace) -> None:
+    if db.shards.primary.capabilities.dialect != "sqlite":
+        _log.error("Backups are only supported with SQLite.")
+        return
+
+    progress = BackupProgress(database_paths(db.shards.primary_path, db.shards.count))
+    task = asyncio.create_task(run_backup(
+        progress,
+        args.directory,
+        compress=args.compress,
+        verify=args.verify,
+        pages=config.BACKUP_STEP_PAGES,
+        delay=config.BACKUP_STEP_DELAY / 1000,
+    ))
+
+    while not task.done():
+        await asyncio.wait([task], timeout=args.report_interval)
+        if progress.running:
+            _log.info(
+                f"Backed up {progress.files_done}/{len(progress.files)} databases, "
+                f"{progress.pages_copied}/{progress.pages_total} pages of current database."
+            )
+
+    try:
+        await task
+    except Exception:
+        _log.error(f"Backup failed: {progress.error}")
+        return
+
+    assert progress.finished_at is not None
+    elapsed = (progress.finished_at - progress.started_at).total_seconds()
+    _log.info(
+        f"Backed up {len(progress.files)} databases to {args.directory} in {elapsed:.1f}s "
+        f"({progress.bytes_written} bytes, {progress.restarts} restarts)."
+    )
+
+    if args.verify:
+        _log.info("All backups passed verification.")
+
+async def _rates(db: DatabaseClient, args: argparse.Namespace) -> None:
+    try:
+        async with in_transaction() as conn:
+            imported = await import_rates(read_rates_file(args.file), using_db=conn)
+    except (OSError, ValueError) as e:
+        _log.error(f"Importing exchange rates failed: {e}")
+        return
+
+    _log.info(f"Imported {imported} exchange rates. Use POST /admin/rates/reload to load them in a running server.")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="Bujet Manager",
+        description="Administration tasks for Bujet database. The server must be stopped while moving users.",
+        epilog="Copyright (C) Izhar Ahmad 2025-2026 - https://github.com/izxxr/bujet",
+    )
+
+    parser.add_argument(
+        "--database-url",
+        default=config.DATABASE_URL,
+        help="The URL of primary database. Defaults to BUJET_DATABASE_URL environment variable or sqlite://db.sqlite3.",
+    )
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    status = commands.add_parser("status", help="Show the number of users in each shard.")
+    status.set_defaults(func=_status)
+
+    move = commands.add_parser("move", help="Move a user to the given shard.")
+    move.add_argument("user_id", help="The ID of user to move.")
+    move.add_argument("shard", type=int, help="The shard to move the user to.")
+    move.set_defaults(func=_move)
+
+    rebalance = commands.add_parser(
+        "rebalance",
+        help="Move users so that shards have equal number of users. This should be used after " \
+             "increasing BUJET_DATABASE_SHARDS.",
+    )
+    rebalance.add_argument("--dry-run", action="store_true", help="Only show the users that would be moved.")
+    rebalance.set_defaults(func=_rebalance)
+
+    maintenance = commands.add_parser(
+        "maintenance",
+        help="Prune change log, check integrity and optimize all shards.",
+    )
+    maintenance.add_argument("--vacuum", action="store_true", help="Also vacuum the databases to reclaim space.")
+    maintenance.set_defaults(func=_maintenance)
+
+    archive = commands.add_parser(
+        "archive",
+        help="Move old transactions of all shards to the archive databases. Run maintenance with " \
+             "--vacuum afterwards to reclaim the space.",
+    )
+    archive.add_argument(
+        "--days",
+        type=int,
+        default=config.ARCHIVE_AFTER_DAYS,
+        help="The age, in days, of transactions to archive. Defaults to BUJET_ARCHIVE_AFTER_DAYS environment variable or 730.",
+    )
+    archive.set_defaults(func=_archive)
+
+    backup = commands.add_parser(
+        "backup",
+        help="Back up all databases while the server is running. Only supported with SQLite.",
+    )
+    backup.add_argument("directory", help="The directory to store the backups in.")
+    backup.add_argument("--compress", action="store_true", help="Compress the backups using gzip.")
+    backup.add_argument("--verify", action="store_true", help="Verify that the backups can be restored.")
+    backup.add_argument(
+        "--report-interval",
+        type=float,
+        default=5,
+        help="The number of seconds between progress reports. Defaults to 5.",
+    )
+    backup.set_defaults(func=_backup)
+
+    rates = commands.add_parser(
+        "rates",
+        help="Import exchange rates from a CSV file with date, currency and rate columns. The rates " \
+             "are the units of currency per unit of BUJET_BASE_CURRENCY.",
+    )
+    rates.add_argument("file", help="The path of CSV file to import.")
+    rates.set_defaults(func=_rates)
+
+    args = parser.parse_args()
+    asyncio.run(_with_database(args.database_url, lambda db: args.func(db, args)))
+
+if __name__ == "__main__":
+    main()
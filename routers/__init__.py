@@ -1,4 +1,14 @@
 from routers.user import *
 from routers.accounts import *
+from routers.transactions import *
+from routers.categories import *
+from routers.recurring import *
+from routers.statements import *
+from routers.networth import *
+from routers.autocomplete import *
+from routers.sync import *
+from routers.events import *
+from routers.batch import *
+from routers.admin import *
 
-__include_routers__ = [user, accounts]
+__include_routers__ = [user, accounts, transactions, categories, recurring, statements, networth, autocomplete, sync, events, batch, admin]
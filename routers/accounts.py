@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
-from tortoise.functions import Sum
+from typing import Annotated
+from tortoise.transactions import in_transaction
+from tortoise.backends.base.client import BaseDBAsyncClient
 from pydantic import UUID4, AwareDatetime
 from fastapi import APIRouter, HTTPException, Request, Response, Depends
 from core.deps import require_auth
+from core.caching import ConditionalGet
+from core.reports import ReportTimeout
+from core.responses import ORJSONResponse
+from core.events import Event
+from core.database import month_of
 from core import schemas, models
+from routers.categories import fetch_category
+
+import array
+import datetime
+import heapq
+import uuid
 
 __all__ = (
     "accounts",
@@ -15,32 +28,87 @@ __all__ = (
 async def fetch_account(request: Request, account_id: UUID4) -> models.FinancialAccount:
     """Fetches the given account using the given ID.
 
-    If fetch_related=True, the related fields (user) are also
-    fetched. Defaults to False.
+    For sub-requests of a batch request, the account is fetched once
+    and shared with the other sub-requests of the batch.
     """
+    batch = getattr(request.state, "batch", None)
+
+    if batch is not None and account_id in batch.accounts:
+        return batch.accounts[account_id]
+
     acc = await models.FinancialAccount.filter(id=account_id, user=request.state.user).first()
 
     if acc is None:
         raise HTTPException(404, "Account not found")
 
+    if batch is not None:
+        batch.accounts[account_id] = acc
+
     return acc
 
+async def publish_transaction_event(request: Request, account_id: UUID4, type: str, data: dict) -> None:
+    """Publishes a transaction event to the user's event streams.
+
+    The new balance of the account is added to the event data. Nothing
+    is done (including calculating the balance) if the user has no
+    event streams open.
+    """
+    events = request.app.state.events
+    user_id = request.state.user.id
+
+    if not events.has_subscribers(user_id):
+        return
+
+    data["account_id"] = account_id
+    data["balance"] = await request.app.state.db.fetch_balance(account_id)
+    events.publish(user_id, Event(type, data))
+
+def _parse_month(month: str | None) -> int:
+    # Months are given in YYYY-MM format and default to the current month.
+    if month is None:
+        return month_of(datetime.datetime.now(datetime.timezone.utc))
+
+    try:
+        date = datetime.datetime.strptime(month, "%Y-%m")
+    except ValueError:
+        raise HTTPException(422, "month must be in YYYY-MM format") from None
+
+    return date.year * 100 + date.month
+
 accounts = APIRouter(prefix="/accounts")
+user_conditional = ConditionalGet("user")
+account_conditional = ConditionalGet("account")
 
 @accounts.post("/", dependencies=[Depends(require_auth)])
 async def create_account(request: Request, data: schemas.CreateAccountJSON) -> schemas.FinancialAccount:
     """Create a financial account."""
+    db = request.app.state.db
     acc = data.to_db_model(user=request.state.user)
-    await acc.save()
-    return schemas.FinancialAccount.from_db_model(acc, user=request.state.user)
 
-@accounts.get("/", dependencies=[Depends(require_auth)])
-async def get_all_accounts(request: Request) -> list[schemas.FinancialAccount]:
+    async with in_transaction() as conn:
+        await acc.save(using_db=conn)
+        result = schemas.FinancialAccount.from_db_model(acc, user=request.state.user)
+        await db.record_change(
+            request.state.user.id,
+            models.EntityType.ACCOUNT,
+            acc.id,
+            models.ChangeType.CREATE,
+            result.model_dump(mode="json"),
+            using_db=conn,
+        )
+        await db.bump_version(request.state.user.id, using_db=conn)
+
+    return result
+
+@accounts.get("/", dependencies=[Depends(require_auth)], response_model=list[schemas.FinancialAccount])
+async def get_all_accounts(request: Request, etag: Annotated[str, Depends(user_conditional)]) -> Response:
     """Get all accounts associated to requesting user."""
-    accs = await models.FinancialAccount.filter(user=request.state.user).all()
-    return [schemas.FinancialAccount.from_db_model(a, user=request.state.user) for a in accs]
+    db = request.app.state.db
+    user_id = request.state.user.id
+    accs = await db.fetch_accounts(user_id, using_db=db.reader(user_id))
+    return ORJSONResponse(accs, headers={"ETag": etag})
 
-@accounts.get("/{account_id}", dependencies=[Depends(require_auth)])
+@accounts.get("/{account_id}", dependencies=[Depends(require_auth), Depends(account_conditional)])
 async def get_account(request: Request, account_id: UUID4) -> schemas.FinancialAccount:
     """Get a specific account by its ID."""
     acc = await fetch_account(request, account_id)
@@ -52,12 +120,24 @@ async def edit_account(request: Request, account_id: UUID4, data: schemas.EditAc
 
     Returns the updated account on success.
     """
+    db = request.app.state.db
     acc = await fetch_account(request, account_id)
-
     acc.update_from_dict(data.to_dict())  # type: ignore
-    await acc.save()
 
-    return schemas.FinancialAccount.from_db_model(acc, user=request.state.user)
+    async with in_transaction() as conn:
+        await acc.save(using_db=conn)
+        result = schemas.FinancialAccount.from_db_model(acc, user=request.state.user)
+        await db.record_change(
+            request.state.user.id,
+            models.EntityType.ACCOUNT,
+            acc.id,
+            models.ChangeType.UPDATE,
+            result.model_dump(mode="json"),
+            using_db=conn,
+        )
+        await db.bump_version(request.state.user.id, acc.id, using_db=conn)
+
+    return result
 
 @accounts.delete("/{account_id}", dependencies=[Depends(require_auth)])
 async def delete_account(request: Request, account_id: UUID4) -> Response:
@@ -65,9 +145,24 @@ async def delete_account(request: Request, account_id: UUID4) -> Response:
 
     Returns 204 No Content on success.
     """
+    db = request.app.state.db
     acc = await fetch_account(request, account_id)
-    
-    await acc.delete()
+
+    async with in_transaction() as conn:
+        await acc.delete(using_db=conn)
+        await db.record_change(
+            request.state.user.id,
+            models.EntityType.ACCOUNT,
+            acc.id,
+            models.ChangeType.DELETE,
+            using_db=conn,
+        )
+        await db.bump_version(request.state.user.id, acc.id, using_db=conn)
+
+    if hasattr(request.state, "batch"):
+        request.state.batch.accounts.pop(acc.id, None)
+
+    request.app.state.autocomplete.discard(request.state.user.id)
     return Response(None, 204)
 
 # -- Transactions --
@@ -75,27 +170,62 @@ async def delete_account(request: Request, account_id: UUID4) -> Response:
 @accounts.post("/{account_id}/transactions", dependencies=[Depends(require_auth)])
 async def log_transaction(request: Request, account_id: UUID4, data: schemas.LogTransactionJSON) -> schemas.Transaction:
     """Log a transaction in the specified financial account."""
+    db = request.app.state.db
     acc = await fetch_account(request, account_id)
     transaction = data.to_db_model(acc)
 
-    await transaction.save()
-    return schemas.Transaction.from_db_model(transaction, acc)
-
-@accounts.get("/{account_id}/transactions-count", dependencies=[Depends(require_auth)])
+    if data.category_id is not None:
+        await fetch_category(request, data.category_id)
+
+    async def write(conn: BaseDBAsyncClient) -> schemas.Transaction:
+        await transaction.save(using_db=conn)
+        if data.category_id is not None:
+            await db.update_rollup(acc.id, data.category_id, transaction.date, transaction.amount, using_db=conn)
+        result = schemas.Transaction.from_db_model(transaction, acc)
+        await db.record_change(
+            request.state.user.id,
+            models.EntityType.TRANSACTION,
+            transaction.id,
+            models.ChangeType.CREATE,
+            result.model_dump(mode="json"),
+            using_db=conn,
+        )
+        await db.bump_version(acc.id, using_db=conn)
+        return result
+
+    # Logging transactions is the most frequent write so it goes through
+    # the write coordinator which may commit it along with others.
+    result = await request.app.state.writer.submit(write)
+
+    request.app.state.autocomplete.add(request.state.user.id, transaction.description)
+    await publish_transaction_event(request, acc.id, "transaction.logged", {"transaction": result})
+    return result
+
+@accounts.get("/{account_id}/transactions-count", dependencies=[Depends(require_auth), Depends(account_conditional)])
 async def count_transactions(request: Request, account_id: UUID4) -> schemas.CountTransactionsResponse:
     """Returns the total number of transactions that the account has."""
+    db = request.app.state.db
     acc = await fetch_account(request, account_id)
-    count = await models.Transaction.filter(account=acc).count()
-    return schemas.CountTransactionsResponse(count=count)
+    reader = db.reader(request.state.user.id)
+    count = await models.Transaction.filter(account=acc).using_db(reader).count()
+    checkpoint = await db.fetch_checkpoint(acc.id, using_db=reader)
+    return schemas.CountTransactionsResponse(count=count + (checkpoint[2] if checkpoint else 0))
 
-@accounts.get("/{account_id}/transactions", dependencies=[Depends(require_auth)])
+@accounts.get("/{account_id}/transactions", dependencies=[Depends(require_auth)], response_model=list[schemas.Transaction])
 async def list_transactions(
     request: Request,
     account_id: UUID4,
+    etag: Annotated[str | None, Depends(account_conditional)],
     after: AwareDatetime | None = None,
     before: AwareDatetime | None = None,
+    min_amount: int | None = None,
+    max_amount: int | None = None,
+    kind: str = "all",
+    description: str | None = None,
+    category_id: UUID4 | None = None,
+    order: str = "desc",
     limit: int = 20,
-) -> list[schemas.Transaction]:
+) -> Response:
     """Log a transaction in the specified financial account.
 
     This endpoint supports paginating transactions using before,
@@ -112,41 +242,85 @@ async def list_transactions(
     - Both before and after can be set to obtain transactions in a range
       of dates.
 
+    - With ascending order, the oldest transactions are returned first
+      so the next page is obtained using after instead of before.
+
+    Transactions can additionally be filtered by amount, kind,
+    description and category. For example, expenses of 100 or more in a quarter
+    are obtained using after, before, kind=expense and max_amount=-10000.
+
     Query Parameters
     ~~~~~~~~~~~~~~~~
     after:
         If provided, transactions after this time will be returned.
     before:
         If provided, transactions before this time will be returned.
+    min_amount:
+        If provided, only transactions with amount greater than or equal
+        to this (in minor units) are returned. Expenses have negative amounts.
+    max_amount:
+        If provided, only transactions with amount less than or equal
+        to this (in minor units) are returned.
+    kind:
+        The transactions to include. One of "income", "expense" or "all".
+        Defaults to "all".
+    description:
+        If provided, only transactions whose description starts with
+        this (case sensitive) are returned.
+    category_id:
+        If provided, only transactions in this category are returned.
+    order:
+        The order of transactions by date. One of "desc" (latest first)
+        or "asc" (oldest first). Defaults to "desc".
     limit:
         The number of transactions to return in response. Defaults to
         20 and capped at 40 per request.
     """
     if limit > 40:
         raise HTTPException(422, "limit cannot be greater than 40")
-    
-    kwargs = {}
+    if kind not in ("income", "expense", "all"):
+        raise HTTPException(422, "kind must be one of income, expense or all")
+    if order not in ("asc", "desc"):
+        raise HTTPException(422, "order must be one of asc or desc")
 
-    if after:
-        kwargs["date__gt"] = after
-    if before:
-        kwargs["date__lt"] = before
+    if kind == "income":
+        min_amount = max(min_amount, 1) if min_amount is not None else 1
+    elif kind == "expense":
+        max_amount = min(max_amount, -1) if max_amount is not None else -1
 
+    db = request.app.state.db
     acc = await fetch_account(request, account_id)
-    transactions = await models.Transaction.filter(**kwargs, account=acc).limit(limit).order_by("-date")
-
-    return [schemas.Transaction.from_db_model(t, acc) for t in transactions]
-
-@accounts.get("/{account_id}/transactions/{transaction_id}", dependencies=[Depends(require_auth)])
-async def get_transaction(request: Request, account_id: UUID4, transaction_id: UUID4) -> schemas.Transaction:
+    transactions = await db.fetch_transactions(
+        acc.id,
+        after=after,
+        before=before,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        description=description,
+        category_id=category_id,
+        ascending=order == "asc",
+        limit=limit,
+        using_db=db.reader(request.state.user.id),
+    )
+
+    return ORJSONResponse(transactions, headers={"ETag": etag} if etag else None)
+
+@accounts.get("/{account_id}/transactions/{transaction_id}", dependencies=[Depends(require_auth)], response_model=schemas.Transaction)
+async def get_transaction(
+    request: Request,
+    account_id: UUID4,
+    transaction_id: UUID4,
+    etag: Annotated[str | None, Depends(account_conditional)],
+) -> Response:
     """Get a specific transaction by its ID."""
-    acc = await fetch_account(request, account_id)
-    transaction = await models.Transaction.filter(id=transaction_id, account=acc).first()
+    db = request.app.state.db
+    user_id = request.state.user.id
+    transaction = await db.fetch_transaction(user_id, account_id, transaction_id, using_db=db.reader(user_id))
 
     if transaction is None:
         raise HTTPException(404, "Transaction not found")
 
-    return schemas.Transaction.from_db_model(transaction, acc)
+    return ORJSONResponse(transaction, headers={"ETag": etag} if etag else None)
 
 @accounts.delete("/{account_id}/transactions/{transaction_id}", dependencies=[Depends(require_auth)])
 async def delete_transaction(request: Request, account_id: UUID4, transaction_id: UUID4) -> Response:
@@ -154,13 +328,36 @@ async def delete_transaction(request: Request, account_id: UUID4, transaction_id
     
     On successful deletion, 204 No Content response is returned.
     """
-    acc = await fetch_account(request, account_id)
-    transaction = await models.Transaction.filter(id=transaction_id, account=acc).first()
-
-    if transaction is None:
-        raise HTTPException(404, "Transaction not found")
-
-    await transaction.delete()
+    db = request.app.state.db
+    user_id = request.state.user.id
+
+    async with in_transaction() as conn:
+        transaction = await db.delete_transaction(user_id, account_id, transaction_id, using_db=conn)
+
+        if transaction is None:
+            raise HTTPException(404, "Transaction not found")
+
+        if transaction["category_id"] is not None:
+            await db.update_rollup(
+                account_id,
+                transaction["category_id"],
+                transaction["date"],
+                transaction["amount"],
+                removed=True,
+                using_db=conn,
+            )
+
+        await db.record_change(
+            user_id,
+            models.EntityType.TRANSACTION,
+            transaction_id,
+            models.ChangeType.DELETE,
+            using_db=conn,
+        )
+        await db.bump_version(account_id, using_db=conn)
+
+    request.app.state.autocomplete.remove(user_id, transaction["description"])
+    await publish_transaction_event(request, account_id, "transaction.deleted", {"transaction_id": transaction_id})
     return Response(None, 204)
 
 @accounts.patch("/{account_id}/transactions/{transaction_id}", dependencies=[Depends(require_auth)])
@@ -169,28 +366,251 @@ async def edit_transaction(request: Request, account_id: UUID4, transaction_id:
 
     Returns the updated transaction on success.
     """
-    acc = await fetch_account(request, account_id)
-    transaction = await models.Transaction.filter(id=transaction_id, account=acc).first()
-
-    if transaction is None:
-        raise HTTPException(404, "Transaction not found")
-
-    transaction.update_from_dict(data.to_dict())  # type: ignore
-    await transaction.save()
-
-    return schemas.Transaction.from_db_model(transaction, acc)
+    db = request.app.state.db
+    user_id = request.state.user.id
+    changes = data.to_dict()
+
+    if changes.get("category_id") is not None:
+        await fetch_category(request, changes["category_id"])
+
+    async with in_transaction() as conn:
+        # The rollups are only updated if the changes move the transaction
+        # to another rollup or change its amount. This requires reading
+        # the transaction before it is updated.
+        previous = None
+        if changes.keys() & {"amount", "date", "category_id"}:
+            previous = await db.fetch_transaction(user_id, account_id, transaction_id, using_db=conn)
+
+        transaction = await db.update_transaction(user_id, account_id, transaction_id, changes, using_db=conn)
+
+        if transaction is None:
+            raise HTTPException(404, "Transaction not found")
+
+        if previous is not None and previous["category_id"] is not None:
+            await db.update_rollup(
+                account_id,
+                previous["category_id"],
+                previous["date"],
+                previous["amount"],
+                removed=True,
+                using_db=conn,
+            )
+        if previous is not None and transaction["category_id"] is not None:
+            await db.update_rollup(
+                account_id,
+                transaction["category_id"],
+                transaction["date"],
+                transaction["amount"],
+                using_db=conn,
+            )
+
+        result = schemas.Transaction(**transaction)
+        await db.record_change(
+            user_id,
+            models.EntityType.TRANSACTION,
+            transaction_id,
+            models.ChangeType.UPDATE,
+            result.model_dump(mode="json"),
+            using_db=conn,
+        )
+        await db.bump_version(account_id, using_db=conn)
+
+
+    # The previous description is not known as the update does not read
+    # the transaction first so the index is rebuilt on next request.
+    if "description" in changes:
+        request.app.state.autocomplete.discard(user_id)
+
+    await publish_transaction_event(request, account_id, "transaction.edited", {"transaction": result})
+    return result
 
 # Balance calculation
 
-@accounts.get("/{account_id}/balance", dependencies=[Depends(require_auth)])
+@accounts.get("/{account_id}/balance", dependencies=[Depends(require_auth), Depends(account_conditional)])
 async def calculate_balance(request: Request, account_id: UUID4) -> schemas.CalculateBalanceResponse:
     """Calculates the balance of the account.
     
     Like transactions, the balance is also returned in minor units format
     and must be divided by 100 to obtain the actual balance value.
     """
+    db = request.app.state.db
     acc = await fetch_account(request, account_id)
-    vals = await models.Transaction.filter(account=acc).annotate(balance=Sum("amount")).first()
+    balance = await db.fetch_balance(acc.id, using_db=db.reader(request.state.user.id))
+    return schemas.CalculateBalanceResponse(balance=balance)
+
+# -- Categories and Budgets --
+
+@accounts.get("/{account_id}/categories", dependencies=[Depends(require_auth)], response_model=list[schemas.CategoryTotal])
+async def get_category_totals(
+    request: Request,
+    account_id: UUID4,
+    etag: Annotated[str | None, Depends(account_conditional)],
+    month: str | None = None,
+) -> Response:
+    """Returns the totals of the account's transactions in each category in a month.
+
+    The categories are ordered by their expenses, highest first. The
+    uncategorized transactions are not included.
+
+    Query Parameters
+    ~~~~~~~~~~~~~~~~
+    month:
+        The month in YYYY-MM format (in UTC). Defaults to the current month.
+    """
+    db = request.app.state.db
+    acc = await fetch_account(request, account_id)
+    totals = await db.fetch_category_totals(acc.id, _parse_month(month), using_db=db.reader(request.state.user.id))
+    return ORJSONResponse(totals, headers={"ETag": etag} if etag else None)
+
+@accounts.get("/{account_id}/budgets", dependencies=[Depends(require_auth)], response_model=list[schemas.BudgetStatus])
+async def get_budgets(
+    request: Request,
+    account_id: UUID4,
+    etag: Annotated[str | None, Depends(account_conditional)],
+    month: str | None = None,
+) -> Response:
+    """Returns the account's budgets along with their spending in a month.
+
+    Query Parameters
+    ~~~~~~~~~~~~~~~~
+    month:
+        The month in YYYY-MM format (in UTC). Defaults to the current month.
+    """
+    db = request.app.state.db
+    acc = await fetch_account(request, account_id)
+    budgets = await db.fetch_budgets(acc.id, _parse_month(month), using_db=db.reader(request.state.user.id))
+    return ORJSONResponse(budgets, headers={"ETag": etag} if etag else None)
+
+@accounts.put("/{account_id}/budgets/{category_id}", dependencies=[Depends(require_auth)])
+async def set_budget(request: Request, account_id: UUID4, category_id: UUID4, data: schemas.SetBudgetJSON) -> schemas.Budget:
+    """Sets the monthly limit of the account's expenses in a category.
+
+    The budget is created if the account has no budget in this category.
+    Returns the budget on success.
+    """
+    db = request.app.state.db
+    acc = await fetch_account(request, account_id)
+    category = await fetch_category(request, category_id)
+    budget = await models.Budget.filter(account=acc, category=category).first()
+
+    if budget is None:
+        budget = models.Budget(id=uuid.uuid4(), account=acc, category=category)
+        change_type = models.ChangeType.CREATE
+    else:
+        change_type = models.ChangeType.UPDATE
+
+    budget.monthly_limit = data.monthly_limit
+
+    async with in_transaction() as conn:
+        await budget.save(using_db=conn)
+        result = schemas.Budget(
+            id=budget.id,
+            account_id=acc.id,
+            category_id=category.id,
+            monthly_limit=budget.monthly_limit,
+        )
+        await db.record_change(
+            request.state.user.id,
+            models.EntityType.BUDGET,
+            budget.id,
+            change_type,
+            result.model_dump(mode="json"),
+            using_db=conn,
+        )
+        await db.bump_version(acc.id, using_db=conn)
+
+    return result
+
+@accounts.delete("/{account_id}/budgets/{category_id}", dependencies=[Depends(require_auth)])
+async def delete_budget(request: Request, account_id: UUID4, category_id: UUID4) -> Response:
+    """Delete the account's budget in a category.
+
+    Returns 204 No Content on success.
+    """
+    db = request.app.state.db
+    acc = await fetch_account(request, account_id)
+    budget = await models.Budget.filter(account=acc, category_id=category_id).first()
+
+    if budget is None:
+        raise HTTPException(404, "Budget not found")
+
+    async with in_transaction() as conn:
+        await budget.delete(using_db=conn)
+        await db.record_change(
+            request.state.user.id,
+            models.EntityType.BUDGET,
+            budget.id,
+            models.ChangeType.DELETE,
+            using_db=conn,
+        )
+        await db.bump_version(acc.id, using_db=conn)
+
+    return Response(None, 204)
+
+# -- Reports --
+
+@accounts.get("/{account_id}/reports/{report}", dependencies=[Depends(require_auth), Depends(account_conditional)])
+async def generate_report(
+    request: Request,
+    account_id: UUID4,
+    report: schemas.ReportType,
+    kind: str = "all",
+    percentiles: str = "50,90,99",
+    window: int = 30,
+) -> schemas.ReportResponse:
+    """Generates an analytics report over the account's transactions.
+
+    Reports are generated in worker processes so that they do not
+    slow down other requests. If a report takes too long to generate,
+    504 Gateway Timeout is returned.
+
+    Query Parameters
+    ~~~~~~~~~~~~~~~~
+    kind:
+        For percentiles report, the transactions to include. One of
+        "income", "expense" or "all". Defaults to "all".
+    percentiles:
+        For percentiles report, the comma separated percentiles (1-99)
+        to calculate. Defaults to "50,90,99".
+    window:
+        For moving average report, the number of days in the window.
+        Defaults to 30.
+    """
+    if report is schemas.ReportType.PERCENTILES:
+        if kind not in ("income", "expense", "all"):
+            raise HTTPException(422, "kind must be one of income, expense or all")
+        try:
+            points = tuple(sorted({int(p) for p in percentiles.split(",")}))
+        except ValueError:
+            raise HTTPException(422, "percentiles must be comma separated integers") from None
+        if not points or points[0] < 1 or points[-1] > 99:
+            raise HTTPException(422, "percentiles must be between 1 and 99")
+        params = {"kind": kind, "percentiles": points}
+    elif report is schemas.ReportType.MOVING_AVERAGE:
+        if window < 1 or window > 366:
+            raise HTTPException(422, "window must be between 1 and 366")
+        params = {"window": window}
+    else:
+        params = {}
+
+    db = request.app.state.db
+    acc = await fetch_account(request, account_id)
+
+    async def load_columns() -> tuple[array.array[float], array.array[int]]:
+        reader = db.reader(request.state.user.id)
+        rows = await models.Transaction.filter(account=acc).using_db(reader).order_by("date").values_list("date", "amount")
+        archive = db.shards.archive_reader()
+
+        if archive is not None and await db.fetch_checkpoint(acc.id, using_db=reader):
+            archived = await models.Transaction.filter(account_id=acc.id).using_db(archive).order_by("date").values_list("date", "amount")
+            rows = list(heapq.merge(archived, rows, key=lambda r: r[0]))
+
+        return array.array("d", (r[0].timestamp() for r in rows)), array.array("q", (r[1] for r in rows))
+
+    try:
+        version = await db.get_version(acc.id, using_db=db.reader(request.state.user.id))
+        result = await request.app.state.reports.run(report, (acc.id, version), params, load_columns)
+    except ReportTimeout:
+        raise HTTPException(504, "Report generation timed out") from None
 
-    # Transaction.balance is added by annotate()
-    return schemas.CalculateBalanceResponse(balance=vals.balance or 0)  # type: ignore
+    return schemas.ReportResponse(report=report, result=result)
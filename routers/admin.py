@@ -0,0 +1,83 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException, Request, Depends
+from core.deps import require_admin
+from core.backup import BackupProgress, database_paths, run_backup
+from core import schemas, config
+
+import asyncio
+import datetime
+import logging
+import os
+
+__all__ = (
+    "admin",
+)
+
+admin = APIRouter(prefix="/admin")
+
+_log = logging.getLogger(__name__)
+
+
+async def _backup(progress: BackupProgress, directory: str, data: schemas.StartBackupJSON) -> None:
+    try:
+        await run_backup(
+            progress,
+            directory,
+            compress=data.compress,
+            verify=data.verify,
+            pages=config.BACKUP_STEP_PAGES,
+            delay=config.BACKUP_STEP_DELAY / 1000,
+        )
+    except Exception:
+        _log.exception("Backup failed.")
+    else:
+        _log.info(f"Backup completed in {directory}.")
+
+@admin.post("/backup", dependencies=[Depends(require_admin)], status_code=202)
+async def start_backup(request: Request, data: schemas.StartBackupJSON) -> schemas.BackupStatus:
+    """Starts backing up the databases in the background.
+
+    The backup is stored in a new timestamped directory inside the
+    BUJET_BACKUP_DIR directory. The server keeps serving the requests
+    while the backup runs. Its progress is obtained using GET /admin/backup.
+
+    If a backup is already running, 409 Conflict is returned.
+    """
+    progress = request.app.state.backup
+
+    if progress is not None and progress.running:
+        raise HTTPException(409, "A backup is already running")
+
+    shards = request.app.state.db.shards
+
+    if shards.primary.capabilities.dialect != "sqlite":
+        raise HTTPException(422, "Backups are only supported with SQLite")
+
+    name = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%d-%H%M%S")
+    progress = request.app.state.backup = BackupProgress(database_paths(shards.primary_path, shards.count))
+    request.app.state.backup_task = asyncio.create_task(_backup(progress, os.path.join(config.BACKUP_DIR, name), data))
+
+    return schemas.BackupStatus(**progress.to_dict())
+
+@admin.get("/backup", dependencies=[Depends(require_admin)])
+async def get_backup_status(request: Request) -> schemas.BackupStatus:
+    """Returns the progress of the running or last backup."""
+    progress = request.app.state.backup
+
+    if progress is None:
+        raise HTTPException(404, "No backup has been started")
+
+    return schemas.BackupStatus(**progress.to_dict())
+
+@admin.post("/rates/reload", dependencies=[Depends(require_admin)])
+async def reload_rates(request: Request) -> schemas.ReloadRatesResponse:
+    """Reloads the exchange rates cached in memory from the database.
+
+    This should be used after importing the rates using manage.py while
+    the server is running.
+    """
+    count = await request.app.state.rates.load(request.app.state.db.shards.primary)
+    return schemas.ReloadRatesResponse(count=count)
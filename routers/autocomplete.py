@@ -0,0 +1,49 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException, Request, Depends
+from core.deps import require_auth
+from core import schemas
+
+__all__ = (
+    "autocomplete",
+)
+
+autocomplete = APIRouter(prefix="/autocomplete")
+
+
+@autocomplete.get("/", dependencies=[Depends(require_auth)])
+async def get_suggestions(request: Request, prefix: str, limit: int = 10) -> schemas.AutocompleteResponse:
+    """Suggests transaction descriptions starting with the given prefix.
+
+    The suggestions are the user's previously used descriptions, most
+    frequently used first. Matching is case insensitive. This endpoint
+    is intended to be called as user types so suggestions are served
+    from memory.
+
+    Query Parameters
+    ~~~~~~~~~~~~~~~~
+    prefix:
+        The text typed so far.
+    limit:
+        The number of suggestions to return. Defaults to 10 and capped
+        at 20 per request.
+    """
+    if limit < 1 or limit > 20:
+        raise HTTPException(422, "limit must be between 1 and 20")
+    if not prefix:
+        raise HTTPException(422, "prefix cannot be empty")
+
+    db = request.app.state.db
+    user_id = request.state.user.id
+    suggestions = await request.app.state.autocomplete.suggest(
+        user_id,
+        prefix,
+        limit,
+        lambda: db.fetch_description_counts(user_id, using_db=db.reader(user_id)),
+    )
+
+    return schemas.AutocompleteResponse(
+        suggestions=[schemas.AutocompleteSuggestion(description=d, count=c) for d, c in suggestions],
+    )
@@ -0,0 +1,49 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException, Request, Response, Depends
+from core.deps import require_auth
+from core.batch import BatchContext, dispatch
+from core import schemas
+
+__all__ = (
+    "batch",
+)
+
+batch = APIRouter(prefix="/batch")
+
+# Batch requests cannot be nested and streaming endpoints never complete.
+_DISALLOWED_PATHS = ("/batch", "/events")
+
+
+@batch.post("/", dependencies=[Depends(require_auth)], response_model=schemas.BatchResponse)
+async def batch_requests(request: Request, data: schemas.BatchRequestJSON) -> Response:
+    """Executes several API requests in a single request.
+
+    The sub-requests are authorized using the authorization of this
+    request. Consecutive GET sub-requests are executed concurrently
+    while other sub-requests are executed in the given order. The
+    failure of a sub-request does not stop the execution of the
+    later sub-requests.
+
+    The responses of sub-requests are returned in the same order
+    as the sub-requests.
+    """
+    for sub in data.requests:
+        path = sub.path.partition("?")[0].rstrip("/")
+        if path.startswith(_DISALLOWED_PATHS):
+            raise HTTPException(422, f"{sub.path!r} cannot be requested in a batch")
+
+    context = BatchContext(request.state.user, request.state.token)
+    responses = await dispatch(
+        request.app,
+        request.scope,
+        context,
+        [(sub.method, sub.path, sub.body) for sub in data.requests],
+    )
+
+    # The response bodies are already serialized so they are
+    # embedded directly instead of being parsed and serialized again.
+    body = b",".join(b'{"status":%d,"body":%s}' % (r.status, r.body) for r in responses)
+    return Response(b'{"responses":[' + body + b"]}", media_type="application/json")
@@ -0,0 +1,116 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from pydantic import UUID4
+from tortoise.transactions import in_transaction
+from fastapi import APIRouter, HTTPException, Request, Response, Depends
+from core.deps import require_auth
+from core import schemas, models
+
+import uuid
+
+__all__ = (
+    "categories",
+)
+
+categories = APIRouter(prefix="/categories")
+
+
+async def fetch_category(request: Request, category_id: UUID4) -> models.Category:
+    """Fetches the requesting user's category using the given ID."""
+    category = await models.Category.filter(id=category_id, user=request.state.user).first()
+
+    if category is None:
+        raise HTTPException(404, "Category not found")
+
+    return category
+
+@categories.post("/", dependencies=[Depends(require_auth)])
+async def create_category(request: Request, data: schemas.CreateCategoryJSON) -> schemas.Category:
+    """Create a category of transactions."""
+    db = request.app.state.db
+    category = data.to_db_model(user=request.state.user)
+
+    async with in_transaction() as conn:
+        await category.save(using_db=conn)
+        result = schemas.Category.from_db_model(category)
+        await db.record_change(
+            request.state.user.id,
+            models.EntityType.CATEGORY,
+            category.id,
+            models.ChangeType.CREATE,
+            result.model_dump(mode="json"),
+            using_db=conn,
+        )
+        await db.bump_version(request.state.user.id, using_db=conn)
+
+    return result
+
+@categories.get("/", dependencies=[Depends(require_auth)])
+async def get_all_categories(request: Request) -> list[schemas.Category]:
+    """Get all categories of the requesting user."""
+    db = request.app.state.db
+    user_id = request.state.user.id
+    rows = await models.Category.filter(user_id=user_id).using_db(db.reader(user_id)).order_by("name")
+    return [schemas.Category.from_db_model(c) for c in rows]
+
+@categories.patch("/{category_id}", dependencies=[Depends(require_auth)])
+async def edit_category(request: Request, category_id: UUID4, data: schemas.EditCategoryJSON) -> schemas.Category:
+    """Update information of a specific category.
+
+    Returns the updated category on success.
+    """
+    db = request.app.state.db
+    category = await fetch_category(request, category_id)
+    category.update_from_dict(data.to_dict())  # type: ignore
+
+    async with in_transaction() as conn:
+        await category.save(using_db=conn)
+        result = schemas.Category.from_db_model(category)
+        await db.record_change(
+            request.state.user.id,
+            models.EntityType.CATEGORY,
+            category.id,
+            models.ChangeType.UPDATE,
+            result.model_dump(mode="json"),
+            using_db=conn,
+        )
+        await db.bump_version(request.state.user.id, using_db=conn)
+
+    return result
+
+@categories.delete("/{category_id}", dependencies=[Depends(require_auth)])
+async def delete_category(request: Request, category_id: UUID4) -> Response:
+    """Delete a category along with its budgets.
+
+    The transactions in this category are uncategorized. No change is
+    recorded for each of these transactions so the clients synchronizing
+    the changes should uncategorize them on deletion of the category.
+
+    Returns 204 No Content on success.
+    """
+    db = request.app.state.db
+    user_id = request.state.user.id
+    category = await fetch_category(request, category_id)
+
+    async with in_transaction() as conn:
+        # The accounts whose budgets or rollups are deleted along with the
+        # category are collected first; their transactions may all be
+        # archived and so not uncategorized.
+        accounts = await db.uncategorize_transactions(user_id, category.id, using_db=conn)
+        for model in (models.Budget, models.CategoryRollup):
+            rows = await model.filter(category_id=category.id).using_db(conn).distinct().values_list("account_id", flat=True)
+            accounts.update(uuid.UUID(str(account_id)) for account_id in rows)
+
+        await category.delete(using_db=conn)
+        await db.record_change(
+            user_id,
+            models.EntityType.CATEGORY,
+            category.id,
+            models.ChangeType.DELETE,
+            using_db=conn,
+        )
+        await db.bump_version(user_id, *accounts, using_db=conn)
+
+    return Response(None, 204)
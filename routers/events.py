@@ -0,0 +1,66 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import AsyncIterator
+from fastapi import APIRouter, Request, Depends
+from fastapi.responses import StreamingResponse
+from core.deps import require_auth
+from core.events import Subscription
+from core import config
+
+import asyncio
+
+__all__ = (
+    "events",
+)
+
+events = APIRouter(prefix="/events")
+
+
+async def _stream(request: Request, subscription: Subscription) -> AsyncIterator[bytes]:
+    try:
+        # Sent immediately so that the client knows the stream is open.
+        yield b": connected\n\n"
+
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), config.EVENTS_HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                yield b": heartbeat\n\n"
+                continue
+
+            if event is None:
+                yield b"event: dropped\ndata: {}\n\n"
+                break
+
+            yield event.payload
+    finally:
+        request.app.state.events.unsubscribe(subscription)
+
+@events.get("/", dependencies=[Depends(require_auth)])
+async def stream_events(request: Request) -> StreamingResponse:
+    """Opens a Server-Sent Events stream of the user's account events.
+
+    The following events are sent:
+
+    - ``transaction.logged``: A transaction was logged. Data includes the
+      ``transaction``, its ``account_id`` and new ``balance`` of the account.
+
+    - ``transaction.edited``: A transaction was edited. Data is same as above.
+
+    - ``transaction.deleted``: A transaction was deleted. Data includes the
+      ``transaction_id``, ``account_id`` and new ``balance`` of the account.
+
+    - ``dropped``: The client did not read the events fast enough and
+      the stream is closed. Client should refetch the data it shows and
+      open a new stream.
+
+    Comments are sent periodically to keep idle connections alive.
+    """
+    subscription = request.app.state.events.subscribe(request.state.user.id)
+    return StreamingResponse(
+        _stream(request, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,134 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from array import array
+from fastapi import APIRouter, HTTPException, Request, Depends
+from core.deps import require_auth
+from core import schemas
+
+import datetime
+import itertools
+import operator
+import uuid
+
+__all__ = (
+    "networth",
+)
+
+networth = APIRouter(prefix="/net-worth")
+
+
+def _check_currencies(request: Request, *currencies: str) -> None:
+    rates = request.app.state.rates
+
+    for currency in currencies:
+        if not rates.has(currency):
+            raise HTTPException(422, f"No exchange rates are available for {currency}")
+
+@networth.get("/", dependencies=[Depends(require_auth)])
+async def get_net_worth(request: Request, currency: str | None = None) -> schemas.NetWorthResponse:
+    """Calculates the user's net worth across all accounts.
+
+    The balance of each account is converted from the account's currency
+    using the latest exchange rates.
+
+    Query Parameters
+    ~~~~~~~~~~~~~~~~
+    currency:
+        The currency to calculate net worth in. Defaults to the base
+        currency of exchange rates.
+    """
+    db = request.app.state.db
+    rates = request.app.state.rates
+    user_id = request.state.user.id
+    currency = currency or rates.base
+    reader = db.reader(user_id)
+
+    accounts = await db.fetch_accounts(user_id, using_db=reader)
+    balances = await db.fetch_balances(user_id, using_db=reader)
+    _check_currencies(request, currency, *(acc["currency"] for acc in accounts))
+
+    today = datetime.datetime.now(datetime.timezone.utc).date()
+    results = []
+
+    for acc in accounts:
+        balance = balances.get(uuid.UUID(str(acc["id"])), 0)
+        results.append(schemas.AccountNetWorth(
+            account_id=acc["id"],
+            currency=acc["currency"],
+            balance=balance,
+            converted=rates.convert(balance, acc["currency"], currency, today),
+        ))
+
+    return schemas.NetWorthResponse(
+        currency=currency,
+        date=today,
+        total=sum(r.converted for r in results),
+        accounts=results,
+    )
+
+@networth.get("/history", dependencies=[Depends(require_auth)])
+async def get_net_worth_history(request: Request, currency: str | None = None, days: int = 30) -> schemas.NetWorthHistoryResponse:
+    """Calculates the user's net worth at the end of each of the last days.
+
+    The daily balances of each account are calculated from the account's
+    current balance and its transactions in the period. The balances of
+    each account are then converted at once using the exchange rates of
+    each day.
+
+    Query Parameters
+    ~~~~~~~~~~~~~~~~
+    currency:
+        The currency to calculate net worth in. Defaults to the base
+        currency of exchange rates.
+    days:
+        The number of days, including today. Defaults to 30 and capped
+        at 366.
+    """
+    if days < 1 or days > 366:
+        raise HTTPException(422, "days must be between 1 and 366")
+
+    db = request.app.state.db
+    rates = request.app.state.rates
+    user_id = request.state.user.id
+    currency = currency or rates.base
+    reader = db.reader(user_id)
+
+    accounts = await db.fetch_accounts(user_id, using_db=reader)
+    _check_currencies(request, currency, *(acc["currency"] for acc in accounts))
+
+    start = datetime.datetime.now(datetime.timezone.utc).date() - datetime.timedelta(days=days - 1)
+    after = datetime.datetime.combine(start, datetime.time(), datetime.timezone.utc)
+    balances = await db.fetch_balances(user_id, using_db=reader)
+    changes = {uuid.UUID(str(acc["id"])): array("q", [0]) * days for acc in accounts}
+
+    # The opening balance of each account is its current balance without
+    # the transactions since the start. The transactions dated after today
+    # are not included in any day. The accounts created after the accounts
+    # were fetched are not included.
+    for account_id, date, amount in await db.fetch_amounts(user_id, after, using_db=reader):
+        if account_id not in changes:
+            continue
+
+        balances[account_id] = balances.get(account_id, 0) - amount
+        day = (date.astimezone(datetime.timezone.utc).date() - start).days
+        if day < days:
+            changes[account_id][day] += amount
+
+    total = array("q", [0]) * days
+
+    for acc in accounts:
+        account_id = uuid.UUID(str(acc["id"]))
+        daily = itertools.accumulate(changes[account_id], initial=balances.get(account_id, 0))
+        next(daily)
+        converted = rates.convert_series(array("q", daily), acc["currency"], currency, start)
+        total = array("q", map(operator.add, total, converted))
+
+    return schemas.NetWorthHistoryResponse(
+        currency=currency,
+        points=[
+            schemas.NetWorthPoint(date=start + datetime.timedelta(days=i), balance=balance)
+            for i, balance in enumerate(total)
+        ],
+    )
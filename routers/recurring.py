@@ -0,0 +1,191 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Iterator
+from pydantic import UUID4
+from tortoise.transactions import in_transaction
+from fastapi import APIRouter, HTTPException, Request, Response, Depends
+from core.deps import require_auth
+from core.recurrence import iter_occurrences, next_occurrence
+from core import schemas, models
+from routers.accounts import fetch_account
+from routers.categories import fetch_category
+
+import datetime
+import heapq
+import itertools
+
+__all__ = (
+    "recurring",
+)
+
+recurring = APIRouter(prefix="/accounts")
+
+
+def _upcoming(rule: models.RecurringRule, end: datetime.datetime) -> Iterator[tuple[datetime.datetime, models.RecurringRule]]:
+    for _, date in iter_occurrences(rule, rule.occurrences, end):
+        yield date, rule
+
+async def fetch_rule(request: Request, account_id: UUID4, rule_id: UUID4) -> models.RecurringRule:
+    """Fetches the recurring rule of the requesting user's account using the given ID."""
+    rule = await models.RecurringRule.filter(id=rule_id, account_id=account_id, user=request.state.user).first()
+
+    if rule is None:
+        raise HTTPException(404, "Recurring rule not found")
+
+    return rule
+
+@recurring.post("/{account_id}/recurring", dependencies=[Depends(require_auth)])
+async def create_rule(request: Request, account_id: UUID4, data: schemas.CreateRecurringRuleJSON) -> schemas.RecurringRule:
+    """Create a recurring rule in the specified financial account.
+
+    The occurrences of the rule are logged as transactions once they are
+    due. This includes the occurrences between the rule's start and the
+    current time if the rule starts in the past.
+    """
+    db = request.app.state.db
+    acc = await fetch_account(request, account_id)
+
+    if data.category_id is not None:
+        await fetch_category(request, data.category_id)
+
+    rule = data.to_db_model(acc)
+
+    async with in_transaction() as conn:
+        await rule.save(using_db=conn)
+        result = schemas.RecurringRule.from_db_model(rule)
+        await db.record_change(
+            request.state.user.id,
+            models.EntityType.RECURRING_RULE,
+            rule.id,
+            models.ChangeType.CREATE,
+            result.model_dump(mode="json"),
+            using_db=conn,
+        )
+
+    return result
+
+@recurring.get("/{account_id}/recurring", dependencies=[Depends(require_auth)])
+async def get_all_rules(request: Request, account_id: UUID4) -> list[schemas.RecurringRule]:
+    """Get all recurring rules of the specified financial account."""
+    acc = await fetch_account(request, account_id)
+    rules = await models.RecurringRule.filter(account=acc).order_by("start")
+    return [schemas.RecurringRule.from_db_model(rule) for rule in rules]
+
+@recurring.patch("/{account_id}/recurring/{rule_id}", dependencies=[Depends(require_auth)])
+async def edit_rule(request: Request, account_id: UUID4, rule_id: UUID4, data: schemas.EditRecurringRuleJSON) -> schemas.RecurringRule:
+    """Edit a recurring rule's information.
+
+    The changes apply to the occurrences that are not logged yet. Returns
+    the updated rule on success.
+    """
+    db = request.app.state.db
+    changes = data.to_dict()
+
+    if changes.get("category_id") is not None:
+        await fetch_category(request, changes["category_id"])
+
+    async with in_transaction() as conn:
+        # The rule is locked so that the scheduler does not log its
+        # occurrences while it is updated.
+        rule = await (
+            models.RecurringRule.filter(id=rule_id, account_id=account_id, user=request.state.user)
+            .using_db(conn)
+            .select_for_update()
+            .first()
+        )
+
+        if rule is None:
+            raise HTTPException(404, "Recurring rule not found")
+
+        rule.update_from_dict(changes)
+        rule.next_date = next_occurrence(rule, rule.occurrences)
+        await rule.save(using_db=conn)
+        result = schemas.RecurringRule.from_db_model(rule)
+        await db.record_change(
+            request.state.user.id,
+            models.EntityType.RECURRING_RULE,
+            rule.id,
+            models.ChangeType.UPDATE,
+            result.model_dump(mode="json"),
+            using_db=conn,
+        )
+
+    return result
+
+@recurring.delete("/{account_id}/recurring/{rule_id}", dependencies=[Depends(require_auth)])
+async def delete_rule(request: Request, account_id: UUID4, rule_id: UUID4) -> Response:
+    """Delete a recurring rule.
+
+    The transactions already logged by the rule are not deleted. On
+    successful deletion, 204 No Content response is returned.
+    """
+    db = request.app.state.db
+    rule = await fetch_rule(request, account_id, rule_id)
+
+    async with in_transaction() as conn:
+        await rule.delete(using_db=conn)
+        await db.record_change(
+            request.state.user.id,
+            models.EntityType.RECURRING_RULE,
+            rule.id,
+            models.ChangeType.DELETE,
+            using_db=conn,
+        )
+
+    return Response(None, 204)
+
+@recurring.get("/{account_id}/forecast", dependencies=[Depends(require_auth)])
+async def forecast(request: Request, account_id: UUID4, days: int = 30, limit: int = 50) -> schemas.ForecastResponse:
+    """Forecasts the account's balance using its recurring rules.
+
+    The future occurrences of the rules are calculated from the rules when
+    requested and are not stored. The occurrences that are due but not yet
+    logged are included.
+
+    Query Parameters
+    ~~~~~~~~~~~~~~~~
+    days:
+        The number of days from now to forecast. Defaults to 30 and
+        capped at 366.
+    limit:
+        The number of upcoming occurrences to return in response. This
+        does not affect the projected balance. Defaults to 50 and capped
+        at 200.
+    """
+    if days < 1 or days > 366:
+        raise HTTPException(422, "days must be between 1 and 366")
+    if limit < 0 or limit > 200:
+        raise HTTPException(422, "limit must be between 0 and 200")
+
+    db = request.app.state.db
+    acc = await fetch_account(request, account_id)
+    reader = db.reader(request.state.user.id)
+    end = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(days=days)
+    rules = await models.RecurringRule.filter(account=acc, next_date__lte=end).using_db(reader)
+    balance = await db.fetch_balance(acc.id, using_db=reader)
+
+    # The occurrences are generated one by one and only the returned
+    # ones are kept in memory.
+    projected = balance + sum(
+        rule.amount * sum(1 for _ in iter_occurrences(rule, rule.occurrences, end))
+        for rule in rules
+    )
+
+    upcoming = heapq.merge(
+        *(_upcoming(rule, end) for rule in rules),
+        key=lambda o: o[0],
+    )
+    occurrences = [
+        schemas.ForecastOccurrence(
+            rule_id=rule.id,
+            date=date,
+            amount=rule.amount,
+            description=rule.description,
+            category_id=rule.category_id,  # type: ignore
+        )
+        for date, rule in itertools.islice(upcoming, limit)
+    ]
+
+    return schemas.ForecastResponse(balance=balance, projected_balance=projected, occurrences=occurrences)
@@ -0,0 +1,92 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Literal
+from pydantic import UUID4
+from tortoise.transactions import in_transaction
+from fastapi import APIRouter, HTTPException, Request, Depends
+from core.deps import require_auth
+from core.statements import StatementError, StatementParser, OFXParser, QIFParser, read_statement
+from core import schemas, models, config
+from routers.accounts import fetch_account, publish_transaction_event
+from routers.categories import fetch_category
+
+__all__ = (
+    "statements",
+)
+
+statements = APIRouter(prefix="/accounts")
+
+
+@statements.post("/{account_id}/import", dependencies=[Depends(require_auth)])
+async def import_statement(
+    request: Request,
+    account_id: UUID4,
+    format: Literal["ofx", "qif"],
+    category_id: UUID4 | None = None,
+    day_first: bool = False,
+) -> schemas.ImportStatementResponse:
+    """Import the transactions of a bank statement into the specified financial account.
+
+    The statement file is sent as the request body and is parsed as it
+    is received. The transactions are logged in batches, each in its own
+    database transaction, so a failed import keeps the batches logged
+    before the failure. Importing the statement again logs the rest.
+
+    The transactions that were already imported in the account (using
+    the ID assigned by the bank or, if none, their data) are skipped so
+    overlapping statements can be imported.
+
+    Query Parameters
+    ~~~~~~~~~~~~~~~~
+    format:
+        The format of the statement, either ``ofx`` (OFX or QFX) or ``qif``.
+    category_id:
+        The category of the imported transactions, if any.
+    day_first:
+        Whether the dates of QIF statement are in D/M/Y instead of M/D/Y
+        format. Defaults to false.
+    """
+    db = request.app.state.db
+    acc = await fetch_account(request, account_id)
+
+    if category_id is not None:
+        await fetch_category(request, category_id)
+
+    parser: StatementParser = OFXParser() if format == "ofx" else QIFParser(day_first)
+    imported = duplicates = 0
+
+    try:
+        async for batch in read_statement(request.stream(), parser, config.IMPORT_BATCH_SIZE):
+            async with in_transaction() as conn:
+                # The account is locked so that the concurrent imports of
+                # the same statement do not both log its transactions.
+                await models.FinancialAccount.filter(id=acc.id).using_db(conn).select_for_update().first()
+                seen = await db.fetch_external_ids(acc.id, (external_id for external_id, _ in batch), using_db=conn)
+                transactions = []
+
+                for external_id, data in batch:
+                    if external_id in seen:
+                        duplicates += 1
+                        continue
+
+                    seen.add(external_id)
+                    transaction = data.to_db_model(acc)
+                    transaction.category_id = category_id  # type: ignore
+                    transaction.external_id = external_id
+                    transactions.append(transaction)
+
+                if transactions:
+                    await db.insert_transactions(transactions, using_db=conn)
+                    await db.bump_version(acc.id, using_db=conn)
+
+            imported += len(transactions)
+    except StatementError as e:
+        raise HTTPException(422, str(e)) from None
+    finally:
+        if imported:
+            request.app.state.autocomplete.discard(request.state.user.id)
+
+    await publish_transaction_event(request, acc.id, "transactions.imported", {"imported": imported})
+    return schemas.ImportStatementResponse(imported=imported, duplicates=duplicates, skipped=parser.skipped)
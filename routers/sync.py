@@ -0,0 +1,101 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException, Request, Depends
+from core.deps import require_auth
+from core import schemas, models
+
+__all__ = (
+    "sync",
+)
+
+sync = APIRouter(prefix="/sync")
+
+
+def _compact(entries: list[models.ChangeLogEntry]) -> list[schemas.Change]:
+    # Keeps only the latest change of each entity. Entities that are
+    # both created and deleted within the changes are dropped entirely
+    # as the client has never seen them.
+    changes: dict[tuple[int, str], schemas.Change] = {}
+
+    for entry in entries:
+        key = (entry.entity_type, str(entry.entity_id))
+        previous = changes.pop(key, None)
+        change_type = entry.change_type
+
+        if previous is not None and previous.change_type is models.ChangeType.CREATE:
+            if change_type is models.ChangeType.DELETE:
+                continue
+            change_type = models.ChangeType.CREATE
+
+        changes[key] = schemas.Change(
+            sequence=entry.sequence,
+            entity_type=entry.entity_type,
+            entity_id=entry.entity_id,
+            change_type=change_type,
+            data=entry.data,  # type: ignore
+        )
+
+    return sorted(changes.values(), key=lambda c: c.sequence)
+
+@sync.get("/", dependencies=[Depends(require_auth)])
+async def get_changes(request: Request, since: int = 0, limit: int = 100) -> schemas.SyncResponse:
+    """Returns the changes made to user's data after the given sequence number.
+
+    The changes are compacted i.e. only the latest change of each entity
+    is returned. The entity's data after the change is included in the
+    change. Deleting an account implicitly deletes its transactions.
+
+    Changes are paginated: the returned ``next`` sequence number should
+    be passed as ``since`` to obtain the next page.
+
+    Errors:
+
+    - 410 Gone: The changes after given sequence number have been pruned
+      from change log. Client must download all data again and use the
+      sequence number from GET /sync/cursor as ``since``.
+
+    Query Parameters
+    ~~~~~~~~~~~~~~~~
+    since:
+        The sequence number after which the changes are returned.
+        Defaults to 0.
+    limit:
+        The number of change log entries to consider. Defaults to 100
+        and capped at 500 per request. Due to compaction, the number of
+        returned changes may be less than this.
+    """
+    if limit < 1 or limit > 500:
+        raise HTTPException(422, "limit must be between 1 and 500")
+
+    pruned = await models.PrunedChanges.filter(user=request.state.user).first().values_list("sequence", flat=True)
+    _, sync_floor = await request.app.state.db.get_shard_assignment(request.state.user.id)
+
+    if since < sync_floor or (pruned is not None and since < pruned):  # type: ignore
+        raise HTTPException(410, "Changes after this sequence number are no longer available")
+
+    entries = await (
+        models.ChangeLogEntry.filter(user=request.state.user, sequence__gt=since)
+        .order_by("sequence")
+        .limit(limit + 1)
+    )
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    return schemas.SyncResponse(
+        changes=_compact(entries),
+        next=entries[-1].sequence if entries else since,
+        has_more=has_more,
+    )
+
+@sync.get("/cursor", dependencies=[Depends(require_auth)])
+async def get_sync_cursor(request: Request) -> schemas.SyncCursorResponse:
+    """Returns the latest sequence number in change log.
+
+    Client should obtain this before downloading all of its data and
+    pass it as ``since`` to GET /sync for subsequent synchronizations.
+    """
+    latest = await models.ChangeLogEntry.all().order_by("-sequence").first().values_list("sequence", flat=True)
+    _, sync_floor = await request.app.state.db.get_shard_assignment(request.state.user.id)
+    return schemas.SyncCursorResponse(sequence=max(latest or 0, sync_floor))  # type: ignore
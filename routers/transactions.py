@@ -0,0 +1,130 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Any, Callable, TypeVar
+from pydantic import UUID4
+from fastapi import APIRouter, HTTPException, Request, Response, Depends
+from core.deps import require_auth
+from core.responses import ORJSONResponse
+from core import schemas
+from routers.accounts import fetch_account
+
+import datetime
+import uuid
+
+__all__ = (
+    "transactions",
+)
+
+transactions = APIRouter(prefix="/transactions")
+
+_T = TypeVar("_T")
+
+
+# Cursors are the sort key of the last returned transaction followed by its ID.
+def _make_cursor(key: Any, transaction: dict[str, Any]) -> str:
+    return f"{key}:{transaction['id']}"
+
+def _parse_cursor(cursor: str, parse_key: Callable[[str], _T]) -> tuple[_T, uuid.UUID]:
+    key, _, transaction_id = cursor.rpartition(":")
+    try:
+        return parse_key(key), uuid.UUID(transaction_id)
+    except ValueError:
+        raise HTTPException(422, "Invalid cursor provided") from None
+
+def _parse_date(value: str) -> datetime.datetime:
+    date = datetime.datetime.fromisoformat(value)
+    if date.tzinfo is None:
+        raise ValueError("naive datetime")
+    return date
+
+@transactions.get("/", dependencies=[Depends(require_auth)], response_model=schemas.TransactionFeedResponse)
+async def get_feed(request: Request, before: str | None = None, limit: int = 20) -> Response:
+    """Returns the user's latest transactions across all accounts.
+
+    The transactions are ordered by date, latest first. The returned
+    ``next`` cursor should be passed as ``before`` to obtain the next
+    page.
+
+    Query Parameters
+    ~~~~~~~~~~~~~~~~
+    before:
+        The cursor returned by previous request.
+    limit:
+        The number of transactions to return in response. Defaults to
+        20 and capped at 40 per request.
+    """
+    if limit < 1 or limit > 40:
+        raise HTTPException(422, "limit must be between 1 and 40")
+
+    db = request.app.state.db
+    user_id = request.state.user.id
+    results = await db.fetch_feed(
+        user_id,
+        before=_parse_cursor(before, _parse_date) if before else None,
+        limit=limit,
+        using_db=db.reader(user_id),
+    )
+
+    if len(results) == limit:
+        date = results[-1]["date"].astimezone(datetime.timezone.utc)
+        next = _make_cursor(date.isoformat().replace("+00:00", "Z"), results[-1])
+    else:
+        next = None
+
+    return ORJSONResponse({"transactions": results, "next": next})
+
+@transactions.get("/search", dependencies=[Depends(require_auth)], response_model=schemas.SearchTransactionsResponse)
+async def search_transactions(
+    request: Request,
+    q: str,
+    account_id: UUID4 | None = None,
+    after: str | None = None,
+    limit: int = 20,
+) -> Response:
+    """Searches the user's transactions by their description.
+
+    All words in the query must appear in the transaction's description.
+    Transactions are ordered by relevance. The returned ``next`` cursor
+    should be passed as ``after`` to obtain the next page.
+
+    Query Parameters
+    ~~~~~~~~~~~~~~~~
+    q:
+        The words to search for.
+    account_id:
+        If provided, only the transactions of this account are searched.
+    after:
+        The cursor returned by previous request.
+    limit:
+        The number of transactions to return in response. Defaults to
+        20 and capped at 40 per request.
+    """
+    if limit < 1 or limit > 40:
+        raise HTTPException(422, "limit must be between 1 and 40")
+    if not q.split():
+        raise HTTPException(422, "q cannot be empty")
+
+    db = request.app.state.db
+    user_id = request.state.user.id
+
+    if account_id is not None:
+        await fetch_account(request, account_id)
+
+    results = await db.search_transactions(
+        user_id,
+        q,
+        account_id=account_id,
+        after=_parse_cursor(after, float) if after else None,
+        limit=limit,
+        using_db=db.reader(user_id),
+    )
+
+    if len(results) == limit:
+        rank, last = results[-1]
+        next = _make_cursor(repr(rank), last)
+    else:
+        next = None
+
+    return ORJSONResponse({"transactions": [t for _, t in results], "next": next})
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from typing import Any, Annotated
 from fastapi import APIRouter, HTTPException, Request, Response, Header, Depends
+from tortoise.transactions import in_transaction
 from core.deps import require_auth
 from core import schemas, models, utils
 
+import hmac
+
 __all__ = (
     "user",
 )
@@ -15,7 +18,7 @@ user = APIRouter(prefix="/user")
 
 
 @user.post("/")
-async def create_user(data: schemas.CreateUserJSON) -> dict[str, Any]:
+async def create_user(request: Request, data: schemas.CreateUserJSON) -> dict[str, Any]:
     """Create a user.
 
     This endpoint acts as the "sign up" route.
@@ -28,8 +31,19 @@ async def create_user(data: schemas.CreateUserJSON) -> dict[str, Any]:
     if existing:
         raise HTTPException(409, "This username is already taken.")
 
+    db = request.app.state.db
     user = data.to_db_model()
-    await user.save()
+    await db.create_user(user)
+
+    async with db.route(user.id), in_transaction() as conn:
+        await db.record_change(
+            user.id,
+            models.EntityType.USER,
+            user.id,
+            models.ChangeType.CREATE,
+            schemas.PublicUser.from_db_model(user).model_dump(mode="json"),
+            using_db=conn,
+        )
 
     # This endpoint returns a "partial" user object containing only
     # the listed fields. While it's possible to return a complete user
@@ -54,10 +68,33 @@ async def get_user(header: Annotated[schemas.GetUserHeader, Header()]) -> schema
     """
     user = await models.User.filter(username=header.x_user_username).first()
 
-    if user is None or utils.fernet_decrypt(user.password) != header.x_user_password:
+    if user is None:
+        raise HTTPException(404, "Invalid username or password")
+
+    # The password is verified using its digest so that only the token
+    # is decrypted. Users created before the digest was stored have their
+    # password decrypted once and the digest is stored for next time.
+    digest = utils.password_digest(header.x_user_password)
+
+    if user.password_digest is None:
+        if utils.fernet_decrypt(user.password) != header.x_user_password:
+            raise HTTPException(404, "Invalid username or password")
+
+        user.password_digest = digest
+        await user.save(update_fields=["password_digest"])
+    elif not hmac.compare_digest(user.password_digest, digest):
         raise HTTPException(404, "Invalid username or password")
 
-    return schemas.User.from_db_model(user)
+    return schemas.User.from_db_model(user, password=header.x_user_password)
+
+@user.get("/me", dependencies=[Depends(require_auth)])
+async def get_profile(request: Request) -> schemas.PublicUser:
+    """Gets the profile of the authorized user.
+
+    Unlike the "sign in" route, the returned user does not include
+    the credentials (password and token).
+    """
+    return schemas.PublicUser.from_db_model(request.state.user)
 
 @user.patch("/", dependencies=[Depends(require_auth)])
 async def update_user(request: Request, data: schemas.EditUserJSON) -> schemas.User:
@@ -70,7 +107,14 @@ async def update_user(request: Request, data: schemas.EditUserJSON) -> schemas.U
     - 409 Conflict: The new username is already taken.
     """
     user: models.User = request.state.user
-    update_data = data.to_dict()
+    token: str = request.state.token
+
+    # If the password is changed, the token is regenerated. Keep the new
+    # token so that it does not have to be decrypted for the response.
+    if data.password is not utils.MISSING:
+        token = utils.generate_user_token()
+
+    update_data = data.to_dict(token=token)
 
     # Validate uniqueness of username
     if "username" in update_data and update_data["username"] != user.username:
@@ -79,9 +123,26 @@ async def update_user(request: Request, data: schemas.EditUserJSON) -> schemas.U
             raise HTTPException(409, "The new username is already taken.")
 
     user.update_from_dict(update_data)  # type: ignore
-    await user.save()
 
-    return schemas.User.from_db_model(user)
+    async with in_transaction() as conn:
+        # The connection is not passed as users are stored in the
+        # primary database which may differ from the user's shard.
+        await user.save()
+        await request.app.state.db.record_change(
+            user.id,
+            models.EntityType.USER,
+            user.id,
+            models.ChangeType.UPDATE,
+            schemas.PublicUser.from_db_model(user).model_dump(mode="json"),
+            using_db=conn,
+        )
+        await request.app.state.db.bump_version(user.id, using_db=conn)
+
+
+    if data.password is utils.MISSING:
+        return schemas.User.from_db_model(user, token=token)
+
+    return schemas.User.from_db_model(user, password=data.password, token=token)
 
 @user.delete("/", dependencies=[Depends(require_auth)])
 async def delete_user(request: Request) -> Response:
@@ -90,6 +151,11 @@ async def delete_user(request: Request) -> Response:
     Returns 204 No Content on successful deletion.
     """
     user: models.User = request.state.user
-    await user.delete()
+
+    # The user's change log is deleted along with the user so
+    # no change is recorded here.
+    await request.app.state.db.delete_user(user)
+
+    request.app.state.autocomplete.discard(user.id)
 
     return Response(None, 204)
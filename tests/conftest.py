@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 from typing import Any
+from tortoise import Tortoise
+from core.database import get_tortoise_config
+from core import config
 from app import app
 
+import asyncio
+import glob
 import os
 
 
@@ -12,10 +17,27 @@ def _rm_if_exist(path: str):
     if os.path.exists(path):
         os.remove(path)
 
+async def _create_database():
+    await Tortoise.init(config=get_tortoise_config(config.TEST_DATABASE_URL), _create_db=True)
+    await Tortoise.close_connections()
+
+async def _drop_database():
+    await Tortoise.init(config=get_tortoise_config(config.TEST_DATABASE_URL))
+    await Tortoise._drop_databases()
+
 def pytest_sessionstart(*args: Any):
     app.state.pytest_running = True
 
+    # SQLite creates the database file itself. Other test databases are
+    # created once for the session as each test module starts the app.
+    if not config.TEST_DATABASE_URL.startswith("sqlite://"):
+        asyncio.run(_create_database())
+
 def pytest_sessionfinish(*args: Any):
-    _rm_if_exist("db-test.sqlite3")
-    _rm_if_exist("db-test.sqlite3-shm")
-    _rm_if_exist("db-test.sqlite3-wal")
+    if not config.TEST_DATABASE_URL.startswith("sqlite://"):
+        asyncio.run(_drop_database())
+        return
+
+    # Includes the shards (db-test-shardN.sqlite3) created by tests.
+    for path in glob.glob("db-test*.sqlite3*"):
+        _rm_if_exist(path)
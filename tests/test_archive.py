@@ -0,0 +1,101 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from tests.commons import make_headers
+from core.archive import archive_path, archive_transactions
+from core import models, config
+from app import app
+
+import datetime
+import sqlite3
+import pytest
+
+
+def _count(path: str, account_id: str) -> int:
+    with sqlite3.connect(path) as conn:
+        table = models.Transaction._meta.db_table
+        return conn.execute(f'SELECT COUNT(*) FROM "{table}" WHERE account_id = ?', [account_id]).fetchone()[0]
+
+@pytest.mark.skipif(not config.TEST_DATABASE_URL.startswith("sqlite://"), reason="archival requires SQLite")
+def test_archive():
+    with TestClient(app) as client:
+        db = app.state.db
+        path = db.shards.primary_path
+
+        async def archive() -> int:
+            async with db.shards.route(0) as conn:
+                return await archive_transactions(conn, datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc))
+
+        response = client.post("/user", json={"username": "tester-archive", "password": "123456789"})
+        assert response.status_code == 200
+        headers = make_headers(response.json())
+
+        response = client.post("/accounts", json={"name": "Old"}, headers=headers)
+        assert response.status_code == 200
+        account_id = response.json()["id"]
+        url = f"/accounts/{account_id}/transactions"
+
+        ids = []
+        for amount, year in [(-100, 1990), (500, 1995), (-50, 2023)]:
+            date = datetime.datetime(year, 1, 1, tzinfo=datetime.timezone.utc).isoformat()
+            response = client.post(url, json={"amount": amount, "date": date}, headers=headers)
+            assert response.status_code == 200
+            ids.append(response.json()["id"])
+
+        assert client.portal.call(archive) == 2
+        assert _count(path, account_id) == 1
+        assert _count(archive_path(path), account_id) == 2
+
+        def _amounts(**params: str) -> list[int]:
+            response = client.get(url, params=params, headers=headers)
+            assert response.status_code == 200
+            return [t["amount"] for t in response.json()]
+
+        # Reads span the database and archive when they reach past the checkpoint.
+        assert _amounts() == [-50, 500, -100]
+        assert _amounts(limit="1") == [-50]
+        assert _amounts(order="asc", limit="2") == [-100, 500]
+        assert _amounts(before="1996-01-01T00:00:00Z") == [500, -100]
+        assert _amounts(after="2000-01-01T00:00:00Z") == [-50]
+
+        response = client.get("/transactions", headers=headers)
+        assert response.status_code == 200
+        assert [t["id"] for t in response.json()["transactions"]] == ids[::-1]
+
+        response = client.get(f"/accounts/{account_id}/balance", headers=headers)
+        assert response.json()["balance"] == 350
+        response = client.get(f"/accounts/{account_id}/transactions-count", headers=headers)
+        assert response.json()["count"] == 3
+
+        # Archived transactions are read-only.
+        response = client.delete(f"{url}/{ids[0]}", headers=headers)
+        assert response.status_code == 404
+
+        assert client.portal.call(archive) == 0
+        response = client.get(f"/accounts/{account_id}/balance", headers=headers)
+        assert response.json()["balance"] == 350
+
+        response = client.post("/accounts", json={"name": "Other"}, headers=headers)
+        assert response.status_code == 200
+        other_id = response.json()["id"]
+        date = datetime.datetime(1999, 1, 1, tzinfo=datetime.timezone.utc).isoformat()
+        response = client.post(f"/accounts/{other_id}/transactions", json={"amount": 10, "date": date}, headers=headers)
+        assert response.status_code == 200
+        other_ids = [response.json()["id"]]
+        assert client.portal.call(archive) == 1
+
+        # The archived transactions of deleted accounts are not read and
+        # are removed by next archival.
+        response = client.delete(f"/accounts/{account_id}", headers=headers)
+        assert response.status_code == 204
+
+        response = client.get("/transactions", headers=headers)
+        assert [t["id"] for t in response.json()["transactions"]] == other_ids
+
+        client.portal.call(archive)
+        assert _count(archive_path(path), account_id) == 0
+
+        response = client.delete("/user", headers=headers)
+        assert response.status_code == 204
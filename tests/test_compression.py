@@ -0,0 +1,76 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from tests.commons import make_headers, RouterTestState
+from core.schemas import User
+from core import config
+from app import app
+
+import pytest
+
+@pytest.fixture(scope="module")
+def state():
+    with TestClient(app) as client:
+        response = client.post(
+            "/user",
+            json={
+                "username": "tester-compression",
+                "password": "123456789",
+            }
+        )
+        assert response.status_code == 200
+
+        state = RouterTestState(client, User(**response.json()))
+        assert state.user is not None
+
+        for i in range(20):
+            response = state.client.post(
+                "/accounts",
+                json={"name": f"Account {i}", "description": "Compressed account " * 5},
+                headers=make_headers(state.user),
+            )
+            assert response.status_code == 200
+
+        yield state
+
+
+def test_compressed_response(state: RouterTestState):
+    assert state.user is not None
+
+    headers = make_headers(state.user)
+    headers["Accept-Encoding"] = "gzip"
+
+    response = state.client.get("/accounts", headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == "gzip"
+    assert "Accept-Encoding" in response.headers.get("vary", "")
+    assert len(response.json()) == 20
+
+    # Compressed bytes are served from cache for identical responses.
+    cached = state.client.get("/accounts", headers=headers)
+
+    assert cached.status_code == 200
+    assert cached.headers.get("content-encoding") == "gzip"
+    assert cached.content == response.content
+
+def test_uncompressed_response(state: RouterTestState):
+    assert state.user is not None
+
+    # Encoding not accepted
+    headers = make_headers(state.user)
+    headers["Accept-Encoding"] = "gzip;q=0, br"
+
+    response = state.client.get("/accounts", headers=headers)
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+    # Below minimum size
+    response = state.client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert len(response.content) < config.COMPRESSION_MINIMUM_SIZE
+    assert "content-encoding" not in response.headers
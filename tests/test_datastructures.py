@@ -0,0 +1,52 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from core.datastructures import LRUCache, SizedLRUCache
+
+
+def test_lru_cache():
+    cache = LRUCache[str, int](2)
+
+    cache.insert("a", 1)
+    cache.insert("b", 2)
+
+    # "a" is now most recently used so "b" is evicted.
+    assert cache.get("a") == 1
+    cache.insert("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    # Updating an existing key does not evict.
+    cache.insert("c", 4)
+
+    assert cache.get("a") == 1
+    assert cache.get("c") == 4
+    assert cache.delete("c") == 4
+    assert cache.get("c") is None
+
+def test_sized_lru_cache():
+    cache = SizedLRUCache[str, bytes](10)
+
+    cache.insert("a", b"aaaa", 4)
+    cache.insert("b", b"bbbb", 4)
+    assert cache.size == 8
+
+    assert cache.get("a") == b"aaaa"
+    cache.insert("c", b"cccc", 4)
+
+    assert cache.get("b") is None
+    assert cache.size == 8
+
+    # Entries larger than the limit are not cached.
+    cache.insert("d", b"d" * 11, 11)
+
+    assert cache.get("d") is None
+    assert cache.size == 8
+
+    cache.insert("a", b"aa", 2)
+
+    assert cache.get("a") == b"aa"
+    assert cache.size == 6
@@ -0,0 +1,38 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from array import array
+from core.reports import ReportExecutor, ReportTimeout, ReportType
+
+import asyncio
+import multiprocessing
+import pytest
+
+
+def test_report_timeout():
+    dates = array("d", (86400.0 * i for i in range(1000)))
+    amounts = array("q", range(1000))
+
+    async def load_columns() -> tuple[array[float], array[int]]:
+        return dates, amounts
+
+    async def main() -> None:
+        children = len(multiprocessing.active_children())
+        executor = ReportExecutor(1, 0, 8)
+
+        # The workers of a timed out report are killed rather than left
+        # running and the next report runs in a new pool.
+        for _ in range(2):
+            with pytest.raises(ReportTimeout):
+                await executor.run(ReportType.MONTHLY, 1, {}, load_columns)
+            assert len(multiprocessing.active_children()) == children
+
+        executor.close()
+
+        executor = ReportExecutor(1, 30, 8)
+        result = await executor.run(ReportType.MONTHLY, 1, {}, load_columns)
+        assert sum(m["income"] for m in result["months"]) == sum(amounts)
+        executor.close()
+
+    asyncio.run(main())
@@ -5,9 +5,11 @@ from __future__ import annotations
 from fastapi.testclient import TestClient
 from tests.commons import make_headers, RouterTestState
 from core.schemas import User
+from core.database import DatabaseClient
 from app import app
 
 import pytest
+import uuid
 
 @pytest.fixture(scope="module")
 def state():
@@ -178,3 +180,35 @@ def test_delete_user(state: RouterTestState):
     )
 
     assert response.status_code == 404
+
+def test_conditional_requests(state: RouterTestState):
+    assert state.user is not None
+
+    response = state.client.get("/accounts", headers=make_headers(state.user))
+
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = state.client.get("/accounts", headers={**make_headers(state.user), "If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = state.client.post(
+        "/accounts",
+        json={"name": "conditional account"},
+        headers=make_headers(state.user),
+    )
+    assert response.status_code == 200
+
+    response = state.client.get("/accounts", headers={**make_headers(state.user), "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+    # The versions are stored in the database and shared by all processes.
+    db = app.state.db
+    version = state.client.portal.call(db.get_version, state.user.id)
+    assert version > 0
+    assert state.client.portal.call(DatabaseClient(db.shards).get_version, state.user.id) == version
+
+    # The wildcard does not match as the account is not checked beforehand.
+    response = state.client.get(f"/accounts/{uuid.uuid4()}", headers={**make_headers(state.user), "If-None-Match": "*"})
+    assert response.status_code == 404
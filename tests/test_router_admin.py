@@ -0,0 +1,56 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from core.backup import verify_backup
+from core import config
+from app import app
+
+import os
+import pathlib
+import time
+import pytest
+
+
+@pytest.mark.skipif(not config.TEST_DATABASE_URL.startswith("sqlite://"), reason="backups require SQLite")
+def test_backup(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path):
+    monkeypatch.setattr(config, "BACKUP_DIR", str(tmp_path))
+    monkeypatch.setattr(config, "BACKUP_STEP_PAGES", 16)
+    monkeypatch.setattr(config, "BACKUP_STEP_DELAY", 1)
+
+    with TestClient(app) as client:
+        # Admin endpoints are disabled without an admin token.
+        monkeypatch.setattr(config, "ADMIN_TOKEN", "")
+        assert client.get("/admin/backup").status_code == 404
+
+        monkeypatch.setattr(config, "ADMIN_TOKEN", "secret")
+        assert client.get("/admin/backup", headers={"X-Admin-Token": "wrong"}).status_code == 401
+
+        headers = {"X-Admin-Token": "secret"}
+        assert client.get("/admin/backup", headers=headers).status_code == 404
+
+        response = client.post("/admin/backup", json={"compress": True, "verify": True}, headers=headers)
+        assert response.status_code == 202
+        assert response.json()["running"]
+
+        for _ in range(100):
+            status = client.get("/admin/backup", headers=headers).json()
+            if not status["running"]:
+                break
+            time.sleep(0.1)
+
+        assert status["error"] is None
+        assert status["verified"]
+        assert status["files_done"] == len(status["files"])
+        assert status["pages_copied"] == status["pages_total"] > 0
+
+        [directory] = os.listdir(tmp_path)
+        backups = os.listdir(tmp_path / directory)
+        assert sorted(backups) == sorted(os.path.basename(f) + ".gz" for f in status["files"])
+        assert all(verify_backup(str(tmp_path / directory / b)) is None for b in backups)
+
+def test_verify_backup(tmp_path: pathlib.Path):
+    path = tmp_path / "db.sqlite3.gz"
+    path.write_bytes(b"not a backup")
+    assert verify_backup(str(path)) is not None
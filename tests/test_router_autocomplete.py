@@ -0,0 +1,90 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from tests.commons import make_headers, RouterTestState
+from core.autocomplete import PrefixIndex
+from core.schemas import User, FinancialAccount
+from app import app
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def state():
+    with TestClient(app) as client:
+        response = client.post(
+            "/user",
+            json={
+                "username": "tester-router-autocomplete",
+                "password": "123456789",
+            }
+        )
+        assert response.status_code == 200
+
+        state = RouterTestState(client, User(**response.json()))
+        assert state.user is not None
+
+        response = state.client.post("/accounts", json={"name": "Bank"}, headers=make_headers(state.user))
+        assert response.status_code == 200
+        state.baton["account"] = FinancialAccount(**response.json())
+
+        yield state
+
+
+def test_prefix_index():
+    index = PrefixIndex()
+    index.add("Coffee", 2)
+    index.add("coffee")
+    index.add("Cold drink")
+    index.add("Rent", 5)
+
+    assert index.suggest("co", 10) == [("Coffee", 3), ("Cold drink", 1)]
+    assert index.suggest("COF", 10) == [("Coffee", 3)]
+    assert index.suggest("co", 1) == [("Coffee", 3)]
+    assert index.suggest("x", 10) == []
+
+    size = index.size
+    index.remove("Cold drink")
+
+    assert index.suggest("co", 10) == [("Coffee", 3)]
+    assert index.size < size
+
+def _suggest(state: RouterTestState, prefix: str) -> list[tuple[str, int]]:
+    assert state.user is not None
+    response = state.client.get("/autocomplete", params={"prefix": prefix}, headers=make_headers(state.user))
+    assert response.status_code == 200
+    return [(s["description"], s["count"]) for s in response.json()["suggestions"]]
+
+def test_autocomplete(state: RouterTestState):
+    assert state.user is not None
+    headers = make_headers(state.user)
+    url = "/accounts/{account_id}/transactions".format(account_id=state.baton["account"].id)
+
+    for description in ("Groceries", "Groceries", "Gym membership", None):
+        response = state.client.post(url, json={"amount": -100, "description": description}, headers=headers)
+        assert response.status_code == 200
+
+    # The index is built from the database on first request.
+    assert _suggest(state, "g") == [("Groceries", 2), ("Gym membership", 1)]
+
+    # Then it is kept up to date by the writes.
+    response = state.client.post(url, json={"amount": -100, "description": "Gym membership"}, headers=headers)
+    assert response.status_code == 200
+    transaction_id = response.json()["id"]
+    response = state.client.post(url, json={"amount": -100, "description": "Gym membership"}, headers=headers)
+    assert response.status_code == 200
+
+    assert _suggest(state, "g") == [("Gym membership", 3), ("Groceries", 2)]
+
+    response = state.client.patch(f"{url}/{transaction_id}", json={"description": "Gas"}, headers=headers)
+    assert response.status_code == 200
+    assert _suggest(state, "g") == [("Groceries", 2), ("Gym membership", 2), ("Gas", 1)]
+
+    response = state.client.delete(f"{url}/{transaction_id}", headers=headers)
+    assert response.status_code == 204
+    assert _suggest(state, "ga") == []
+
+    response = state.client.get("/autocomplete", params={"prefix": ""}, headers=headers)
+    assert response.status_code == 422
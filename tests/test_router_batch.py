@@ -0,0 +1,107 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from tests.commons import make_headers, RouterTestState
+from core.schemas import User
+from core import models
+from app import app
+
+import pytest
+
+@pytest.fixture(scope="module")
+def state():
+    with TestClient(app) as client:
+        response = client.post(
+            "/user",
+            json={
+                "username": "tester-router-batch",
+                "password": "123456789",
+            }
+        )
+        assert response.status_code == 200
+
+        state = RouterTestState(client, User(**response.json()))
+        assert state.user is not None
+
+        response = client.post("/accounts", json={"name": "Batched"}, headers=make_headers(state.user))
+        assert response.status_code == 200
+        state.baton["account"] = response.json()
+
+        yield state
+
+
+def test_batch(state: RouterTestState, monkeypatch: pytest.MonkeyPatch):
+    assert state.user is not None
+
+    account_id = state.baton["account"]["id"]
+    url = f"/accounts/{account_id}"
+    fetched = 0
+    original_filter = models.FinancialAccount.filter
+
+    def counting_filter(*args, **kwargs):
+        nonlocal fetched
+        if "id" in kwargs:
+            fetched += 1
+        return original_filter(*args, **kwargs)
+
+    monkeypatch.setattr(models.FinancialAccount, "filter", counting_filter)
+
+    response = state.client.post(
+        "/batch",
+        json={
+            "requests": [
+                {"method": "POST", "path": f"{url}/transactions", "body": {"amount": 100}},
+                {"method": "POST", "path": f"{url}/transactions", "body": {"amount": -40}},
+                {"method": "GET", "path": f"{url}/balance"},
+                {"method": "GET", "path": f"{url}/transactions?limit=1"},
+                {"method": "GET", "path": "/accounts"},
+                {"method": "PATCH", "path": url, "body": {"name": "Renamed"}},
+                {"method": "GET", "path": url},
+                {"method": "POST", "path": f"{url}/transactions", "body": {"amount": "invalid"}},
+                {"method": "GET", "path": "/accounts/00000000-0000-4000-8000-000000000000"},
+            ]
+        },
+        headers=make_headers(state.user),
+    )
+    assert response.status_code == 200
+
+    responses = response.json()["responses"]
+    assert [r["status"] for r in responses] == [200, 200, 200, 200, 200, 200, 200, 422, 404]
+    assert responses[0]["body"]["amount"] == 100
+    assert responses[2]["body"] == {"balance": 60}
+    assert len(responses[3]["body"]) == 1
+    assert [a["id"] for a in responses[4]["body"]] == [account_id]
+    assert responses[6]["body"]["name"] == "Renamed"
+
+    # The account is fetched once for all sub-requests (plus once for the missing account).
+    assert fetched == 2
+
+def test_batch_auth(state: RouterTestState):
+    assert state.user is not None
+
+    response = state.client.post(
+        "/batch",
+        json={"requests": [{"method": "GET", "path": "/accounts"}]},
+        headers={**make_headers(state.user), "X-User-Token": "invalid"},
+    )
+    assert response.status_code == 401
+
+def test_batch_disallowed(state: RouterTestState):
+    assert state.user is not None
+
+    for path in ("/batch", "/events?x=1"):
+        response = state.client.post(
+            "/batch",
+            json={"requests": [{"method": "GET", "path": path}]},
+            headers=make_headers(state.user),
+        )
+        assert response.status_code == 422
+
+    response = state.client.post(
+        "/batch",
+        json={"requests": [{"method": "GET", "path": "/accounts"}] * 100},
+        headers=make_headers(state.user),
+    )
+    assert response.status_code == 422
@@ -0,0 +1,189 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from tests.commons import make_headers, RouterTestState
+from core.schemas import User, FinancialAccount
+from app import app
+
+import pytest
+
+@pytest.fixture(scope="module")
+def state():
+    with TestClient(app) as client:
+        response = client.post(
+            "/user",
+            json={
+                "username": "tester-router-categories",
+                "password": "123456789",
+            }
+        )
+        assert response.status_code == 200
+
+        state = RouterTestState(client, User(**response.json()))
+        assert state.user is not None
+
+        response = state.client.post(
+            "/accounts",
+            json={"name": "Bank"},
+            headers=make_headers(state.user),
+        )
+        assert response.status_code == 200
+        state.baton["account"] = FinancialAccount(**response.json())
+
+        yield state
+
+
+def test_categories(state: RouterTestState):
+    assert state.user is not None
+    headers = make_headers(state.user)
+
+    response = state.client.post("/categories", json={"name": "Groceries"}, headers=headers)
+    assert response.status_code == 200
+    category = response.json()
+    assert category["name"] == "Groceries"
+
+    response = state.client.post("/categories", json={"name": ""}, headers=headers)
+    assert response.status_code == 422
+
+    response = state.client.patch(f"/categories/{category['id']}", json={"name": "Food"}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["name"] == "Food"
+
+    response = state.client.get("/categories", headers=headers)
+    assert response.status_code == 200
+    assert [c["id"] for c in response.json()] == [category["id"]]
+
+    state.baton["category"] = category
+
+def test_category_totals(state: RouterTestState):
+    assert state.user is not None
+    headers = make_headers(state.user)
+    account = state.baton["account"]
+    category = state.baton["category"]
+    path = f"/accounts/{account.id}"
+
+    logged = []
+    for amount, date in ((-1000, "2025-04-02T10:00:00Z"), (-500, "2025-04-20T10:00:00Z"), (2000, "2025-04-25T10:00:00Z")):
+        response = state.client.post(
+            f"{path}/transactions",
+            json={"amount": amount, "date": date, "category_id": category["id"]},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["category_id"] == category["id"]
+        logged.append(response.json())
+
+    # Uncategorized transactions are not totalled.
+    response = state.client.post(f"{path}/transactions", json={"amount": -300, "date": "2025-04-03T10:00:00Z"}, headers=headers)
+    assert response.status_code == 200
+
+    response = state.client.get(f"{path}/categories?month=2025-04", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == [{"category_id": category["id"], "income": 2000, "expenses": 1500, "count": 3}]
+
+    # Moving a transaction to another month moves it to that month's rollup.
+    response = state.client.patch(
+        f"{path}/transactions/{logged[0]['id']}",
+        json={"amount": -700, "date": "2025-05-01T10:00:00Z"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+
+    response = state.client.get(f"{path}/categories?month=2025-04", headers=headers)
+    assert response.json() == [{"category_id": category["id"], "income": 2000, "expenses": 500, "count": 2}]
+    response = state.client.get(f"{path}/categories?month=2025-05", headers=headers)
+    assert response.json() == [{"category_id": category["id"], "income": 0, "expenses": 700, "count": 1}]
+
+    response = state.client.patch(f"{path}/transactions/{logged[1]['id']}", json={"category_id": None}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["category_id"] is None
+
+    response = state.client.delete(f"{path}/transactions/{logged[2]['id']}", headers=headers)
+    assert response.status_code == 204
+
+    response = state.client.get(f"{path}/categories?month=2025-04", headers=headers)
+    assert response.json() == []
+
+    response = state.client.get(f"{path}/transactions?category_id={category['id']}", headers=headers)
+    assert [t["id"] for t in response.json()] == [logged[0]["id"]]
+
+    response = state.client.get(f"{path}/categories?month=April", headers=headers)
+    assert response.status_code == 422
+
+def test_budgets(state: RouterTestState):
+    assert state.user is not None
+    headers = make_headers(state.user)
+    account = state.baton["account"]
+    category = state.baton["category"]
+    path = f"/accounts/{account.id}/budgets"
+
+    response = state.client.put(f"{path}/{category['id']}", json={"monthly_limit": 0}, headers=headers)
+    assert response.status_code == 422
+
+    response = state.client.put(f"{path}/{category['id']}", json={"monthly_limit": 500}, headers=headers)
+    assert response.status_code == 200
+    budget = response.json()
+
+    response = state.client.put(f"{path}/{category['id']}", json={"monthly_limit": 1000}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["id"] == budget["id"]
+
+    response = state.client.get(f"{path}?month=2025-05", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == [{**budget, "monthly_limit": 1000, "spent": 700, "remaining": 300}]
+
+    response = state.client.delete(f"{path}/{category['id']}", headers=headers)
+    assert response.status_code == 204
+    response = state.client.delete(f"{path}/{category['id']}", headers=headers)
+    assert response.status_code == 404
+
+def test_category_ownership(state: RouterTestState):
+    assert state.user is not None
+    account = state.baton["account"]
+    category = state.baton["category"]
+
+    response = state.client.post("/user", json={"username": "tester-router-categories-other", "password": "123456789"})
+    assert response.status_code == 200
+    other = response.json()
+
+    response = state.client.patch(f"/categories/{category['id']}", json={"name": "Mine"}, headers=make_headers(other))
+    assert response.status_code == 404
+
+    response = state.client.post(
+        f"/accounts/{account.id}/transactions",
+        json={"amount": -100, "category_id": "00000000-0000-4000-8000-000000000000"},
+        headers=make_headers(state.user),
+    )
+    assert response.status_code == 404
+
+def test_delete_category(state: RouterTestState):
+    assert state.user is not None
+    headers = make_headers(state.user)
+    account = state.baton["account"]
+    category = state.baton["category"]
+
+    # The cached budgets of accounts without transactions in the category
+    # are invalidated.
+    response = state.client.post("/accounts", json={"name": "Budgeted"}, headers=headers)
+    assert response.status_code == 200
+    path = f"/accounts/{response.json()['id']}/budgets"
+    response = state.client.put(f"{path}/{category['id']}", json={"monthly_limit": 500}, headers=headers)
+    assert response.status_code == 200
+    response = state.client.get(path, headers=headers)
+    assert len(response.json()) == 1
+    etag = response.headers["etag"]
+
+    response = state.client.delete(f"/categories/{category['id']}", headers=headers)
+    assert response.status_code == 204
+
+    response = state.client.get(path, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json() == []
+
+    response = state.client.get(f"/accounts/{account.id}/transactions", headers=headers)
+    assert all(t["category_id"] is None for t in response.json())
+
+    response = state.client.get(f"/accounts/{account.id}/categories?month=2025-05", headers=headers)
+    assert response.json() == []
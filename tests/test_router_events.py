@@ -0,0 +1,104 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from tests.commons import make_headers, RouterTestState
+from core.events import Event, EventHub
+from core.schemas import User
+from app import app
+
+import asyncio
+import json
+import uuid
+import pytest
+
+@pytest.fixture(scope="module")
+def state():
+    with TestClient(app) as client:
+        response = client.post(
+            "/user",
+            json={
+                "username": "tester-router-events",
+                "password": "123456789",
+            }
+        )
+        assert response.status_code == 200
+
+        state = RouterTestState(client, User(**response.json()))
+        assert state.user is not None
+
+        response = client.post("/accounts", json={"name": "Live"}, headers=make_headers(state.user))
+        assert response.status_code == 200
+        state.baton["account"] = response.json()
+
+        yield state
+
+
+def _read_event(event: Event | None) -> tuple[str, dict]:
+    assert event is not None
+    head, data = event.payload.decode().strip().split("\n")
+    return head.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+def test_event_hub():
+    hub = EventHub(queue_size=2)
+    user_id = uuid.uuid4()
+
+    assert not hub.has_subscribers(user_id)
+
+    fast = hub.subscribe(user_id)
+    slow = hub.subscribe(user_id)
+
+    hub.publish(user_id, Event("a", {}))
+    hub.publish(user_id, Event("b", {}))
+    fast.queue.get_nowait()
+    fast.queue.get_nowait()
+
+    # slow subscriber's queue is full so it is dropped.
+    hub.publish(user_id, Event("c", {}))
+
+    assert slow.dropped
+    assert asyncio.run(slow.get()) is None
+    assert not fast.dropped
+    assert _read_event(fast.queue.get_nowait())[0] == "c"
+
+    hub.unsubscribe(fast)
+    assert not hub.has_subscribers(user_id)
+
+def test_transaction_events(state: RouterTestState):
+    assert state.user is not None
+
+    account_id = state.baton["account"]["id"]
+    url = f"/accounts/{account_id}/transactions"
+    subscription = app.state.events.subscribe(state.user.id)
+
+    try:
+        response = state.client.post(url, json={"amount": 100}, headers=make_headers(state.user))
+        assert response.status_code == 200
+        transaction = response.json()
+
+        event, data = _read_event(subscription.queue.get_nowait())
+        assert event == "transaction.logged"
+        assert data["account_id"] == account_id
+        assert data["transaction"] == transaction
+        assert data["balance"] == 100
+
+        response = state.client.patch(f"{url}/{transaction['id']}", json={"amount": 250}, headers=make_headers(state.user))
+        assert response.status_code == 200
+
+        event, data = _read_event(subscription.queue.get_nowait())
+        assert event == "transaction.edited"
+        assert data["transaction"]["amount"] == 250
+        assert data["balance"] == 250
+
+        response = state.client.delete(f"{url}/{transaction['id']}", headers=make_headers(state.user))
+        assert response.status_code == 204
+
+        event, data = _read_event(subscription.queue.get_nowait())
+        assert event == "transaction.deleted"
+        assert data["transaction_id"] == transaction["id"]
+        assert data["balance"] == 0
+    finally:
+        app.state.events.unsubscribe(subscription)
+
+    assert subscription.queue.empty()
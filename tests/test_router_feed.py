@@ -0,0 +1,75 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from tests.commons import make_headers, RouterTestState
+from core.schemas import User
+from app import app
+
+import datetime
+import pytest
+
+
+@pytest.fixture(scope="module")
+def state():
+    with TestClient(app) as client:
+        response = client.post(
+            "/user",
+            json={
+                "username": "tester-router-feed",
+                "password": "123456789",
+            }
+        )
+        assert response.status_code == 200
+
+        state = RouterTestState(client, User(**response.json()))
+        yield state
+
+
+def test_feed(state: RouterTestState):
+    assert state.user is not None
+    headers = make_headers(state.user)
+    date = datetime.datetime(2025, 6, 1, tzinfo=datetime.timezone.utc)
+    expected = []
+
+    for i in range(12):
+        response = state.client.post("/accounts", json={"name": f"Account {i}"}, headers=headers)
+        assert response.status_code == 200
+        url = "/accounts/{account_id}/transactions".format(account_id=response.json()["id"])
+
+        # Transactions at the same date are ordered by their IDs.
+        for day in (i, i, i + 5):
+            response = state.client.post(
+                url,
+                json={"amount": i + 1, "date": (date + datetime.timedelta(days=day)).isoformat()},
+                headers=headers,
+            )
+            assert response.status_code == 200
+            expected.append(response.json())
+
+    expected.sort(key=lambda t: (t["date"], t["id"]), reverse=True)
+    seen = []
+    params = {"limit": 7}
+
+    while True:
+        response = state.client.get("/transactions", params=params, headers=headers)
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(data["transactions"])
+
+        if data["next"] is None:
+            break
+        params["before"] = data["next"]
+
+    assert seen == expected
+
+    response = state.client.get("/transactions", params={"before": "2025-06-01"}, headers=headers)
+    assert response.status_code == 422
+
+    # Other users' transactions are not included.
+    response = state.client.post("/user", json={"username": "tester-router-feed-other", "password": "123456789"})
+    assert response.status_code == 200
+    response = state.client.get("/transactions", headers=make_headers(response.json()))
+    assert response.status_code == 200
+    assert response.json()["transactions"] == []
@@ -0,0 +1,87 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from typing import Any
+from fastapi.testclient import TestClient
+from tests.commons import make_headers
+from core.rates import import_rates, read_rates_file
+from app import app
+
+import datetime
+import pathlib
+import pytest
+
+
+def test_read_rates_file(tmp_path: pathlib.Path):
+    path = tmp_path / "rates.csv"
+    path.write_text("currency,date,rate\neur,2025-01-01,0.9\n")
+    assert list(read_rates_file(str(path))) == [("EUR", datetime.date(2025, 1, 1), 0.9)]
+
+    path.write_text("currency,date,rate\nEUR,2025-01-01,-1\n")
+    with pytest.raises(ValueError):
+        list(read_rates_file(str(path)))
+
+def test_net_worth(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    today = datetime.datetime.now(datetime.timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    path = tmp_path / "rates.csv"
+    path.write_text(f"date,currency,rate\n2020-01-01,EUR,0.5\n{today.date().isoformat()},EUR,0.25\n")
+
+    with TestClient(app) as client:
+        rates = app.state.rates
+
+        async def load() -> None:
+            await import_rates(read_rates_file(str(path)))
+            await rates.load()
+
+        client.portal.call(load)
+
+        response = client.post("/user", json={"username": "tester-router-networth", "password": "123456789"})
+        assert response.status_code == 200
+        headers = make_headers(response.json())
+
+        response = client.post("/accounts", json={"name": "Wallet", "currency": "eur"}, headers=headers)
+        assert response.status_code == 422
+
+        accounts = {}
+        for name, currency in (("Bank", "USD"), ("Wallet", "EUR")):
+            response = client.post("/accounts", json={"name": name, "currency": currency}, headers=headers)
+            assert response.status_code == 200
+            assert response.json()["currency"] == currency
+            accounts[name] = response.json()["id"]
+
+        for name, amount, days in (("Bank", 1000, -5), ("Wallet", 300, -1), ("Bank", -200, 0), ("Bank", 5000, 3)):
+            date = (today + datetime.timedelta(days=days, hours=12)).isoformat()
+            response = client.post(f"/accounts/{accounts[name]}/transactions", json={"amount": amount, "date": date}, headers=headers)
+            assert response.status_code == 200
+
+        response = client.get("/net-worth", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["currency"] == "USD"
+        assert response.json()["total"] == 5800 + 1200
+
+        response = client.get("/net-worth?currency=EUR", headers=headers)
+        assert response.json()["total"] == 1450 + 300
+
+        response = client.get("/net-worth?currency=XYZ", headers=headers)
+        assert response.status_code == 422
+
+        # The rate of each day is used and the future transactions are excluded.
+        response = client.get("/net-worth/history?days=3", headers=headers)
+        assert response.status_code == 200
+        points = response.json()["points"]
+        assert [p["date"] for p in points] == [(today + datetime.timedelta(days=d)).date().isoformat() for d in (-2, -1, 0)]
+        assert [p["balance"] for p in points] == [1000, 1600, 800 + 1200]
+
+        # The transactions of accounts that are not fetched e.g. the ones
+        # created concurrently are not included.
+        db = app.state.db
+        fetch_accounts = db.fetch_accounts
+
+        async def fetch_bank(*args: Any, **kwargs: Any) -> list[dict[str, Any]]:
+            return [acc for acc in await fetch_accounts(*args, **kwargs) if str(acc["id"]) == accounts["Bank"]]
+
+        monkeypatch.setattr(db, "fetch_accounts", fetch_bank)
+        response = client.get("/net-worth/history?days=3", headers=headers)
+        assert response.status_code == 200
+        assert [p["balance"] for p in response.json()["points"]] == [1000, 1000, 800]
@@ -0,0 +1,123 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from tests.commons import make_headers, RouterTestState
+from core.schemas import User, FinancialAccount
+from app import app
+
+import datetime
+import functools
+import pytest
+
+@pytest.fixture(scope="module")
+def state():
+    with TestClient(app) as client:
+        response = client.post(
+            "/user",
+            json={
+                "username": "tester-router-recurring",
+                "password": "123456789",
+            }
+        )
+        assert response.status_code == 200
+
+        state = RouterTestState(client, User(**response.json()))
+        assert state.user is not None
+
+        response = state.client.post(
+            "/accounts",
+            json={"name": "Bank"},
+            headers=make_headers(state.user),
+        )
+        assert response.status_code == 200
+        state.baton["account"] = FinancialAccount(**response.json())
+
+        yield state
+
+
+def test_materialize_recurring(state: RouterTestState):
+    assert state.user is not None
+    headers = make_headers(state.user)
+    path = f"/accounts/{state.baton['account'].id}"
+
+    response = state.client.post("/categories", json={"name": "Rent"}, headers=headers)
+    assert response.status_code == 200
+    category_id = response.json()["id"]
+
+    response = state.client.post(f"{path}/recurring", json={"amount": 0, "frequency": 2}, headers=headers)
+    assert response.status_code == 422
+
+    response = state.client.post(
+        f"{path}/recurring",
+        json={
+            "amount": -1000,
+            "description": "Rent",
+            "category_id": category_id,
+            "frequency": 2,
+            "start": "2025-01-31T09:00:00Z",
+            "count": 5,
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200
+    rule = response.json()
+    assert rule["next_date"] == "2025-01-31T09:00:00Z"
+    state.baton["rule"] = rule
+
+    # Occurrences are logged in batches of two transactions.
+    db = app.state.db
+    now = datetime.datetime(2025, 4, 15, tzinfo=datetime.timezone.utc)
+    users = state.client.portal.call(functools.partial(db.materialize_recurring, now, batch_size=2))
+    assert users == {state.user.id}
+    assert state.client.portal.call(db.materialize_recurring, now) == set()
+
+    response = state.client.get(f"{path}/transactions", headers=headers)
+    assert [t["date"] for t in response.json()] == ["2025-03-31T09:00:00Z", "2025-02-28T09:00:00Z", "2025-01-31T09:00:00Z"]
+    assert all(t["amount"] == -1000 and t["category_id"] == category_id for t in response.json())
+
+    response = state.client.get(f"{path}/categories?month=2025-02", headers=headers)
+    assert response.json() == [{"category_id": category_id, "income": 0, "expenses": 1000, "count": 1}]
+
+    response = state.client.get(f"{path}/recurring", headers=headers)
+    assert response.status_code == 200
+    assert response.json()[0]["occurrences"] == 3
+    assert response.json()[0]["next_date"] == "2025-04-30T09:00:00Z"
+
+    # The rule ends when its count is reduced to the logged occurrences.
+    response = state.client.patch(f"{path}/recurring/{rule['id']}", json={"count": 3}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["next_date"] is None
+
+def test_forecast(state: RouterTestState):
+    assert state.user is not None
+    headers = make_headers(state.user)
+    path = f"/accounts/{state.baton['account'].id}"
+    start = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(days=1)
+
+    response = state.client.post(
+        f"{path}/recurring",
+        json={"amount": 250, "frequency": 0, "interval": 2, "start": start.isoformat(), "count": 10},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    rule = response.json()
+
+    response = state.client.get(f"{path}/forecast?days=30&limit=3", headers=headers)
+    assert response.status_code == 200
+    forecast = response.json()
+    assert forecast["balance"] == -3000
+    assert forecast["projected_balance"] == -3000 + 10 * 250
+    assert [o["rule_id"] for o in forecast["occurrences"]] == [rule["id"]] * 3
+
+    response = state.client.get(f"{path}/forecast?days=400", headers=headers)
+    assert response.status_code == 422
+
+    response = state.client.delete(f"{path}/recurring/{rule['id']}", headers=headers)
+    assert response.status_code == 204
+    response = state.client.delete(f"{path}/recurring/{rule['id']}", headers=headers)
+    assert response.status_code == 404
+
+    response = state.client.get(f"{path}/forecast", headers=headers)
+    assert response.json()["projected_balance"] == -3000
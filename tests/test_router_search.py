@@ -0,0 +1,127 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from tests.commons import make_headers, RouterTestState
+from core.schemas import User, FinancialAccount
+from core import config
+from app import app
+
+import uuid
+import pytest
+
+
+@pytest.fixture(scope="module")
+def state():
+    with TestClient(app) as client:
+        response = client.post(
+            "/user",
+            json={
+                "username": "tester-router-search",
+                "password": "123456789",
+            }
+        )
+        assert response.status_code == 200
+
+        state = RouterTestState(client, User(**response.json()))
+        assert state.user is not None
+
+        for name in ("Bank", "Wallet"):
+            response = state.client.post("/accounts", json={"name": name}, headers=make_headers(state.user))
+            assert response.status_code == 200
+            state.baton[name] = FinancialAccount(**response.json())
+
+        yield state
+
+
+def _search(state: RouterTestState, **params: str) -> dict:
+    assert state.user is not None
+    response = state.client.get("/transactions/search", params=params, headers=make_headers(state.user))
+    assert response.status_code == 200
+    return response.json()
+
+def test_search_transactions(state: RouterTestState):
+    assert state.user is not None
+    headers = make_headers(state.user)
+    bank, wallet = state.baton["Bank"], state.baton["Wallet"]
+
+    for acc, description in [
+        (bank, "Coffee at the station"),
+        (bank, "Coffee beans and coffee filters"),
+        (bank, "Groceries"),
+        (wallet, "Café coffee paid with the wallet card"),
+        (wallet, None),
+    ]:
+        response = state.client.post(
+            f"/accounts/{acc.id}/transactions",
+            json={"amount": -100, "description": description},
+            headers=headers,
+        )
+        assert response.status_code == 200
+
+    result = _search(state, q="coffee")
+    descriptions = [t["description"] for t in result["transactions"]]
+    assert len(descriptions) == 3
+    assert result["next"] is None
+
+    # Only the search index of SQLite ranks the transactions and ignores
+    # diacritics. Other databases match the words using LIKE.
+    if config.TEST_DATABASE_URL.startswith("sqlite://"):
+        assert descriptions[0] == "Coffee beans and coffee filters"
+        assert [t["description"] for t in _search(state, q="cafe")["transactions"]] == ["Café coffee paid with the wallet card"]
+
+    # All words must match.
+    assert [t["description"] for t in _search(state, q="coffee station")["transactions"]] == ["Coffee at the station"]
+
+    # Query syntax is matched literally.
+    assert _search(state, q='"coffee OR (')["transactions"] == []
+
+    result = _search(state, q="coffee", account_id=str(wallet.id))
+    assert [t["account_id"] for t in result["transactions"]] == [str(wallet.id)]
+
+    response = state.client.get(
+        "/transactions/search",
+        params={"q": "coffee", "account_id": str(uuid.uuid4())},
+        headers=headers,
+    )
+    assert response.status_code == 404
+
+    response = state.client.get("/transactions/search", params={"q": " "}, headers=headers)
+    assert response.status_code == 422
+
+def test_search_transactions_pagination(state: RouterTestState):
+    seen = []
+    params = {"q": "coffee", "limit": "1"}
+
+    while True:
+        result = _search(state, **params)
+        seen.extend(t["id"] for t in result["transactions"])
+        if result["next"] is None:
+            break
+        params["after"] = result["next"]
+
+    assert len(seen) == len(set(seen)) == 3
+    assert seen == [t["id"] for t in _search(state, q="coffee")["transactions"]]
+
+def test_search_transactions_sync(state: RouterTestState):
+    assert state.user is not None
+    headers = make_headers(state.user)
+    bank = state.baton["Bank"]
+
+    transaction = _search(state, q="groceries")["transactions"][0]
+    url = f"/accounts/{bank.id}/transactions/{transaction['id']}"
+
+    response = state.client.patch(url, json={"description": "Weekly market"}, headers=headers)
+    assert response.status_code == 200
+    assert _search(state, q="groceries")["transactions"] == []
+    assert [t["id"] for t in _search(state, q="market")["transactions"]] == [transaction["id"]]
+
+    response = state.client.delete(url, headers=headers)
+    assert response.status_code == 204
+    assert _search(state, q="market")["transactions"] == []
+
+    # Deleting an account removes its transactions from the index.
+    response = state.client.delete(f"/accounts/{bank.id}", headers=headers)
+    assert response.status_code == 204
+    assert len(_search(state, q="coffee")["transactions"]) == 1
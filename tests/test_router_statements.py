@@ -0,0 +1,165 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from tests.commons import make_headers, RouterTestState
+from core.schemas import User, FinancialAccount
+from core.statements import StatementError, StatementParser, OFXParser, QIFParser
+from core import config
+from app import app
+
+import datetime
+import pytest
+
+OFX_SGML = b"""OFXHEADER:100
+DATA:OFXSGML
+VERSION:102
+
+<OFX>
+<BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20250102120000[-5:EST]<TRNAMT>-12.50<FITID>1001<NAME>Coffee &amp; Co
+</STMTTRN>
+<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20250103<TRNAMT>1,000.00<FITID>1002<MEMO>Salary
+</STMTTRN>
+<STMTTRN><TRNTYPE>OTHER<DTPOSTED>20250104<TRNAMT>0.00<FITID>1003
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1>
+</OFX>
+"""
+
+OFX_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<?OFX OFXHEADER="200" VERSION="220"?>
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN><TRNTYPE>DEBIT</TRNTYPE><DTPOSTED>20250105</DTPOSTED><TRNAMT>-3,25</TRNAMT><FITID>1004</FITID><NAME>Bus</NAME></STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+QIF = b"""!Type:Bank
+D03/15'25
+T-1,234.56
+PRent
+^
+D3/15/2025
+T-5.00
+PSnack
+^
+D3/15/2025
+T-5.00
+PSnack
+^
+!Type:Invst
+D3/16/2025
+T100.00
+^
+"""
+
+
+def _parse(parser: StatementParser, data: bytes, size: int) -> list:
+    entries = []
+    for i in range(0, len(data), size):
+        entries += parser.feed(data[i:i + size])
+    return entries + parser.close()
+
+def test_ofx_parser():
+    for size in (1, 7, len(OFX_SGML)):
+        parser = OFXParser()
+        entries = _parse(parser, OFX_SGML, size)
+        assert [(e, d.amount, d.description) for e, d in entries] == [("1001", -1250, "Coffee & Co"), ("1002", 100000, "Salary")]
+        assert entries[0][1].date == datetime.datetime(2025, 1, 2, 17, tzinfo=datetime.timezone.utc)
+        assert parser.skipped == 1
+
+    entries = _parse(OFXParser(), OFX_XML, 5)
+    assert [(e, d.amount, d.description) for e, d in entries] == [("1004", -325, "Bus")]
+
+    with pytest.raises(StatementError):
+        _parse(OFXParser(), OFX_SGML.replace(b"20250103", b"2025-01-03"), 64)
+    with pytest.raises(StatementError):
+        _parse(OFXParser(), b"date,amount\n2025-01-01,10\n", 64)
+
+def test_qif_parser():
+    entries = _parse(QIFParser(), QIF, 3)
+    assert [(d.amount, d.description) for _, d in entries] == [(-123456, "Rent"), (-500, "Snack"), (-500, "Snack")]
+    assert all(d.date == datetime.datetime(2025, 3, 15, tzinfo=datetime.timezone.utc) for _, d in entries)
+
+    # The identical transactions have different but stable IDs.
+    ids = [e for e, _ in entries]
+    assert len(set(ids)) == 3
+    assert ids == [e for e, _ in _parse(QIFParser(), QIF, len(QIF))]
+
+    # The identical transactions need not be adjacent.
+    unsorted = b"!Type:Bank\nD01/05/2025\nT-5.00\nPCoffee\n^\nD01/06/2025\nT-9.00\nPLunch\n^\nD01/05/2025\nT-5.00\nPCoffee\n^\n"
+    ids = [e for e, _ in _parse(QIFParser(), unsorted, 16)]
+    assert len(set(ids)) == 3
+
+    entries = _parse(QIFParser(day_first=True), b"!Type:CCard\r\nD05.03.2025\r\nT10,5\r\n^\r\n", 4)
+    assert [(d.amount, d.date.month) for _, d in entries] == [(1050, 3)]
+
+    with pytest.raises(StatementError):
+        _parse(QIFParser(), b"!Type:Bank\nD13/45/2025\nT1\n^\n", 64)
+
+
+@pytest.fixture(scope="module")
+def state():
+    with TestClient(app) as client:
+        response = client.post(
+            "/user",
+            json={
+                "username": "tester-router-statements",
+                "password": "123456789",
+            }
+        )
+        assert response.status_code == 200
+
+        state = RouterTestState(client, User(**response.json()))
+        assert state.user is not None
+
+        response = state.client.post(
+            "/accounts",
+            json={"name": "Bank"},
+            headers=make_headers(state.user),
+        )
+        assert response.status_code == 200
+        state.baton["account"] = FinancialAccount(**response.json())
+
+        yield state
+
+
+def test_import_statement(state: RouterTestState, monkeypatch: pytest.MonkeyPatch):
+    assert state.user is not None
+    headers = make_headers(state.user)
+    path = f"/accounts/{state.baton['account'].id}"
+    monkeypatch.setattr(config, "IMPORT_BATCH_SIZE", 1)
+
+    response = state.client.post("/categories", json={"name": "Imported"}, headers=headers)
+    assert response.status_code == 200
+    category_id = response.json()["id"]
+
+    response = state.client.post(f"{path}/import?format=ofx&category_id={category_id}", content=OFX_SGML, headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {"imported": 2, "duplicates": 0, "skipped": 1}
+
+    # The already imported transactions are skipped.
+    response = state.client.post(f"{path}/import?format=ofx", content=OFX_SGML + OFX_XML, headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {"imported": 1, "duplicates": 2, "skipped": 1}
+
+    response = state.client.get(f"{path}/transactions", headers=headers)
+    assert [(t["amount"], t["category_id"]) for t in response.json()] == [(-325, None), (100000, category_id), (-1250, category_id)]
+
+    response = state.client.get(f"{path}/categories?month=2025-01", headers=headers)
+    assert response.json() == [{"category_id": category_id, "income": 100000, "expenses": 1250, "count": 2}]
+
+    for imported in (3, 0):
+        response = state.client.post(f"{path}/import?format=qif", content=QIF, headers=headers)
+        assert response.status_code == 200
+        assert response.json() == {"imported": imported, "duplicates": 3 - imported, "skipped": 0}
+
+    response = state.client.post(f"{path}/import?format=qif", content=OFX_SGML, headers=headers)
+    assert response.status_code == 422
+
+    response = state.client.post(f"{path}/import?format=csv", content=QIF, headers=headers)
+    assert response.status_code == 422
+
+    response = state.client.get(f"{path}/transactions-count", headers=headers)
+    assert response.json()["count"] == 6
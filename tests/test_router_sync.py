@@ -0,0 +1,143 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from tests.commons import make_headers, RouterTestState
+from core.schemas import User
+from app import app
+
+import datetime
+import pytest
+
+@pytest.fixture(scope="module")
+def state():
+    with TestClient(app) as client:
+        response = client.post(
+            "/user",
+            json={
+                "username": "tester-router-sync",
+                "password": "123456789",
+            }
+        )
+        assert response.status_code == 200
+
+        state = RouterTestState(client, User(**response.json()))
+        assert state.user is not None
+
+        response = state.client.get("/sync/cursor", headers=make_headers(state.user))
+        assert response.status_code == 200
+        state.baton["cursor"] = response.json()["sequence"]
+
+        yield state
+
+
+def test_sync(state: RouterTestState):
+    assert state.user is not None
+
+    response = state.client.post("/accounts", json={"name": "Synced"}, headers=make_headers(state.user))
+    assert response.status_code == 200
+    account = response.json()
+
+    url = "/accounts/{account_id}/transactions".format(account_id=account["id"])
+
+    response = state.client.post(url, json={"amount": 100}, headers=make_headers(state.user))
+    assert response.status_code == 200
+    edited = response.json()
+
+    response = state.client.patch(url + "/" + edited["id"], json={"amount": 200}, headers=make_headers(state.user))
+    assert response.status_code == 200
+
+    response = state.client.post(url, json={"amount": 300}, headers=make_headers(state.user))
+    assert response.status_code == 200
+    deleted = response.json()
+
+    response = state.client.delete(url + "/" + deleted["id"], headers=make_headers(state.user))
+    assert response.status_code == 204
+
+    response = state.client.get(
+        "/sync",
+        params={"since": state.baton["cursor"]},
+        headers=make_headers(state.user),
+    )
+    assert response.status_code == 200
+    data = response.json()
+
+    # Created-then-deleted transaction is dropped and edits are merged into creation.
+    assert data["has_more"] is False
+    assert [(c["entity_type"], c["change_type"]) for c in data["changes"]] == [(1, 0), (2, 0)]
+    assert data["changes"][0]["data"]["name"] == "Synced"
+    assert data["changes"][1]["entity_id"] == edited["id"]
+    assert data["changes"][1]["data"]["amount"] == 200
+
+    state.baton["cursor"] = data["next"]
+
+def test_sync_pagination(state: RouterTestState):
+    assert state.user is not None
+
+    response = state.client.patch("/user", json={"display_name": "Sync"}, headers=make_headers(state.user))
+    assert response.status_code == 200
+
+    response = state.client.post("/accounts", json={"name": "Paginated"}, headers=make_headers(state.user))
+    assert response.status_code == 200
+
+    response = state.client.get(
+        "/sync",
+        params={"since": state.baton["cursor"], "limit": 1},
+        headers=make_headers(state.user),
+    )
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["has_more"] is True
+    assert len(data["changes"]) == 1
+    assert data["changes"][0]["entity_type"] == 0
+    assert data["changes"][0]["data"]["display_name"] == "Sync"
+    assert "token" not in data["changes"][0]["data"]
+
+    response = state.client.get(
+        "/sync",
+        params={"since": data["next"], "limit": 1},
+        headers=make_headers(state.user),
+    )
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["has_more"] is False
+    assert data["changes"][0]["data"]["name"] == "Paginated"
+
+def test_sync_pruned(state: RouterTestState):
+    assert state.user is not None
+
+    # Zero retention prunes everything except the latest entry.
+    response = state.client.get("/sync/cursor", headers=make_headers(state.user))
+    latest = response.json()["sequence"]
+
+    state.client.portal.call(app.state.db.prune_changes, datetime.timedelta(0))  # type: ignore
+
+    response = state.client.get("/sync", params={"since": latest - 2}, headers=make_headers(state.user))
+    assert response.status_code == 410
+
+    response = state.client.get("/sync", params={"since": latest - 1}, headers=make_headers(state.user))
+    assert response.status_code == 200
+
+def test_sync_pruned_other_users(state: RouterTestState):
+    assert state.user is not None
+
+    response = state.client.get("/sync/cursor", headers=make_headers(state.user))
+    cursor = response.json()["sequence"]
+
+    # The pruned changes of other users do not affect the user.
+    response = state.client.post("/user", json={"username": "tester-router-sync-other", "password": "123456789"})
+    assert response.status_code == 200
+    other = make_headers(response.json())
+
+    for name in ("First", "Second"):
+        response = state.client.post("/accounts", json={"name": name}, headers=other)
+        assert response.status_code == 200
+
+    state.client.portal.call(app.state.db.prune_changes, datetime.timedelta(0))  # type: ignore
+
+    response = state.client.get("/sync", params={"since": cursor}, headers=make_headers(state.user))
+    assert response.status_code == 200
+    assert response.json()["changes"] == []
@@ -6,6 +6,7 @@ from typing import Any
 from fastapi.testclient import TestClient
 from tests.commons import make_headers, RouterTestState
 from core.schemas import User, FinancialAccount
+from core import models
 from app import app
 
 import pytest
@@ -209,15 +210,18 @@ def test_get_transaction(state: RouterTestState):
     assert response.status_code == 200
     data = response.json()
 
-    response = state.client.get(
-        "/accounts/{account_id}/transactions/{transaction_id}".format(
-            account_id=state.baton["account"].id,
-            transaction_id=data["id"],
-        ),
-        headers=make_headers(state.user),
+    url = "/accounts/{account_id}/transactions/{transaction_id}".format(
+        account_id=state.baton["account"].id,
+        transaction_id=data["id"],
     )
+    response = state.client.get(url, headers=make_headers(state.user))
     assert response.status_code == 200
     assert response.json() == data
+    etag = response.headers["etag"]
+
+    response = state.client.get(url, headers={**make_headers(state.user), "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
 
 
 def test_edit_transaction(state: RouterTestState):
@@ -302,3 +306,187 @@ def test_delete_transaction(state: RouterTestState):
     )
 
     assert response.status_code == 404
+
+def test_reports(state: RouterTestState):
+    assert state.user is not None
+
+    response = state.client.get(
+        "/accounts/{account_id}/reports/monthly".format(account_id=state.baton["account"].id),
+        headers=make_headers(state.user),
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["report"] == "monthly"
+    months = {m["month"]: m for m in data["result"]["months"]}
+    assert months["2025-08"]["income"] == 3200 + 250
+    assert months["2025-08"]["expense"] == -532
+
+    response = state.client.get(
+        "/accounts/{account_id}/reports/percentiles".format(account_id=state.baton["account"].id),
+        headers=make_headers(state.user),
+        params={"kind": "expense", "percentiles": "50"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["result"]["count"] == 2
+    assert data["result"]["percentiles"]["50"] == (532 + 12) / 2
+
+    response = state.client.get(
+        "/accounts/{account_id}/reports/percentiles".format(account_id=state.baton["account"].id),
+        headers=make_headers(state.user),
+        params={"percentiles": "0,100"},
+    )
+
+    assert response.status_code == 422
+
+def test_conditional_requests(state: RouterTestState):
+    assert state.user is not None
+
+    url = "/accounts/{account_id}/balance".format(account_id=state.baton["account"].id)
+    response = state.client.get(url, headers=make_headers(state.user))
+
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    # Test - unchanged data
+    response = state.client.get(url, headers={**make_headers(state.user), "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    # Test - changed data
+    response = state.client.post(
+        "/accounts/{account_id}/transactions".format(account_id=state.baton["account"].id),
+        json={"amount": 100},
+        headers=make_headers(state.user),
+    )
+    assert response.status_code == 200
+
+    response = state.client.get(url, headers={**make_headers(state.user), "If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+def test_response_cache(state: RouterTestState, monkeypatch: pytest.MonkeyPatch):
+    assert state.user is not None
+
+    url = "/accounts/{account_id}/transactions".format(account_id=state.baton["account"].id)
+    response = state.client.get(url, headers=make_headers(state.user), params={"limit": 5})
+
+    assert response.status_code == 200
+    data = response.json()
+
+    # Cached responses are served without querying the database.
+    def _fail(*args: Any, **kwargs: Any):
+        raise AssertionError("database queried for cached response")
+
+    with monkeypatch.context() as m:
+        m.setattr(models.FinancialAccount, "filter", _fail)
+        m.setattr(models.Transaction, "filter", _fail)
+
+        response = state.client.get(url, headers=make_headers(state.user), params={"limit": 5})
+
+        assert response.status_code == 200
+        assert response.json() == data
+
+    # Test - cache invalidation after data changes
+    response = state.client.post(url, json={"amount": 100}, headers=make_headers(state.user))
+    assert response.status_code == 200
+
+    response = state.client.get(url, headers=make_headers(state.user), params={"limit": 5})
+
+    assert response.status_code == 200
+    assert response.json() != data
+
+def test_list_transactions_filters(state: RouterTestState):
+    assert state.user is not None
+    headers = make_headers(state.user)
+
+    response = state.client.post("/accounts", json={"name": "Filters"}, headers=headers)
+    assert response.status_code == 200
+    url = "/accounts/{account_id}/transactions".format(account_id=response.json()["id"])
+
+    for amount, description, day in [
+        (-15000, "Rent", 1),
+        (-2500, "Groceries", 2),
+        (-500, "grocery bag", 3),
+        (300000, "Salary", 4),
+        (-12000, "Groceries 50%", 5),
+    ]:
+        date = _date_std_isoformat(2025, 4, day, tzinfo=datetime.timezone.utc)
+        response = state.client.post(url, json={"amount": amount, "description": description, "date": date}, headers=headers)
+        assert response.status_code == 200
+
+    def _amounts(**params: Any) -> list[int]:
+        response = state.client.get(url, params=params, headers=headers)
+        assert response.status_code == 200
+        return [t["amount"] for t in response.json()]
+
+    assert _amounts(kind="expense", max_amount=-10000) == [-12000, -15000]
+    assert _amounts(kind="income") == [300000]
+    assert _amounts(min_amount=-2500, max_amount=-500) == [-500, -2500]
+    assert _amounts(description="Groc") == [-12000, -2500]
+    assert _amounts(description="Groceries 50%") == [-12000]
+    assert _amounts(description="Groceries_") == []
+    assert _amounts(order="asc", limit=2) == [-15000, -2500]
+    assert _amounts(
+        order="asc",
+        after=_date_std_isoformat(2025, 4, 2, tzinfo=datetime.timezone.utc),
+        kind="expense",
+    ) == [-500, -12000]
+
+    response = state.client.get(url, params={"kind": "refund"}, headers=headers)
+    assert response.status_code == 422
+    response = state.client.get(url, params={"order": "random"}, headers=headers)
+    assert response.status_code == 422
+
+def test_transaction_ownership(state: RouterTestState):
+    assert state.user is not None
+    headers = make_headers(state.user)
+
+    response = state.client.post(
+        "/user",
+        json={
+            "username": "tester-router-transactions-other",
+            "password": "123456789",
+        }
+    )
+    assert response.status_code == 200
+    other = User(**response.json())
+    other_headers = make_headers(other)
+
+    response = state.client.post("/accounts", json={"name": "Other"}, headers=other_headers)
+    assert response.status_code == 200
+    other_account = FinancialAccount(**response.json())
+
+    response = state.client.post(
+        f"/accounts/{other_account.id}/transactions",
+        json={"amount": -100, "description": "Private"},
+        headers=other_headers,
+    )
+    assert response.status_code == 200
+    transaction = response.json()
+
+    # Neither the other user's account nor their transaction under the
+    # user's own account can be accessed.
+    for account_id in (other_account.id, state.baton["account"].id):
+        url = f"/accounts/{account_id}/transactions/{transaction['id']}"
+
+        assert state.client.get(url, headers=headers).status_code == 404
+        assert state.client.patch(url, json={"amount": 100}, headers=headers).status_code == 404
+        assert state.client.delete(url, headers=headers).status_code == 404
+
+    url = f"/accounts/{other_account.id}/transactions/{transaction['id']}"
+    response = state.client.get(url, headers=other_headers)
+    assert response.status_code == 200
+    assert response.json() == transaction
+
+    # Empty edit returns the transaction unchanged.
+    response = state.client.patch(url, json={}, headers=other_headers)
+    assert response.status_code == 200
+    assert response.json() == transaction
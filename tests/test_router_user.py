@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from fastapi.testclient import TestClient
 from tests.commons import make_headers, RouterTestState
+from core import models, utils
 from app import app
 
 import pytest
@@ -69,6 +70,68 @@ def test_get_user(state: RouterTestState):
     assert data.get("password") == user["password"]
     assert data.get("token") == user["token"]
 
+def test_get_user_decrypts_token_only(state: RouterTestState, monkeypatch: pytest.MonkeyPatch):
+    response = state.client.post(
+        "/user",
+        json={
+            "username": "digest user",
+            "password": "abcdefghijkl",
+        }
+    )
+    assert response.status_code == 200
+    user = response.json()
+
+    decrypted = []
+    fernet_decrypt = utils.fernet_decrypt
+    monkeypatch.setattr(utils, "fernet_decrypt", lambda value: decrypted.append(value) or fernet_decrypt(value))
+
+    headers = {"X-User-Username": "digest user", "X-User-Password": "abcdefghijkl"}
+    response = state.client.get("/user", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["token"] == user["token"]
+    assert len(decrypted) == 1
+
+    response = state.client.get("/user", headers={**headers, "X-User-Password": "abcdefghijkm"})
+    assert response.status_code == 404
+    assert len(decrypted) == 1
+
+    # The digest of users created before it was stored is stored on sign in.
+    state.client.portal.call(lambda: models.User.filter(id=user["id"]).update(password_digest=None))
+
+    response = state.client.get("/user", headers={**headers, "X-User-Password": "abcdefghijkm"})
+    assert response.status_code == 404
+
+    for count in (4, 5):
+        response = state.client.get("/user", headers=headers)
+        assert response.status_code == 200
+        assert len(decrypted) == count
+
+def test_get_profile(state: RouterTestState):
+    response = state.client.post(
+        "/user",
+        json={
+            "username": "profile user",
+            "display_name": "Profile",
+            "password": "abcdefghijkl",
+        }
+    )
+
+    assert response.status_code == 200
+    user = response.json()
+
+    response = state.client.get("/user/me", headers=make_headers(user))
+    assert response.status_code == 200
+
+    data = response.json()
+
+    assert data == {"id": user["id"], "username": "profile user", "display_name": "Profile"}
+
+    headers = make_headers(user)
+    headers["X-User-Token"] = "invalid"
+
+    response = state.client.get("/user/me", headers=headers)
+    assert response.status_code == 401
+
 def test_edit_user(state: RouterTestState):
     response = state.client.post(
         "/user",
@@ -0,0 +1,79 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from tests.commons import make_headers
+from core.sharding import ShardManager, shard_path
+from core import models, config
+from app import app
+
+import sqlite3
+import uuid
+import pytest
+
+
+def _count(shard: int, table: str) -> int:
+    with sqlite3.connect(shard_path(config.TEST_DATABASE_URL.removeprefix("sqlite://"), shard)) as conn:
+        return conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+
+@pytest.mark.skipif(not config.TEST_DATABASE_URL.startswith("sqlite://"), reason="sharding requires SQLite")
+def test_sharding(monkeypatch: pytest.MonkeyPatch):
+    with TestClient(app) as client:
+        db = app.state.db
+        shards = ShardManager(db.shards.primary, db.shards.primary_path, count=3, max_open=1)
+        monkeypatch.setattr(db, "shards", shards)
+        monkeypatch.setattr(shards, "shard_for_new_user", lambda user_id: 2)
+
+        try:
+            response = client.post("/user", json={"username": "tester-sharding", "password": "123456789"})
+            assert response.status_code == 200
+            user = response.json()
+            headers = make_headers(user)
+
+            response = client.post("/accounts", json={"name": "Sharded"}, headers=headers)
+            assert response.status_code == 200
+            url = "/accounts/{account_id}/transactions".format(account_id=response.json()["id"])
+
+            response = client.post(url, json={"amount": 100}, headers=headers)
+            assert response.status_code == 200
+
+            transactions_table = models.Transaction._meta.db_table
+            primary_transactions = _count(0, transactions_table)
+            assert _count(2, transactions_table) == 1
+
+            response = client.get("/sync/cursor", headers=headers)
+            assert response.status_code == 200
+            cursor = response.json()["sequence"]
+
+            client.portal.call(db.move_user, uuid.UUID(user["id"]), 1)
+
+            # Data is served from the new shard and removed from the old one.
+            response = client.get(url, headers=headers)
+            assert response.status_code == 200
+            assert [t["amount"] for t in response.json()] == [100]
+            assert _count(1, transactions_table) == 1
+            assert _count(2, transactions_table) == 0
+            assert _count(0, transactions_table) == primary_transactions
+
+            # Change log does not move so clients must synchronize again.
+            response = client.get("/sync", params={"since": cursor}, headers=headers)
+            assert response.status_code == 410
+
+            response = client.get("/sync/cursor", headers=headers)
+            assert response.status_code == 200
+            cursor = response.json()["sequence"]
+
+            response = client.post(url, json={"amount": 50}, headers=headers)
+            assert response.status_code == 200
+
+            response = client.get("/sync", params={"since": cursor}, headers=headers)
+            assert response.status_code == 200
+            assert [c["data"]["amount"] for c in response.json()["changes"]] == [50]
+
+            response = client.delete("/user", headers=headers)
+            assert response.status_code == 204
+            assert _count(1, transactions_table) == 0
+            assert _count(1, models.User._meta.db_table) == 0
+        finally:
+            client.portal.call(shards.close)
@@ -0,0 +1,132 @@
+# Copyright (C) Izhar Ahmad 2025-2026 - under the MIT license
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from tortoise import connections
+from tests.commons import make_headers, RouterTestState
+from core.writer import WriteCoordinator
+from core.schemas import User
+from core import models
+from app import app
+
+import asyncio
+import pytest
+
+@pytest.fixture(scope="module")
+def state():
+    with TestClient(app) as client:
+        response = client.post(
+            "/user",
+            json={
+                "username": "tester-writer",
+                "password": "123456789",
+            }
+        )
+        assert response.status_code == 200
+
+        state = RouterTestState(client, User(**response.json()))
+        assert state.user is not None
+
+        response = client.post("/accounts", json={"name": "Batched writes"}, headers=make_headers(state.user))
+        assert response.status_code == 200
+        state.baton["account"] = response.json()
+
+        yield state
+
+
+def test_write_coordinator(state: RouterTestState):
+    assert state.user is not None
+    account_id = state.baton["account"]["id"]
+    user_id = state.user.id
+    commits = 0
+
+    async def run() -> list[object]:
+        nonlocal commits
+
+        writer = WriteCoordinator(max_size=10, max_delay=0.05)
+        original_commit = writer._commit
+
+        async def counting_commit(jobs):
+            nonlocal commits
+            commits += 1
+            await original_commit(jobs)
+
+        writer._commit = counting_commit  # type: ignore
+        writer.start()
+
+        def make_write(amount: int):
+            async def write(conn):
+                transaction = models.Transaction(account_id=account_id, user_id=user_id, amount=amount)
+                await transaction.save(using_db=conn)
+                if amount < 0:
+                    raise ValueError("negative amount")
+                return transaction.id
+            return write
+
+        try:
+            return await asyncio.gather(
+                *(writer.submit(make_write(amount)) for amount in (1, 2, -3, 4)),
+                return_exceptions=True,
+            )
+        finally:
+            await writer.stop()
+
+    results = state.client.portal.call(run)
+
+    assert commits == 1
+    assert isinstance(results[2], ValueError)
+
+    # The failing write is rolled back without affecting others.
+    amounts = state.client.portal.call(
+        lambda: models.Transaction.filter(account_id=account_id).values_list("amount", flat=True)
+    )
+    assert sorted(amounts) == [1, 2, 4]  # type: ignore
+
+def test_write_coordinator_shards():
+    async def run() -> tuple[list[list[object]], list[object]]:
+        writer = WriteCoordinator(max_size=10, max_delay=0.05)
+        shards = [object(), object()]
+        commits: list[list[object]] = []
+
+        async def recording_commit(jobs):
+            commits.append([job.client for job in jobs])
+            for job in jobs:
+                job.future.set_result(None)
+
+        writer._commit = recording_commit  # type: ignore
+        writer.start()
+
+        async def submit(shard: object) -> None:
+            # Routes the write to the shard as DatabaseClient.route() does.
+            connections.set("default", shard)  # type: ignore
+            await writer.submit(lambda conn: asyncio.sleep(0))
+
+        try:
+            # The writes of two shards are submitted interleaved.
+            await asyncio.gather(*(asyncio.create_task(submit(shard)) for shard in shards * 2))
+        finally:
+            await writer.stop()
+
+        return commits, shards
+
+    commits, shards = asyncio.run(run())
+    assert commits == [[shards[0]] * 2, [shards[1]] * 2]
+
+def test_log_transaction_batched(state: RouterTestState):
+    assert state.user is not None
+
+    url = "/accounts/{account_id}/transactions".format(account_id=state.baton["account"]["id"])
+    writer = app.state.writer
+    state.client.portal.call(writer.start)
+
+    try:
+        response = state.client.post(url, json={"amount": 10}, headers=make_headers(state.user))
+        assert response.status_code == 200
+        transaction = response.json()
+    finally:
+        state.client.portal.call(writer.stop)
+
+    response = state.client.get(url + "/" + transaction["id"], headers=make_headers(state.user))
+    assert response.status_code == 200
+    assert response.json() == transaction